@@ -0,0 +1,78 @@
+"""
+지역코드(행정표준코드) 색인
+- data/area_codes.json을 import 시점에 한 번만 읽어 불변 색인을 만든다
+- 코드 -> 지역명 O(1) 조회, 시도별 하위 코드 조회, 지역명 -> 코드 역조회
+"""
+import os
+import json
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+AREA_CODES_PATH = os.path.join(REPO_ROOT, "data", "area_codes.json")
+
+
+def _build_index(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    sido: Dict[str, str] = data["sido"]
+    names: Dict[str, str] = {}
+    children: Dict[str, list] = {code: [] for code in sido}
+
+    for code, name in sido.items():
+        names[code] = name
+        names[f"{code}000"] = name  # "45000" 같은 시도 대표 코드
+
+    for code, name in data["sigungu"].items():
+        sido_name = sido[code[:2]]
+        # 세종특별자치시처럼 시군구가 없는 시도는 시도명만 사용
+        names[code] = f"{sido_name} {name}" if name else sido_name
+        children[code[:2]].append(code)
+
+    # 역조회: 전체 이름과 시도명은 그대로, 시군구 단독 이름은 전국에서 유일할 때만 등록.
+    # 같은 이름이 여러 코드에 있으면(강원 42/51 등) 나중에 생긴(큰) 코드를 우선한다.
+    reverse: Dict[str, str] = {}
+    short_names: Dict[str, set] = {}
+    for code in sorted(names, key=lambda c: (len(c), c)):
+        if len(code) == 5 and code.endswith("000"):
+            continue
+        reverse[names[code]] = code
+        short = data["sigungu"].get(code)
+        if short:
+            short_names.setdefault(short, set()).add(names[code])
+    for short, full_names in short_names.items():
+        if len(full_names) == 1 and short not in reverse:
+            reverse[short] = reverse[next(iter(full_names))]
+
+    return (
+        MappingProxyType(names),
+        MappingProxyType({code: tuple(sorted(codes)) for code, codes in children.items()}),
+        MappingProxyType(reverse),
+    )
+
+
+AREA_NAMES, SIDO_CHILDREN, AREA_CODES_BY_NAME = _build_index(AREA_CODES_PATH)
+
+
+def area_name(code: Optional[str]) -> str:
+    """지역코드를 지역명으로 변환 (시군구 코드가 없으면 시도명, 알 수 없으면 빈 문자열)"""
+    if not code:
+        return ""
+    code = code.strip()
+    name = AREA_NAMES.get(code[:5]) if len(code) >= 5 else AREA_NAMES.get(code)
+    if name:
+        return name
+    return AREA_NAMES.get(code[:2], "") if len(code) >= 5 else ""
+
+
+def sigungu_codes(sido_code: str) -> Tuple[str, ...]:
+    """시도 코드(앞 2자리)에 속한 시군구 코드 목록"""
+    return SIDO_CHILDREN.get(sido_code[:2], ())
+
+
+def area_code(name: Optional[str]) -> Optional[str]:
+    """지역명("전라북도 군산시", "군산시", "경기도")을 지역코드로 역조회"""
+    if not name:
+        return None
+    return AREA_CODES_BY_NAME.get(" ".join(name.split()))
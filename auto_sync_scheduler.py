@@ -8,8 +8,18 @@ import json
 import firebase_admin
 from firebase_admin import credentials, firestore
 from datetime import datetime, timedelta
-from naraiteo_api import APIConnectionError, NaraiteoAPI
-import time
+from naraiteo_api import JOB_CATEGORIES, APIConnectionError, NaraiteoAPI
+from job_index import load_job_index
+from response_cache import ResponseCache
+from sync_engine import SyncConfig, SyncEngine
+
+# 5분 주기 실행이 겹치지 않도록 한 번의 동기화에 쓸 시간(초). 0이면 제한 없음
+SYNC_TIME_BUDGET_SECONDS = int(os.getenv("SYNC_TIME_BUDGET_SECONDS", 240))
+# 동시에 수집할 기관 유형 (쉼표 구분, naraiteo_api.JOB_CATEGORIES 키). 알 수 없는 값은 무시
+SYNC_CATEGORIES = tuple(
+    key for key in (part.strip() for part in os.getenv("SYNC_CATEGORIES", ",".join(JOB_CATEGORIES)).split(","))
+    if key in JOB_CATEGORIES
+) or tuple(JOB_CATEGORIES)
 
 def initialize_firebase():
     """Firebase 초기화"""
@@ -21,16 +31,8 @@ def initialize_firebase():
     return firestore.client()
 
 def get_existing_job_ids(db):
-    """Firebase에서 기존 게시글 ID 목록 조회"""
-    try:
-        docs = db.collection('jobs').stream()
-        existing_ids = set()
-        for doc in docs:
-            existing_ids.add(doc.id)
-        return existing_ids
-    except Exception as e:
-        print(f"[ERROR] 기존 게시글 ID 조회 오류: {e}")
-        return set()
+    """Firebase에서 기존 게시글 ID 목록 조회 (전체 문서 대신 ID 색인 사용)"""
+    return load_job_index(db).id_set()
 
 def parse_date_string(date_str):
     """날짜 문자열을 datetime 객체로 변환"""
@@ -84,99 +86,64 @@ def is_job_within_30day_criteria(job_data, today, cutoff_date):
     except Exception as e:
         return False, f"날짜 파싱 오류: {e}"
 
-def collect_jobs_with_30day_filter(api, today):
+def build_job_document(item, now):
+    """V1-4 방식 저장 문서: 목록 정보 + 상세 정보 + 첨부파일 + 채용직급"""
+    # 데이터 병합 (덮어쓰기 방지)
+    basic_info = {**item['basic_info'], **item['detail_info']}
+    files = item['files']
+    basic_info['files'] = files or []
+
+    # 채용직급 정보 (V1-4 핵심 추가 기능)
+    position = item['position']
+    if position is False:
+        print("        채용직급: 조회 생략 (getItemPosition 차단)")
+    elif position and position.get('full_grade'):
+        basic_info['grade'] = position['full_grade']  # "간호서기 4명" 형태
+    else:
+        basic_info['grade'] = '채용직급 정보 없음'
+
+    # 선택 보강이 생략된 경우 부분 데이터로 표시해 이후 재보강 대상을 구분
+    fully_enriched = files is not None and position is not False
+
+    save_data = {
+        **basic_info,
+        'updated_at': now,
+        'collection_reason': item['reason'],  # 수집 이유 기록
+        'data_completeness': 'full_4api' if fully_enriched else 'partial'
+    }
+    # 수정된 기존 게시글은 created_at을 유지하도록 병합
+    if item['is_update']:
+        return save_data, True
+    return {**save_data, 'created_at': now}, False
+
+SYNC_CONFIG = SyncConfig(
+    name="AUTO SYNC",
+    criteria=is_job_within_30day_criteria,
+    build_document=build_job_document,
+    max_pages=2,  # 최대 2페이지까지만 확인 (200개) - 5분 내 처리 가능
+    incremental=True,
+    fetch_files=True,
+    fetch_position=True,
+    categories=SYNC_CATEGORIES,  # 카테고리별 목록을 동시에 읽으므로 실행 시간은 늘지 않는다
+)
+
+# 장애 복구용 전체 백필: 모든 getList 페이지를 병렬로 읽고, 체크포인트로 여러 실행에 걸쳐 이어서 진행
+BACKFILL_CONFIG = SyncConfig(**{
+    **vars(SYNC_CONFIG),
+    'name': "BACKFILL",
+    'incremental': False,
+    'backfill': True,
+    'checkpoint': "sync_checkpoint_backfill",
+})
+
+def sync_new_jobs(incremental=True, time_budget=SYNC_TIME_BUDGET_SECONDS, backfill=False):
+    """신규 게시글만 동기화 (incremental=True면 워터마크 기반 증분 모드)
+
+    time_budget(초)을 넘기기 전에 새 상세 조회를 멈추고 남은 공고는 다음 실행으로 넘긴다.
+    backfill=True면 전체 페이지를 읽으며, 중단돼도 다음 실행이 끝낸 페이지 다음부터 이어서 진행한다.
     """
-    30일 기준 필터링을 적용하여 게시글 수집
-    최적화: 중복 체크를 먼저 하여 API 호출 최소화
-    """
-    collected_jobs = []
-    page_no = 1
-    max_pages = 2  # 최대 2페이지까지만 확인 (200개) - 5분 내 처리 가능
-    cutoff_date = today - timedelta(days=30)  # 30일 전
-
-    print(f"[FILTER] 수집 기준:")
-    print(f"   - 기준일: {today.strftime('%Y-%m-%d')}")
-    print(f"   - 30일 전: {cutoff_date.strftime('%Y-%m-%d')}")
-    print(f"   - 등록일 30일 이내 OR 마감일 미도과 게시글 수집")
-    print(f"   - 최대 {max_pages}페이지 확인 (약 {max_pages*100}개)")
-
-    # Firebase에서 기존 ID 가져오기 (중복 체크용)
-    from firebase_admin import firestore
-    db = firestore.client()
-    existing_ids = get_existing_job_ids(db)
-    print(f"[CACHE] 기존 게시글 {len(existing_ids)}개 캐시 완료")
-
-    total_skipped = 0  # 중복으로 건너뛴 수
-
-    while page_no <= max_pages:
-        print(f"\n[API] 페이지 {page_no}/{max_pages} 조회 중...")
-
-        # 한 페이지당 100개씩 조회
-        jobs = api.get_job_list(page_no=page_no, num_of_rows=100)
-
-        if not jobs:
-            print(f"   페이지 {page_no}: 게시글 없음, 수집 종료")
-            break
-
-        print(f"   페이지 {page_no}: {len(jobs)}개 게시글 확인")
-
-        page_collected = 0
-        page_filtered = 0
-        page_skipped = 0
-
-        for i, job in enumerate(jobs, 1):
-            job_idx = job['idx']
-
-            # 중복 체크 먼저 수행 (API 호출 전!)
-            if job_idx in existing_ids:
-                page_skipped += 1
-                total_skipped += 1
-                if i % 10 == 0:  # 10개마다 진행상황 출력
-                    print(f"     진행: {i}/{len(jobs)} (수집: {page_collected}, 중복제외: {page_skipped})")
-                continue
-
-            # 신규 게시글만 상세 정보 조회
-            detail = api.get_job_detail(job_idx)
-            if not detail:
-                page_filtered += 1
-                continue
-
-            # 필터링 기준 적용
-            is_valid, reason = is_job_within_30day_criteria(detail, today, cutoff_date)
-
-            if is_valid:
-                collected_jobs.append({
-                    'basic_info': job,
-                    'detail_info': detail,
-                    'reason': reason
-                })
-                page_collected += 1
-                print(f"     [NEW] {job['title'][:30]}... ({reason})")
-            else:
-                page_filtered += 1
-
-            # API 호출 간격 (Rate Limiting)
-            time.sleep(0.3)
-
-        print(f"   페이지 {page_no} 결과: 수집 {page_collected}개, 중복제외 {page_skipped}개, 필터제외 {page_filtered}개")
-
-        # 조기 종료 조건: 대부분 중복이면 다음 페이지도 중복일 가능성 높음
-        if page_skipped > 80:  # 80% 이상이 중복이면
-            print(f"   [EARLY EXIT] 중복률 {page_skipped}% - 추가 페이지 스킵")
-            break
-
-        # 다음 페이지로
-        page_no += 1
-        time.sleep(0.5)  # 페이지 간 간격
-
-    print(f"\n[RESULT] 전체 수집된 게시글: {len(collected_jobs)}개")
-    print(f"[RESULT] 중복으로 건너뛴 게시글: {total_skipped}개")
-    return collected_jobs
-
-def sync_new_jobs():
-    """신규 게시글만 동기화"""
     print("=" * 70)
-    print("[AUTO SYNC] 30일 기준 필터링 자동 동기화 시작")
+    print(f"[AUTO SYNC] 30일 기준 필터링 {'전체 백필' if backfill else '자동 동기화'} 시작")
     print(f"[TIME] 실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 70)
 
@@ -184,73 +151,16 @@ def sync_new_jobs():
         # Firebase 초기화
         db = initialize_firebase()
 
-        # 나라일터 API 초기화
-        api = NaraiteoAPI()
-
-        # 현재 날짜
-        today = datetime.now()
-
-        # 30일 기준 필터링으로 게시글 수집 (중복 체크 포함)
-        print("[API] 30일 기준 필터링 게시글 수집...")
-        collected_jobs = collect_jobs_with_30day_filter(api, today)
-        
-        if not collected_jobs:
-            print("[OK] 신규 게시글이 없습니다.")
-            return
-
-        # 이미 중복 체크된 신규 게시글만 있음
-        print(f"[NEW] 신규 게시글: {len(collected_jobs)}개")
-
-        # 신규 게시글 완전 데이터 수집 및 Firebase 저장 (V1-4 방식 적용)
-        saved_count = 0
-        for i, job_data in enumerate(collected_jobs, 1):
-            try:
-                basic_info = job_data['basic_info'].copy()  # 복사본 생성
-                detail_info = job_data['detail_info']
-                reason = job_data['reason']
-                
-                print(f"   [{i}/{len(collected_jobs)}] {basic_info['title'][:50]}... ({reason})")
-                
-                # V1-4 방식: 데이터 병합 (덮어쓰기 방지)
-                basic_info.update(detail_info)
-                
-                # 3단계: 첨부파일 정보 조회 (기존 유지)
-                files = api.get_job_files(basic_info['idx'])
-                basic_info['files'] = files
-                time.sleep(0.3)
-
-                # 4단계: 채용직급 정보 조회 (V1-4 핵심 추가 기능)
-                position = api.get_job_position(basic_info['idx'])
-                if position and position.get('full_grade'):
-                    basic_info['grade'] = position['full_grade']  # "간호서기 4명" 형태
-                    print(f"        채용직급: {position['full_grade']}")
-                else:
-                    basic_info['grade'] = '채용직급 정보 없음'
-                    print(f"        채용직급: 정보 없음")
-                time.sleep(0.3)
-                
-                # Firebase 저장 데이터 구성
-                save_data = {
-                    **basic_info,
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now(),
-                    'collection_reason': reason,  # 수집 이유 기록
-                    'data_completeness': 'full_4api'  # 완전 데이터 표시
-                }
-                
-                # Firebase에 저장
-                db.collection('jobs').document(basic_info['idx']).set(save_data)
-                saved_count += 1
-                
-                # API 호출 간격 (Rate Limiting)
-                time.sleep(0.5)
-                
-            except Exception as e:
-                print(f"   [ERROR] 게시글 {basic_info['idx']} 처리 오류: {e}")
-                continue
-        
-        print(f"[SUCCESS] 신규 게시글 {saved_count}개 저장 완료")
-        
+        # 나라일터 API 초기화 (실행 전체에서 하나의 연결 풀과 응답 캐시 공유)
+        with NaraiteoAPI(cache=ResponseCache()) as api:
+            if backfill:
+                config = SyncConfig(**{**vars(BACKFILL_CONFIG), 'time_budget': time_budget or None})
+            else:
+                config = SyncConfig(**{**vars(SYNC_CONFIG), 'incremental': incremental,
+                                        'time_budget': time_budget or None})
+            # 목록 -> 필터 -> 상세 -> 첨부파일/채용직급 -> 일괄 저장 파이프라인 실행
+            SyncEngine(db, api, config, today=datetime.now()).run()
+            
     except APIConnectionError:
         raise
     except Exception as e:
@@ -260,10 +170,10 @@ def sync_new_jobs():
 def main():
     """메인 함수"""
     try:
-        sync_new_jobs()
+        sync_new_jobs(backfill="--backfill" in sys.argv[1:])
         print("[COMPLETE] 30일 기준 필터링 자동 동기화 완료")
     except APIConnectionError as exc:
-        message = f"나라일터 API 연결 실패 ({exc.attempts}/{exc.attempts}). 기존 데이터는 유지하며 다음 예약 실행에서 다시 시도합니다."
+        message = f"나라일터 API 연결 실패 ({exc.attempts}/{exc.attempts}). 기존 데이터는 유지하며 읽은 게시글은 체크포인트에 남겨 다음 예약 실행에서 이어서 처리합니다."
         print(f"[CONNECTION FAILED] {message}")
         print(f"::notice title=나라일터 API 연결 실패::{message}")
         summary_path = os.getenv("GITHUB_STEP_SUMMARY")
@@ -273,7 +183,7 @@ def main():
                 summary.write("| 항목 | 결과 |\n|---|---|\n")
                 summary.write(f"| 상태 | 연결 실패 ({exc.attempts}/{exc.attempts}) |\n")
                 summary.write("| Firestore | 기존 데이터 유지 |\n")
-                summary.write("| 다음 동작 | 다음 예약 실행에서 재시도 |\n")
+                summary.write("| 다음 동작 | 다음 예약 실행에서 체크포인트부터 재개 |\n")
     except Exception as exc:
         print(f"[FATAL] 치명적 오류: {exc}")
         sys.exit(1)
@@ -8,8 +8,10 @@ import json
 import firebase_admin
 from firebase_admin import credentials, firestore
 from datetime import datetime, timedelta
+from job_index import load_job_index
 from naraiteo_api import NaraiteoAPI
-import time
+from response_cache import ResponseCache
+from sync_engine import SyncConfig, SyncEngine
 
 def initialize_firebase():
     """Firebase 초기화"""
@@ -50,8 +52,8 @@ def is_job_within_criteria(job_data, today, cutoff_date):
     - 그외: 수집 안함
     """
     try:
-        # 등록 시작일 파싱
-        reg_start_date = parse_date_string(job_data.get('reg_start_date'))
+        # 등록 시작일 파싱 (상세/목록 응답은 reg_date, reg_end_date 대신 end_date를 사용)
+        reg_start_date = parse_date_string(job_data.get('reg_start_date') or job_data.get('reg_date'))
         if not reg_start_date:
             # 등록일이 없으면 안전하게 수집하지 않음
             return False, "등록일 정보 없음"
@@ -61,7 +63,7 @@ def is_job_within_criteria(job_data, today, cutoff_date):
             return True, f"등록일 30일 이내 ({reg_start_date.strftime('%Y-%m-%d')})"
         
         # 등록일이 30일 이상 지난 경우, 마감일 확인
-        reg_end_date = parse_date_string(job_data.get('reg_end_date'))
+        reg_end_date = parse_date_string(job_data.get('reg_end_date') or job_data.get('end_date'))
         if reg_end_date and reg_end_date >= today:
             return True, f"마감일 미도과 ({reg_end_date.strftime('%Y-%m-%d')})"
         
@@ -73,76 +75,29 @@ def is_job_within_criteria(job_data, today, cutoff_date):
         return False, f"날짜 파싱 오류: {e}"
 
 def get_existing_job_ids(db):
-    """Firebase에서 기존 게시글 ID 목록 조회"""
-    try:
-        docs = db.collection('jobs').stream()
-        existing_ids = set()
-        for doc in docs:
-            existing_ids.add(doc.id)
-        return existing_ids
-    except Exception as e:
-        print(f"[ERROR] 기존 게시글 ID 조회 오류: {e}")
-        return set()
+    """Firebase에서 기존 게시글 ID 목록 조회 (전체 문서 대신 ID 색인 사용)"""
+    return load_job_index(db).id_set()
 
-def collect_jobs_with_filtering(api, today, cutoff_date):
-    """
-    30일 기준 필터링을 적용하여 게시글 수집
-    API 페이징을 통해 충분한 수의 게시글을 확인
-    """
-    collected_jobs = []
-    page_no = 1
-    max_pages = 3  # 최대 3페이지까지 확인 (300개) - 안정성을 위해 제한
-    
-    print(f"[FILTER] 수집 기준:")
-    print(f"   - 기준일: {today.strftime('%Y-%m-%d')}")
-    print(f"   - 30일 전: {cutoff_date.strftime('%Y-%m-%d')}")
-    print(f"   - 등록일 30일 이내 OR 마감일 미도과 게시글 수집")
-    
-    while page_no <= max_pages:
-        print(f"[API] 페이지 {page_no} 조회 중...")
-        
-        # 한 페이지당 100개씩 조회 (API 최대치)
-        jobs = api.get_job_list(page_no=page_no, num_of_rows=100)
-        
-        if not jobs:
-            print(f"   페이지 {page_no}: 게시글 없음, 수집 종료")
-            break
-        
-        print(f"   페이지 {page_no}: {len(jobs)}개 게시글 확인")
-        
-        page_collected = 0
-        page_filtered = 0
-        
-        for job in jobs:
-            # 각 게시글에 대해 상세 정보 조회 (등록일/마감일 정보 필요)
-            detail = api.get_job_detail(job['idx'])
-            if not detail:
-                continue
-            
-            # 필터링 기준 적용
-            is_valid, reason = is_job_within_criteria(detail, today, cutoff_date)
-            
-            if is_valid:
-                collected_jobs.append({
-                    'basic_info': job,
-                    'detail_info': detail,
-                    'reason': reason
-                })
-                page_collected += 1
-            else:
-                page_filtered += 1
-            
-            # API 호출 간격 (Rate Limiting)
-            time.sleep(0.3)
-        
-        print(f"   페이지 {page_no} 결과: 수집 {page_collected}개, 제외 {page_filtered}개")
-        
-        # 다음 페이지로
-        page_no += 1
-        time.sleep(0.5)  # 페이지 간 간격
-    
-    print(f"[RESULT] 전체 수집된 게시글: {len(collected_jobs)}개")
-    return collected_jobs
+def build_job_document(item, now):
+    """V2 저장 문서: 상세 정보 + 첨부파일 (신규 게시글만 저장)"""
+    return {
+        **item['detail_info'],
+        'files': item['files'],
+        'created_at': now,
+        'updated_at': now,
+        'collection_reason': item['reason']  # 수집 이유 기록
+    }, False
+
+SYNC_CONFIG = SyncConfig(
+    name="AUTO SYNC V2",
+    criteria=is_job_within_criteria,
+    build_document=build_job_document,
+    max_pages=3,  # 최대 3페이지까지 확인 (300개) - 안정성을 위해 제한
+    incremental=False,
+    fetch_files=True,
+    fetch_position=False,
+    files_default=[],
+)
 
 def sync_filtered_jobs():
     """30일 기준 필터링을 적용한 게시글 동기화"""
@@ -155,74 +110,13 @@ def sync_filtered_jobs():
         # Firebase 초기화
         db = initialize_firebase()
         
-        # 기존 게시글 ID 목록 가져오기
-        print("[INFO] 기존 게시글 ID 목록 조회...")
-        existing_ids = get_existing_job_ids(db)
-        print(f"   기존 게시글: {len(existing_ids)}개")
-        
-        # 나라일터 API 초기화
-        api = NaraiteoAPI()
-        
-        # 날짜 기준 설정
-        today = datetime.now()
-        cutoff_date = today - timedelta(days=30)  # 30일 전
-        
-        # 30일 기준 필터링으로 게시글 수집
-        print("[COLLECT] 30일 기준 필터링 게시글 수집...")
-        collected_jobs = collect_jobs_with_filtering(api, today, cutoff_date)
-        
-        if not collected_jobs:
-            print("[OK] 수집 기준에 맞는 게시글이 없습니다.")
-            return
-        
-        # 신규 게시글 필터링 (기존 DB와 비교)
-        new_jobs = []
-        for job_data in collected_jobs:
-            job_idx = job_data['basic_info']['idx']
-            if job_idx not in existing_ids:
-                new_jobs.append(job_data)
-        
-        print(f"[NEW] 신규 게시글: {len(new_jobs)}개 (전체 수집: {len(collected_jobs)}개)")
-        
-        if not new_jobs:
-            print("[OK] 신규 게시글이 없습니다. 현행 유지")
-            return
-        
-        # 신규 게시글 Firebase 저장
-        saved_count = 0
-        for i, job_data in enumerate(new_jobs, 1):
-            try:
-                basic_info = job_data['basic_info']
-                detail_info = job_data['detail_info']
-                reason = job_data['reason']
-                
-                print(f"   [{i}/{len(new_jobs)}] {basic_info['title'][:50]}... ({reason})")
-                
-                # 첨부파일 정보 조회
-                files = api.get_job_files(basic_info['idx'])
-                
-                # Firebase 저장 데이터 구성
-                save_data = {
-                    **detail_info,
-                    'files': files,
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now(),
-                    'collection_reason': reason  # 수집 이유 기록
-                }
-                
-                # Firebase에 저장
-                db.collection('jobs').document(basic_info['idx']).set(save_data)
-                saved_count += 1
-                
-                # API 호출 간격 (Rate Limiting)
-                time.sleep(0.5)
-                
-            except Exception as e:
-                print(f"   [ERROR] 게시글 {basic_info['idx']} 처리 오류: {e}")
-                continue
-        
-        print(f"[SUCCESS] 신규 게시글 {saved_count}개 저장 완료")
-        
+        # 나라일터 API 초기화 (실행 전체에서 하나의 연결 풀과 응답 캐시 공유)
+        with NaraiteoAPI(cache=ResponseCache()) as api:
+            # 목록 -> 필터 -> 상세 -> 첨부파일 -> 일괄 저장 파이프라인 실행
+            result = SyncEngine(db, api, SYNC_CONFIG, today=datetime.now()).run()
+            if not result.written:
+                print("[OK] 신규 게시글이 없습니다. 현행 유지")
+            
     except Exception as e:
         print(f"[ERROR] 전체 동기화 오류: {e}")
         sys.exit(1)
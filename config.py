@@ -26,6 +26,11 @@ DEFAULT_JOBS_PER_PAGE = int(os.getenv("DEFAULT_JOBS_PER_PAGE", 20))
 MAX_JOBS_PER_REQUEST = int(os.getenv("MAX_JOBS_PER_REQUEST", 100))
 API_REQUEST_TIMEOUT = int(os.getenv("API_REQUEST_TIMEOUT", 15))
 
+# API 서버 캐시 설정
+JOB_CACHE_SOURCE = os.getenv("JOB_CACHE_SOURCE", "auto")  # auto(Firestore 우선) | firestore | snapshot
+JOB_CACHE_REFRESH_SECONDS = int(os.getenv("JOB_CACHE_REFRESH_SECONDS", 60))
+API_CACHE_MAX_AGE = int(os.getenv("API_CACHE_MAX_AGE", 60))
+
 # CORS 설정
 ALLOWED_ORIGINS_STRING = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000,http://localhost:5173,http://127.0.0.1:8001,*")
 ALLOWED_ORIGINS = [origin.strip() for origin in ALLOWED_ORIGINS_STRING.split(",")]
\ No newline at end of file
@@ -10,8 +10,11 @@ import firebase_admin
 from firebase_admin import credentials, firestore
 from datetime import datetime, timedelta
 import pytz
-import time
 import re
+import argparse
+from firestore_writer import BatchWriter
+from job_index import load_job_index, save_job_index
+from rejected_jobs import load_rejected_jobs, save_rejected_jobs
 
 def initialize_firebase():
     """Firebase 초기화"""
@@ -68,8 +71,88 @@ def get_seoul_time():
     seoul_tz = pytz.timezone('Asia/Seoul')
     return datetime.now(seoul_tz).replace(tzinfo=None)
 
-def cleanup_old_jobs():
-    """30일 지난 게시글 정리 (서울시각 기준)"""
+def _candidate(doc_id, data, reg_date):
+    """삭제 대상 요약 (보고용)"""
+    return {
+        'id': doc_id,
+        'title': clean_control_characters(data.get('title', ''))[:50],
+        'reg_date': reg_date.strftime('%Y-%m-%d') if reg_date else 'N/A',
+        'company': clean_control_characters(data.get('company', ''))[:30],
+        'mod_date': data.get('mod_date') or '',
+        'end_date': data.get('end_date') or ''
+    }
+
+def find_expired_jobs(db, cutoff_date):
+    """reg_date 범위 쿼리로 삭제 대상만 조회 (보고에 필요한 필드만 projection)
+
+    reg_date는 'YYYYMMDD' 문자열로 저장되므로 cutoff 이하 문자열 범위로 조회한다.
+    'YYYY-MM-DD', 'YYYY.MM.DD' 형식의 예전 문서도 문자열 비교상 범위에 포함되므로
+    조회된 문서는 다시 날짜로 파싱해 실제 만료 여부를 확인한다.
+    """
+    query = (db.collection('jobs')
+             .where('reg_date', '<=', cutoff_date.strftime('%Y%m%d'))
+             .select(['reg_date', 'end_date', 'title', 'company', 'mod_date']))
+    scanned_count = 0
+    candidates = []
+    for doc in query.stream():
+        scanned_count += 1
+        data = doc.to_dict() or {}
+        reg_date = parse_date_string(data.get('reg_date'))
+        if reg_date and reg_date.date() <= cutoff_date:
+            candidates.append(_candidate(doc.id, data, reg_date))
+    return candidates, scanned_count
+
+def scan_expired_jobs(db, cutoff_date):
+    """전체 게시글을 훑어 삭제 대상 조회 (reg_date 형식이 섞인 경우 점검용)"""
+    total_count = 0
+    preserved_count = 0
+    candidates = []
+    for doc in db.collection('jobs').select(['reg_date', 'end_date', 'title', 'company', 'mod_date']).stream():
+        try:
+            total_count += 1
+            data = doc.to_dict() or {}
+            reg_date = parse_date_string(data.get('reg_date'))
+
+            # 등록일이 30일 이상 지났는지 확인
+            if reg_date and reg_date.date() <= cutoff_date:
+                candidates.append(_candidate(doc.id, data, reg_date))
+            else:
+                # 30일이 안 지난 게시글은 현행유지
+                preserved_count += 1
+        except Exception as e:
+            print(f"[WARNING] 문서 처리 오류 (ID: {doc.id}): {e}")
+            continue
+    return candidates, total_count, preserved_count
+
+def delete_jobs(db, candidates):
+    """삭제 대상을 일괄 삭제하고 실제 삭제된 ID 목록 반환"""
+    deleted_ids = []
+    with BatchWriter(db) as writer:
+        for job in candidates:
+            def on_deleted(job=job):
+                deleted_ids.append(job['id'])
+                print(f"   [DELETE] {job['title']} | {job['company']} | 등록일: {job['reg_date']}")
+            writer.delete(job['id'], on_success=on_deleted)
+    return deleted_ids
+
+def print_dry_run_report(candidates):
+    """삭제 예정 게시글 보고 (실제 삭제하지 않음)"""
+    print("\n[DRY RUN] 삭제 예정 게시글 (실제 삭제하지 않음)")
+    for job in sorted(candidates, key=lambda job: job['reg_date']):
+        print(f"   [예정] {job['id']} | {job['title']} | {job['company']} | 등록일: {job['reg_date']}")
+    by_date = {}
+    for job in candidates:
+        by_date[job['reg_date']] = by_date.get(job['reg_date'], 0) + 1
+    for reg_date, count in sorted(by_date.items()):
+        print(f"   등록일 {reg_date}: {count}개")
+    print(f"[DRY RUN] 삭제 예정 {len(candidates)}개")
+
+def cleanup_old_jobs(dry_run=False, full_scan=False):
+    """30일 지난 게시글 정리 (서울시각 기준)
+
+    기본은 reg_date 범위 쿼리로 만료 게시글만 조회하므로 비용이 만료 건수에 비례한다.
+    full_scan=True면 예전처럼 전체 게시글을 확인하고, dry_run=True면 삭제 없이 보고만 한다.
+    """
     print("=" * 70)
     print("Firebase 데이터 정리 시작 (서울시각 기준)")
 
@@ -89,71 +172,47 @@ def cleanup_old_jobs():
         print(f"기준일 (서울시각): {today.strftime('%Y-%m-%d')}")
         print(f"삭제 대상: {cutoff_date.strftime('%Y-%m-%d')} 이전 등록 게시글")
 
-        # 모든 게시글 조회
-        print("모든 게시글 조회 중...")
-        docs = db.collection('jobs').stream()
-        
-        total_count = 0
-        candidates_for_deletion = []
-        preserved_count = 0
-        
-        for doc in docs:
-            try:
-                total_count += 1
-                data = doc.to_dict()
-                doc_id = doc.id
-
-                # 제어 문자 제거
-                if 'title' in data:
-                    data['title'] = clean_control_characters(data['title'])
-                if 'company' in data:
-                    data['company'] = clean_control_characters(data['company'])
-
-                # 등록일 확인
-                reg_date = parse_date_string(data.get('reg_date'))
-
-                # 등록일이 30일 이상 지났는지 확인
-                if reg_date and reg_date.date() <= cutoff_date:
-                    # 삭제 대상
-                    candidates_for_deletion.append({
-                        'id': doc_id,
-                        'title': data.get('title', '')[:50],
-                        'reg_date': reg_date.strftime('%Y-%m-%d') if reg_date else 'N/A',
-                        'company': data.get('company', '')[:30]
-                    })
-                else:
-                    # 30일이 안 지난 게시글은 현행유지
-                    preserved_count += 1
-
-            except Exception as e:
-                print(f"[WARNING] 문서 처리 오류 (ID: {doc.id}): {e}")
-                continue
-        
-        print(f"전체 게시글: {total_count}개")
-        print(f"삭제 대상 (30일 초과): {len(candidates_for_deletion)}개")
-        print(f"현행유지 (30일 이내): {preserved_count}개")
-        
-        # 삭제 실행
-        deleted_count = 0
-        if candidates_for_deletion:
-            print("\n30일 지난 게시글 삭제 실행 중...")
-
-            for job in candidates_for_deletion:
-                try:
-                    db.collection('jobs').document(job['id']).delete()
-                    deleted_count += 1
-                    print(f"   [DELETE] {job['title']} | {job['company']} | 등록일: {job['reg_date']}")
+        if full_scan:
+            print("모든 게시글 조회 중...")
+            candidates_for_deletion, total_count, preserved_count = scan_expired_jobs(db, cutoff_date)
+            print(f"전체 게시글: {total_count}개")
+            print(f"삭제 대상 (30일 초과): {len(candidates_for_deletion)}개")
+            print(f"현행유지 (30일 이내): {preserved_count}개")
+        else:
+            print("등록일 범위 쿼리로 만료 게시글 조회 중...")
+            candidates_for_deletion, scanned_count = find_expired_jobs(db, cutoff_date)
+            print(f"조회된 게시글: {scanned_count}개")
+            print(f"삭제 대상 (30일 초과): {len(candidates_for_deletion)}개")
 
-                    # 삭제 간격 (Rate Limiting)
-                    time.sleep(0.1)
+        if dry_run:
+            print_dry_run_report(candidates_for_deletion)
+            return
 
-                except Exception as e:
-                    print(f"   [ERROR] 삭제 실패 {job['id']}: {e}")
-                    continue
+        # 삭제 실행 (WriteBatch 일괄 삭제)
+        deleted_ids = []
+        if candidates_for_deletion:
+            print("\n30일 지난 게시글 삭제 실행 중...")
+            deleted_ids = delete_jobs(db, candidates_for_deletion)
         else:
             print("\n30일 지난 게시글이 없습니다. 모든 게시글이 현행유지됩니다.")
 
-        print(f"\n정리 완료: {deleted_count}개 삭제됨, {preserved_count}개 현행유지")
+        # 중복 체크용 ID 색인에서도 삭제한 게시글 제거 (다시 수집될 수 있도록)
+        if deleted_ids:
+            job_index = load_job_index(db)
+            job_index.remove(deleted_ids)
+            save_job_index(db, job_index)
+            # getList에 계속 나오는 삭제 공고를 동기화가 다시 상세 조회하지 않도록 제외 기록에 추가.
+            # 마감일이 남은 공고는 수집 기준(마감일 미도과)에 맞아 다시 수집되어야 하므로 기록하지 않는다
+            rejected = load_rejected_jobs(db)
+            deleted = set(deleted_ids)
+            for job in candidates_for_deletion:
+                end_date = parse_date_string(job['end_date'])
+                if job['id'] in deleted and end_date and end_date.date() < today:
+                    rejected.add({'idx': job['id'], 'mod_date': job['mod_date']}, today.strftime('%Y%m%d'), '데이터 정리')
+            save_rejected_jobs(db, rejected, today.strftime('%Y%m%d'))
+
+        failed_count = len(candidates_for_deletion) - len(deleted_ids)
+        print(f"\n정리 완료: {len(deleted_ids)}개 삭제됨" + (f", {failed_count}개 삭제 실패" if failed_count else ""))
 
     except Exception as e:
         print(f"[ERROR] 데이터 정리 오류: {e}")
@@ -172,7 +231,12 @@ def main():
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-        cleanup_old_jobs()
+        parser = argparse.ArgumentParser(description="30일 지난 게시글 정리")
+        parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 삭제 예정 게시글만 보고")
+        parser.add_argument("--full-scan", action="store_true", help="범위 쿼리 대신 전체 게시글 확인")
+        args = parser.parse_args()
+
+        cleanup_old_jobs(dry_run=args.dry_run, full_scan=args.full_scan)
         print("데이터 정리 작업 완료 (서울시각 기준)")
 
     except Exception as e:
@@ -0,0 +1,121 @@
+"""
+Firestore 일괄 쓰기 버퍼
+- 문서 저장/삭제를 모아 WriteBatch 한 번(최대 500건)으로 커밋해 문서마다 RPC를 보내지 않는다
+- 건수/요청 크기/경과 시간 중 하나가 기준을 넘으면 자동으로 flush
+  (쓰기가 뜸할 때는 호출 측이 flush_if_due()를 주기적으로 불러 경과 시간 기준을 확인한다)
+- 배치 커밋이 실패하면 해당 배치만 문서 단위로 다시 시도해 실패한 문서만 보고한다
+"""
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BATCH_MAX_OPERATIONS = 500  # Firestore WriteBatch 한도
+BATCH_MAX_BYTES = 9 * 1024 * 1024  # 요청 크기 한도(10MiB)보다 여유 있게
+BATCH_FLUSH_SECONDS = 10.0
+
+
+def _estimate_size(data: Dict[str, Any]) -> int:
+    """문서 크기 근사치 (요청 크기 한도 관리용)"""
+    return len(json.dumps(data, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+class BatchWriter:
+    """문서 저장/삭제 요청을 모아 WriteBatch로 커밋하는 버퍼
+
+    on_success 콜백은 해당 문서가 실제로 커밋된 뒤에만 호출되므로, 워터마크 전진처럼
+    "저장 완료"에 의존하는 후처리를 콜백으로 넘기면 된다.
+    """
+
+    def __init__(self, db, collection: str = "jobs",
+                 max_operations: int = BATCH_MAX_OPERATIONS,
+                 max_bytes: int = BATCH_MAX_BYTES,
+                 flush_seconds: Optional[float] = BATCH_FLUSH_SECONDS):
+        self.db = db
+        self.collection = collection
+        self.max_operations = min(max_operations, BATCH_MAX_OPERATIONS)
+        self.max_bytes = max_bytes
+        self.flush_seconds = flush_seconds
+        self.written = 0
+        self.failed: List[Tuple[str, Exception]] = []
+        self._pending: List[Tuple[str, Dict[str, Any], bool, Optional[Callable[[], None]]]] = []
+        self._pending_bytes = 0
+        self._first_pending_at: Optional[float] = None
+
+    def set(self, doc_id: str, data: Dict[str, Any], merge: bool = False,
+            on_success: Optional[Callable[[], None]] = None):
+        """문서 저장 예약. 기준을 넘으면 바로 flush한다."""
+        self._enqueue(str(doc_id), data, merge, on_success, _estimate_size(data))
+
+    def delete(self, doc_id: str, on_success: Optional[Callable[[], None]] = None):
+        """문서 삭제 예약"""
+        self._enqueue(str(doc_id), None, False, on_success, len(str(doc_id)))
+
+    def _enqueue(self, doc_id, data, merge, on_success, size):
+        if self._pending and self._pending_bytes + size > self.max_bytes:
+            self.flush()
+        if not self._pending:
+            self._first_pending_at = time.monotonic()
+        self._pending.append((doc_id, data, merge, on_success))
+        self._pending_bytes += size
+        if len(self._pending) >= self.max_operations or self._flush_due():
+            self.flush()
+
+    def _flush_due(self) -> bool:
+        return (self.flush_seconds is not None and self._first_pending_at is not None
+                and time.monotonic() - self._first_pending_at >= self.flush_seconds)
+
+    def flush_if_due(self) -> int:
+        """첫 대기 문서 이후 flush_seconds가 지났으면 커밋 (새 쓰기가 없을 때의 주기적 확인용)"""
+        if self._flush_due():
+            return self.flush()
+        return 0
+
+    def flush(self) -> int:
+        """대기 중인 문서를 커밋하고 성공 건수를 반환"""
+        pending, self._pending = self._pending, []
+        self._pending_bytes = 0
+        self._first_pending_at = None
+        if not pending:
+            return 0
+
+        collection = self.db.collection(self.collection)
+        try:
+            batch = self.db.batch()
+            for doc_id, data, merge, _ in pending:
+                if data is None:
+                    batch.delete(collection.document(doc_id))
+                else:
+                    batch.set(collection.document(doc_id), data, merge=merge)
+            batch.commit()
+            committed = pending
+            print(f"[BATCH] {len(pending)}건 일괄 커밋 완료")
+        except Exception as e:
+            # WriteBatch는 원자적이라 한 문서 때문에 전체가 실패하므로 문서 단위로 다시 시도
+            print(f"[BATCH] 일괄 커밋 실패, 문서 단위로 재시도 ({len(pending)}건): {e}")
+            committed = []
+            for entry in pending:
+                doc_id, data, merge, _ = entry
+                try:
+                    if data is None:
+                        collection.document(doc_id).delete()
+                    else:
+                        collection.document(doc_id).set(data, merge=merge)
+                    committed.append(entry)
+                except Exception as doc_error:
+                    self.failed.append((doc_id, doc_error))
+                    print(f"   [ERROR] 게시글 {doc_id} {'삭제' if data is None else '저장'} 실패: {doc_error}")
+
+        for _, _, _, on_success in committed:
+            if on_success:
+                on_success()
+        self.written += len(committed)
+        return len(committed)
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -2,7 +2,8 @@
 # -*- coding: utf-8 -*-
 """
 Firestore의 채용공고를 기반으로 크롤러가 읽을 수 있는 정적 상세 페이지(jobs/{idx}/index.html)와
-sitemap.xml을 생성한다. GitHub Actions에서 auto_sync_scheduler.py 실행 뒤 호출되어 결과물을 커밋한다.
+sitemap(sitemap.xml 인덱스 + sitemaps/ 샤드), index.html용 정적 JSON 데이터(jobs-data/)를 생성한다.
+GitHub Actions에서 auto_sync_scheduler.py 실행 뒤 호출되어 결과물을 커밋한다.
 
 jobs 컬렉션은 data_cleanup.py가 등록 30일 경과 문서를 완전히 삭제하는 방식으로 관리되므로,
 컬렉션에 남아있는 문서는 전부 "현재 유효한" 공고로 취급한다(공공기관 채용정보 포털과 달리
@@ -10,14 +11,22 @@ status 필드로 active를 걸러낼 필요가 없음).
 """
 
 import os
+import re
+import gzip
 import json
+import hashlib
+import argparse
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 from firebase_admin import firestore
 import firebase_admin
 
 from firebase_utils import load_firebase_credentials
+from job_stats import JobStats
+from naraiteo_api import DEFAULT_CATEGORY
+from search_index import build_search_index
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -25,7 +34,26 @@ logger = logging.getLogger(__name__)
 SITE_URL = "https://korea-jobportal.co.kr"
 REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
 JOBS_DIR = os.path.join(REPO_ROOT, "jobs")
-SITEMAP_PATH = os.path.join(REPO_ROOT, "sitemap.xml")
+SITEMAP_PATH = os.path.join(REPO_ROOT, "sitemap.xml")  # sitemap index
+SITEMAP_DIR = os.path.join(REPO_ROOT, "sitemaps")
+SITEMAP_MAX_URLS = 50000  # sitemap 프로토콜의 파일당 URL 한도
+# index.html이 Firestore 대신 읽는 정적 JSON 데이터
+# - index.json: 현재 목록/검색 색인 파일 이름(짧게 캐시)
+# - list-{hash}-{n}.json: 목록 페이지(내용 해시로 버전 관리, 장기 캐시), search-{hash}.json: 검색 색인
+# - detail/{idx}.json: 상세 본문/첨부파일 (모달을 열 때만 조회)
+DATA_DIR = os.path.join(REPO_ROOT, "jobs-data")
+DATA_FORMAT_VERSION = 1
+LIST_FIELDS = ('idx', 'title', 'dept_name', 'work_region', 'grade', 'reg_date', 'end_date', 'read_count', 'etc_info',
+               'category')
+LIST_PAGE_SIZE = 200  # 목록 페이지 파일당 행 수
+# idx -> 렌더링 입력 해시/마감 여부. jobs/와 함께 커밋되어 다음 실행에서 변경분만 다시 쓴다.
+MANIFEST_PATH = os.path.join(JOBS_DIR, ".manifest.json")
+MANIFEST_VERSION = 1
+# 페이지에 실제로 쓰이는 필드만 해시해 updated_at 같은 값 변화로 다시 쓰지 않도록 한다
+RENDER_FIELDS = ('idx', 'title', 'dept_name', 'work_region', 'grade', 'reg_date', 'end_date', 'contents', 'files')
+# 병렬 빌드 기본 작업자 수와, 프로세스 풀 시작 비용을 감수할 최소 페이지 수
+BUILD_WORKERS = int(os.getenv("STATIC_BUILD_WORKERS", os.cpu_count() or 1))
+PARALLEL_MIN_PAGES = 200
 KST = timezone(timedelta(hours=9))
 
 REGION_ADDRESS_FALLBACKS = {
@@ -296,6 +324,52 @@ def render_job_page(job, closed=False):
     )
 
 
+def template_hash():
+    """템플릿/배너가 바뀌면 모든 페이지를 다시 렌더링하도록 템플릿 자체의 해시를 기록"""
+    source = PAGE_TEMPLATE + CLOSED_BANNER + SITE_URL
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()[:16]
+
+
+def content_hash(job, closed=False):
+    """페이지 렌더링 입력의 해시"""
+    payload = {} if closed else {field: job.get(field) for field in RENDER_FIELDS}
+    payload['idx'] = str(job.get('idx', ''))
+    payload['closed'] = closed
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def load_manifest(path=None):
+    """빌드 manifest 로드. 없거나 템플릿이 바뀌었으면 빈 manifest(전체 재생성)."""
+    path = path or MANIFEST_PATH
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {'version': MANIFEST_VERSION, 'template': template_hash(), 'pages': {}}
+    if manifest.get('version') != MANIFEST_VERSION or manifest.get('template') != template_hash():
+        logger.info("템플릿 변경 감지 - 전체 페이지 재생성")
+        manifest['pages'] = {}
+    manifest['version'] = MANIFEST_VERSION
+    manifest['template'] = template_hash()
+    manifest.setdefault('pages', {})
+    return manifest
+
+
+def write_atomic(path, content):
+    """임시 파일에 쓴 뒤 교체해 중간에 중단돼도 반쯤 쓰인 파일이 남지 않게 한다"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def save_manifest(manifest, path=None):
+    write_atomic(path or MANIFEST_PATH, json.dumps(manifest, ensure_ascii=False, sort_keys=True, indent=0) + '\n')
+
+
 def load_jobs(db):
     """jobs 컬렉션은 30일 경과 문서가 data_cleanup.py로 완전 삭제되므로 전량이 유효 공고다.
     나라일터 API의 idx(recrutPblntSn)는 항상 숫자이므로, 숫자가 아닌 문서 ID는
@@ -315,77 +389,331 @@ def load_jobs(db):
     return jobs
 
 
-def write_job_pages(jobs):
-    os.makedirs(JOBS_DIR, exist_ok=True)
+def plan_job_pages(jobs, manifest):
+    """다시 써야 하는 페이지 목록 [(idx, job, closed, hash)]과 현재 유효한 idx 집합을 계산"""
+    pages = manifest['pages']
     active_ids = set()
+    planned = []
 
     for job in jobs:
         idx = job.get('idx')
         if not idx:
             continue
-        active_ids.add(str(idx))
-        job_dir = os.path.join(JOBS_DIR, str(idx))
-        os.makedirs(job_dir, exist_ok=True)
-        with open(os.path.join(job_dir, 'index.html'), 'w', encoding='utf-8') as f:
-            f.write(render_job_page(job, closed=False))
+        idx = str(idx)
+        active_ids.add(idx)
+        digest = content_hash(job)
+        entry = pages.get(idx)
+        if entry and entry.get('hash') == digest and os.path.isfile(os.path.join(JOBS_DIR, idx, 'index.html')):
+            continue
+        planned.append((idx, job, False, digest))
 
     # Firestore에서 삭제된(30일 경과) 공고는 파일을 지우지 않고 "마감됨" 배너로 전환해
-    # 이미 색인/공유된 링크가 깨지지 않도록 유지한다.
+    # 이미 색인/공유된 링크가 깨지지 않도록 유지한다. 마감 여부는 manifest로 판단한다.
     if os.path.isdir(JOBS_DIR):
-        for existing_idx in os.listdir(JOBS_DIR):
+        for existing_idx in sorted(os.listdir(JOBS_DIR)):
             if existing_idx in active_ids:
                 continue
-            job_file = os.path.join(JOBS_DIR, existing_idx, 'index.html')
-            if not os.path.isfile(job_file):
+            if not os.path.isfile(os.path.join(JOBS_DIR, existing_idx, 'index.html')):
                 continue
-            with open(job_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            if '마감된 채용공고입니다' in content:
-                continue  # 이미 마감 처리됨
             closed_job = {'idx': existing_idx, 'title': '마감된 채용공고'}
-            with open(job_file, 'w', encoding='utf-8') as f:
-                f.write(render_job_page(closed_job, closed=True))
-            logger.info(f"만료 처리: jobs/{existing_idx}")
+            digest = content_hash(closed_job, closed=True)
+            entry = pages.get(existing_idx)
+            if entry and entry.get('closed') and entry.get('hash') == digest:
+                continue  # 이미 마감 처리됨
+            planned.append((existing_idx, closed_job, True, digest))
+
+    return planned, active_ids
+
+
+def _render_task(task):
+    """프로세스 풀 작업 단위: (idx, 렌더링 필드, 마감 여부) -> (idx, HTML)"""
+    idx, job, closed = task
+    return idx, render_job_page(job, closed=closed)
+
+
+def render_pages(planned, workers=1):
+    """페이지 렌더링. workers > 1이고 대상이 충분히 많으면 프로세스 풀을 쓴다.
+    결과는 항상 planned 순서대로 반환된다."""
+    # Firestore 타임스탬프 등 렌더링에 쓰이지 않는 값은 넘기지 않는다 (pickle 비용/호환성)
+    tasks = [(idx, {field: job[field] for field in RENDER_FIELDS if field in job}, closed)
+             for idx, job, closed, _ in planned]
+    if workers <= 1 or len(tasks) < PARALLEL_MIN_PAGES:
+        return [_render_task(task) for task in tasks]
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_render_task, tasks, chunksize=chunksize))
+
 
-    logger.info(f"채용공고 정적 페이지 {len(active_ids)}건 생성 완료")
+def _write_page(job_file, content, compare):
+    """페이지 파일 쓰기. compare면 기존 내용과 같을 때 쓰지 않는다. 실제로 썼는지 반환."""
+    if compare and os.path.isfile(job_file):
+        with open(job_file, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    write_atomic(job_file, content)
+    return True
+
+
+def write_job_pages(jobs, incremental=True, workers=1):
+    """채용공고 정적 페이지 생성. incremental이면 입력 해시가 바뀐 페이지만 다시 쓴다.
+    workers > 1이면 렌더링은 프로세스 풀, 파일 쓰기는 스레드 풀에서 병렬로 처리한다."""
+    os.makedirs(JOBS_DIR, exist_ok=True)
+    manifest = load_manifest()
+    if not incremental:
+        manifest['pages'] = {}
+
+    planned, active_ids = plan_job_pages(jobs, manifest)
+    rendered = render_pages(planned, workers)
+
+    # manifest가 없던 페이지는 내용이 같으면 다시 쓰지 않는다 (최초 1회 이전 작업)
+    writes = [
+        (os.path.join(JOBS_DIR, idx, 'index.html'), content, idx not in manifest['pages'])
+        for idx, content in rendered
+    ]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        results = list(executor.map(lambda args: _write_page(*args), writes))
+
+    written = 0
+    for (idx, _, closed, digest), changed in zip(planned, results):
+        if changed:
+            written += 1
+            if closed:
+                logger.info(f"만료 처리: jobs/{idx}")
+        manifest['pages'][idx] = {'hash': digest, 'closed': closed}
+
+    if planned:
+        save_manifest(manifest)
+    logger.info(f"채용공고 정적 페이지 {len(active_ids)}건 중 {written}건 갱신 (검토 {len(planned)}건)")
     return active_ids
 
 
-def write_sitemap(active_ids):
-    now = datetime.now(KST).strftime('%Y-%m-%d')
+def job_lastmod(job):
+    """sitemap lastmod: 나라일터 moddate -> Firestore updated_at -> 등록일 순으로 사용 (YYYY-MM-DD)"""
+    digits = re.sub(r'\D', '', str(job.get('mod_date') or ''))[:8]
+    lastmod = format_iso_date(digits)
+    if lastmod:
+        return lastmod
+    updated_at = job.get('updated_at')
+    if isinstance(updated_at, datetime):
+        if updated_at.tzinfo is not None:
+            updated_at = updated_at.astimezone(KST)
+        return updated_at.strftime('%Y-%m-%d')
+    return format_iso_date(job.get('reg_date'))
+
+
+def sitemap_shard_key(job):
+    """등록월 단위 샤드 키 (YYYYMM, 등록일을 모르면 'unknown')"""
+    reg_date = str(job.get('reg_date') or '')
+    return reg_date[:6] if format_iso_date(reg_date) else 'unknown'
+
+
+def build_urlset(entries):
+    """(loc, lastmod, changefreq, priority) 목록을 urlset XML로 변환"""
     lines = ['<?xml version="1.0" encoding="UTF-8"?>',
              '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
-
-    for path, freq, priority in STATIC_PAGES:
+    for loc, lastmod, freq, priority in entries:
         lines.append('  <url>')
-        lines.append(f'    <loc>{SITE_URL}{path}</loc>')
-        lines.append(f'    <lastmod>{now}</lastmod>')
+        lines.append(f'    <loc>{esc(loc)}</loc>')
+        if lastmod:
+            lines.append(f'    <lastmod>{lastmod}</lastmod>')
         lines.append(f'    <changefreq>{freq}</changefreq>')
         lines.append(f'    <priority>{priority}</priority>')
         lines.append('  </url>')
-
-    for idx in sorted(active_ids):
-        lines.append('  <url>')
-        lines.append(f'    <loc>{SITE_URL}/jobs/{idx}/</loc>')
-        lines.append(f'    <lastmod>{now}</lastmod>')
-        lines.append('    <changefreq>weekly</changefreq>')
-        lines.append('    <priority>0.7</priority>')
-        lines.append('  </url>')
-
     lines.append('</urlset>')
+    return '\n'.join(lines) + '\n'
 
-    with open(SITEMAP_PATH, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines) + '\n')
 
-    logger.info(f"sitemap.xml 재생성 완료 ({len(STATIC_PAGES) + len(active_ids)}개 URL)")
+def build_sitemap_index(shards):
+    """(파일명, lastmod) 목록을 sitemapindex XML로 변환"""
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    for name, lastmod in shards:
+        lines.append('  <sitemap>')
+        lines.append(f'    <loc>{SITE_URL}/sitemaps/{name}</loc>')
+        if lastmod:
+            lines.append(f'    <lastmod>{lastmod}</lastmod>')
+        lines.append('  </sitemap>')
+    lines.append('</sitemapindex>')
+    return '\n'.join(lines) + '\n'
+
+
+def write_if_changed(path, data):
+    """내용(bytes)이 다를 때만 원자적으로 쓴다. 실제로 썼는지 반환."""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def write_sitemap(jobs, gzip_output=False):
+    """sitemap.xml(sitemap index)과 sitemaps/ 아래 샤드 생성
+
+    - static.xml: 고정 페이지, jobs-YYYYMM.xml: 등록월별 채용공고 (50,000 URL 초과 시 -2, -3 ... 분할)
+    - lastmod는 공고의 실제 수정일, 샤드/인덱스 lastmod는 포함 URL 중 가장 최근 값
+    - 내용이 바뀐 파일만 다시 쓰므로 크롤러는 바뀐 샤드만 다시 가져간다
+    """
+    groups = {}
+    for job in jobs:
+        idx = job.get('idx')
+        if idx:
+            groups.setdefault(sitemap_shard_key(job), []).append(job)
+
+    latest = max((job_lastmod(job) or '' for group in groups.values() for job in group), default='') or None
+    shard_entries = [('static', [
+        (f"{SITE_URL}{path}", latest if path == '/' else None, freq, priority)
+        for path, freq, priority in STATIC_PAGES
+    ])]
+    for key in sorted(groups):
+        group = sorted(groups[key], key=lambda job: (len(str(job['idx'])), str(job['idx'])))
+        for part, start in enumerate(range(0, len(group), SITEMAP_MAX_URLS), 1):
+            name = f"jobs-{key}" if part == 1 else f"jobs-{key}-{part}"
+            shard_entries.append((name, [
+                (f"{SITE_URL}/jobs/{job['idx']}/", job_lastmod(job), 'weekly', '0.7')
+                for job in group[start:start + SITEMAP_MAX_URLS]
+            ]))
+
+    extension = '.xml.gz' if gzip_output else '.xml'
+    shards = []
+    changed = []
+    for name, entries in shard_entries:
+        filename = name + extension
+        data = build_urlset(entries).encode('utf-8')
+        if gzip_output:
+            data = gzip.compress(data, mtime=0)  # mtime 고정: 내용이 같으면 바이트도 같게
+        if write_if_changed(os.path.join(SITEMAP_DIR, filename), data):
+            changed.append(filename)
+        shards.append((filename, max((lastmod for _, lastmod, _, _ in entries if lastmod), default=None)))
+
+    # 더 이상 참조되지 않는 샤드(형식 변경 등) 정리
+    current = {filename for filename, _ in shards}
+    for existing in os.listdir(SITEMAP_DIR):
+        if existing.endswith(('.xml', '.xml.gz')) and existing not in current:
+            os.remove(os.path.join(SITEMAP_DIR, existing))
+            changed.append(existing)
+
+    index_changed = write_if_changed(SITEMAP_PATH, build_sitemap_index(shards).encode('utf-8'))
+    url_count = sum(len(entries) for _, entries in shard_entries)
+    logger.info(f"sitemap 생성 완료 (샤드 {len(shards)}개, {url_count}개 URL, 변경 샤드 {len(changed)}개"
+                f"{', 인덱스 갱신' if index_changed else ''})")
+    return changed
+
+
+def _compact_json(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), sort_keys=True, default=str).encode('utf-8')
+
+
+def write_data_files(jobs):
+    """index.html용 정적 JSON 데이터 생성 (목록 페이지 + 검색 색인 + 공고별 상세). 바뀐 파일 목록 반환."""
+    detail_dir = os.path.join(DATA_DIR, 'detail')
+    os.makedirs(detail_dir, exist_ok=True)
+    changed = []
+    rows = []
+    active_ids = set()
+
+    # Firestore 조회와 같은 순서(등록일 최신순, 같은 날은 idx 큰 순)
+    ordered = sorted(
+        (job for job in jobs if job.get('idx')),
+        key=lambda job: (str(job.get('reg_date') or ''), len(str(job['idx'])), str(job['idx'])),
+        reverse=True,
+    )
+    for job in ordered:
+        idx = str(job['idx'])
+        active_ids.add(idx)
+        detail = _compact_json({'idx': idx, 'contents': job.get('contents') or '', 'files': job.get('files') or []})
+        if write_if_changed(os.path.join(detail_dir, f"{idx}.json"), detail):
+            changed.append(f"detail/{idx}.json")
+        # dv: 상세 파일 버전 (브라우저 캐시 무효화용)
+        detail_version = hashlib.sha256(detail).hexdigest()[:10]
+        rows.append([job.get(field) for field in LIST_FIELDS] + [detail_version])
+
+    # 목록은 LIST_PAGE_SIZE 행씩 페이지 파일로 나눠 첫 페이지만으로 첫 화면을 그릴 수 있게 한다.
+    # 파일 이름의 해시는 목록 전체 기준이라 같은 세대의 페이지끼리만 섞인다.
+    fields = list(LIST_FIELDS) + ['dv']
+    list_hash = hashlib.sha256(_compact_json({'fields': fields, 'rows': rows})).hexdigest()[:12]
+    page_names = []
+    for page_no, offset in enumerate(range(0, max(len(rows), 1), LIST_PAGE_SIZE), 1):
+        page_name = f"list-{list_hash}-{page_no}.json"
+        page_body = _compact_json({
+            'version': DATA_FORMAT_VERSION,
+            'fields': fields,
+            'offset': offset,
+            'rows': rows[offset:offset + LIST_PAGE_SIZE],
+        })
+        if write_if_changed(os.path.join(DATA_DIR, page_name), page_body):
+            changed.append(page_name)
+        page_names.append(page_name)
+
+    # 검색 색인: 문서 번호가 목록 행 번호이므로 목록과 같은 세대로 함께 교체된다
+    search_body = _compact_json(build_search_index(ordered))
+    search_name = f"search-{hashlib.sha256(search_body).hexdigest()[:12]}.json"
+    if write_if_changed(os.path.join(DATA_DIR, search_name), search_body):
+        changed.append(search_name)
+
+    index_path = os.path.join(DATA_DIR, 'index.json')
+    previous = {}
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    except (FileNotFoundError, ValueError):
+        pass
+    latest = max((job_lastmod(job) or '' for job in ordered), default='')
+    # 헤더 통계 집계: 날짜별 건수로 넣어 브라우저가 오늘 기준 임박/최근 건수를 며칠치 합으로 계산한다
+    aggregates = JobStats.from_jobs(ordered).to_dict()
+    del aggregates['entries']
+    # 기관 유형 탭: 데이터가 있는 카테고리만 탭 안에서 필터링하고 나머지는 외부 링크로 둔다
+    categories = {}
+    for job in ordered:
+        category = job.get('category') or DEFAULT_CATEGORY
+        categories[category] = categories.get(category, 0) + 1
+    index_body = _compact_json({
+        'version': DATA_FORMAT_VERSION,
+        'pages': page_names,
+        'page_size': LIST_PAGE_SIZE,
+        'search': search_name,
+        'count': len(rows),
+        'updated': latest,
+        'stats': aggregates,
+        'categories': categories,
+    })
+    if write_if_changed(index_path, index_body):
+        changed.append('index.json')
+
+    # 직전 세대 목록/검색 색인은 이전 index.json을 받은 브라우저를 위해 한 세대 더 남긴다
+    keep = {search_name, previous.get('search'), *page_names, *previous.get('pages', [])}
+    for name in os.listdir(DATA_DIR):
+        if name.startswith(('list-', 'search-')) and name.endswith('.json') and name not in keep:
+            os.remove(os.path.join(DATA_DIR, name))
+    for name in os.listdir(detail_dir):
+        if name.endswith('.json') and name[:-len('.json')] not in active_ids:
+            os.remove(os.path.join(detail_dir, name))
+            changed.append(f"detail/{name}")
+
+    logger.info(f"정적 JSON 데이터 생성 완료 (목록 {len(rows)}건, 변경 파일 {len(changed)}개)")
+    return changed
 
 
 def main():
+    parser = argparse.ArgumentParser(description="채용공고 정적 페이지·sitemap 생성")
+    parser.add_argument("--full-rebuild", action="store_true", help="manifest를 무시하고 모든 페이지 재생성")
+    parser.add_argument("--workers", type=int, default=BUILD_WORKERS,
+                        help="렌더링/쓰기 병렬 작업자 수 (1이면 순차 처리, 기본: CPU 수 또는 STATIC_BUILD_WORKERS)")
+    parser.add_argument("--gzip-sitemap", action="store_true", help="sitemap 샤드를 .xml.gz로 압축해 생성")
+    args = parser.parse_args()
+
     db = init_firestore()
     jobs = load_jobs(db)
     logger.info(f"채용공고 {len(jobs)}건 로드")
-    active_ids = write_job_pages(jobs)
-    write_sitemap(active_ids)
+    write_job_pages(jobs, incremental=not args.full_rebuild, workers=args.workers)
+    write_sitemap(jobs, gzip_output=args.gzip_sitemap)
+    write_data_files(jobs)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,287 @@
+"""
+API 서버용 메모리 채용공고 캐시
+- Firestore jobs 컬렉션(또는 generate_static_pages.py가 만든 jobs-data 스냅샷)을 한 번 읽어 메모리에 유지
+- 이후에는 updated_at이 바뀐 문서만 다시 읽고, 주기적으로 전체를 다시 읽어 삭제된 공고를 반영
+- 목록/필터/검색/통계는 모두 메모리에서 처리하므로 요청마다 Firestore를 조회하지 않는다
+- version은 데이터 내용으로 계산하므로 같은 데이터를 가진 서버끼리 ETag가 같다 (수평 확장 가능)
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from job_stats import JobStats
+from naraiteo_api import DEFAULT_CATEGORY
+from search_index import build_search_index, search
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_DIR = os.path.join(REPO_ROOT, "jobs-data")
+LIST_FIELDS = ('idx', 'title', 'dept_name', 'work_region', 'grade', 'reg_date', 'end_date', 'read_count', 'etc_info',
+               'category')
+CACHE_REFRESH_SECONDS = 60
+CACHE_FULL_RELOAD_SECONDS = 60 * 60  # 삭제된 공고 반영용 전체 재조회 주기
+JOB_RETENTION_DAYS = 30  # data_cleanup.py와 같은 보관 기간
+KST = timezone(timedelta(hours=9))
+
+
+def today_kst():
+    return datetime.now(KST).date()
+
+
+def job_sort_key(job: Dict[str, Any]):
+    """등록일 최신순, 같은 날은 idx 큰 순 (정적 목록과 같은 순서)"""
+    idx = str(job.get('idx') or '')
+    return (str(job.get('reg_date') or ''), len(idx), idx)
+
+
+def _compact_json(data) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), sort_keys=True, default=str).encode('utf-8')
+
+
+def d_day(end_date: Optional[str], today) -> Optional[int]:
+    """마감까지 남은 일수 (index.html calculateDDay와 같은 규칙, 상시채용은 None)"""
+    if not end_date or len(end_date) != 8 or end_date == '99991231':
+        return None
+    try:
+        end = datetime.strptime(end_date, '%Y%m%d').date()
+    except ValueError:
+        return None
+    return (end - today).days
+
+
+def is_urgent(job: Dict[str, Any], today) -> bool:
+    """마감 임박 (D-0 ~ D-3)"""
+    days = d_day(job.get('end_date'), today)
+    return days is not None and 0 <= days <= 3
+
+
+def is_recent(job: Dict[str, Any], today) -> bool:
+    """최근 7일 이내 등록"""
+    return str(job.get('reg_date') or '') >= (today - timedelta(days=7)).strftime('%Y%m%d')
+
+
+class ListView:
+    """정렬 목록, 검색 색인, version 묶음
+
+    요청 스레드가 갱신 도중의 목록과 다른 목록의 검색 색인을 섞어 읽지 않도록
+    갱신 때마다 새 묶음을 만들어 한 번에 교체하고, 조회는 묶음을 한 번만 읽어 사용한다.
+    """
+
+    def __init__(self, ordered: Optional[List[Dict[str, Any]]] = None, search_index=None, version: str = ""):
+        self.ordered = ordered or []
+        self.search_index = search_index
+        self.version = version
+
+
+class JobCache:
+    """채용공고 메모리 캐시
+
+    source는 "firestore" 또는 "snapshot"이며 db를 얻지 못하면 스냅샷을 사용한다.
+    ensure_fresh()는 refresh_seconds가 지났을 때만 갱신하고, 다른 요청이 갱신 중이면
+    기다리지 않고 현재 데이터를 그대로 사용한다.
+    """
+
+    def __init__(self, db_factory=None, snapshot_dir: str = SNAPSHOT_DIR,
+                 refresh_seconds: float = CACHE_REFRESH_SECONDS,
+                 full_reload_seconds: float = CACHE_FULL_RELOAD_SECONDS):
+        self.db_factory = db_factory
+        self.snapshot_dir = snapshot_dir
+        self.refresh_seconds = refresh_seconds
+        self.full_reload_seconds = full_reload_seconds
+        self.source = None
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.view = ListView()
+        self.loaded_at: Optional[float] = None
+        self._db = None
+        self._refreshed_at = 0.0
+        self._full_loaded_at = 0.0
+        self._high_water = None  # Firestore updated_at 최댓값
+        self._snapshot_pages = None  # 스냅샷 index.json의 목록 페이지 이름
+        self._details: Dict[str, Dict[str, Any]] = {}
+        self.job_stats = JobStats()  # 문서 변경 때마다 증분 갱신
+        self._stats = None
+        self._lock = threading.Lock()
+
+    @property
+    def ordered(self) -> List[Dict[str, Any]]:
+        return self.view.ordered
+
+    @property
+    def version(self) -> str:
+        return self.view.version
+
+    # ---- 로드/갱신 ----
+
+    def ensure_fresh(self):
+        """처음이면 로드하고, 갱신 주기가 지났으면 변경분만 반영"""
+        if self.loaded_at is not None and time.monotonic() - self._refreshed_at < self.refresh_seconds:
+            return
+        # 최초 로드는 데이터가 있어야 응답할 수 있으므로 기다리고, 이후 갱신은 한 요청만 수행
+        if not self._lock.acquire(blocking=self.loaded_at is None):
+            return
+        try:
+            if self.loaded_at is None or time.monotonic() - self._refreshed_at >= self.refresh_seconds:
+                self.refresh()
+        finally:
+            self._lock.release()
+
+    def refresh(self):
+        try:
+            if self.source is None:
+                self._db = self.db_factory() if self.db_factory else None
+                self.source = "firestore" if self._db is not None else "snapshot"
+                print(f"[CACHE] 데이터 소스: {self.source}")
+            if self.source == "firestore":
+                full = time.monotonic() - self._full_loaded_at >= self.full_reload_seconds
+                changed = self._refresh_firestore(full)
+            else:
+                changed = self._refresh_snapshot()
+        except Exception as e:
+            # 갱신에 실패해도 이전 데이터로 계속 응답한다
+            print(f"[ERROR] 채용공고 캐시 갱신 오류: {e}")
+            changed = False
+        changed = self._prune_expired() or changed
+        if changed or self.loaded_at is None:
+            self._rebuild()
+        self._refreshed_at = time.monotonic()
+        if self.loaded_at is None:
+            self.loaded_at = time.time()
+
+    def _refresh_firestore(self, full: bool) -> bool:
+        collection = self._db.collection('jobs')
+        if full or self._high_water is None:
+            jobs = {}
+            for doc in collection.stream():
+                if str(doc.id).isdigit():
+                    jobs[doc.id] = self._from_doc(doc)
+            self.jobs = jobs
+            self.job_stats = JobStats.from_jobs(jobs.values())
+            self._full_loaded_at = time.monotonic()
+            print(f"[CACHE] Firestore 전체 로드 ({len(jobs)}건)")
+            return True
+
+        changed = 0
+        for doc in collection.where('updated_at', '>', self._high_water).stream():
+            if str(doc.id).isdigit():
+                self.jobs[doc.id] = self._from_doc(doc)
+                self.job_stats.add(self.jobs[doc.id])
+                changed += 1
+        if changed:
+            print(f"[CACHE] Firestore 변경분 {changed}건 반영")
+        return changed > 0
+
+    def _from_doc(self, doc) -> Dict[str, Any]:
+        data = doc.to_dict() or {}
+        data['idx'] = doc.id
+        updated_at = data.get('updated_at')
+        if isinstance(updated_at, datetime) and (self._high_water is None or updated_at > self._high_water):
+            self._high_water = updated_at
+        return data
+
+    def _refresh_snapshot(self) -> bool:
+        """jobs-data/index.json이 가리키는 목록 페이지가 바뀌었을 때만 다시 읽는다"""
+        index_path = os.path.join(self.snapshot_dir, 'index.json')
+        if not os.path.exists(index_path):
+            if self.loaded_at is None:
+                print(f"[WARNING] 채용공고 스냅샷이 없습니다: {index_path}")
+            return False
+        with open(index_path, 'r', encoding='utf-8') as f:
+            data_index = json.load(f)
+        pages = data_index.get('pages', [])
+        if pages == self._snapshot_pages:
+            return False
+
+        jobs = {}
+        for name in pages:
+            with open(os.path.join(self.snapshot_dir, name), 'r', encoding='utf-8') as f:
+                page = json.load(f)
+            for row in page['rows']:
+                job = dict(zip(page['fields'], row))
+                job['idx'] = str(job['idx'])
+                jobs[job['idx']] = job
+        # 상세 파일 버전(dv)이 바뀐 공고만 상세 캐시를 비운다
+        for idx in list(self._details):
+            if idx not in jobs or jobs[idx].get('dv') != self.jobs.get(idx, {}).get('dv'):
+                del self._details[idx]
+        self.jobs = jobs
+        self.job_stats = JobStats.from_jobs(jobs.values())
+        self._snapshot_pages = pages
+        print(f"[CACHE] 스냅샷 로드 ({len(jobs)}건, 목록 페이지 {len(pages)}개)")
+        return True
+
+    def _prune_expired(self) -> bool:
+        """data_cleanup.py가 삭제할 등록일 30일 경과 공고는 전체 재조회 전에도 미리 제외"""
+        cutoff = (today_kst() - timedelta(days=JOB_RETENTION_DAYS)).strftime('%Y%m%d')
+        expired = [idx for idx, job in self.jobs.items()
+                   if len(str(job.get('reg_date') or '')) == 8 and str(job['reg_date']) <= cutoff]
+        for idx in expired:
+            del self.jobs[idx]
+            self._details.pop(idx, None)
+        self.job_stats.remove(expired)
+        return bool(expired)
+
+    def _rebuild(self):
+        """정렬 목록, 검색 색인, version 재계산 (데이터가 바뀐 경우에만)"""
+        ordered = sorted(self.jobs.values(), key=job_sort_key, reverse=True)
+        rows = [[job.get(field) for field in LIST_FIELDS] + [job.get('dv') or job.get('mod_date')]
+                for job in ordered]
+        version = hashlib.sha256(_compact_json(rows)).hexdigest()[:16]
+        self.view = ListView(ordered, build_search_index(ordered), version)
+        self._stats = None
+
+    # ---- 조회 ----
+
+    def query(self, q: str = "", region: str = "", grade: str = "", dept: str = "",
+              status: str = "", category: str = "", today=None) -> List[Dict[str, Any]]:
+        """필터/검색 결과 (등록일 최신순)"""
+        today = today or today_kst()
+        view = self.view
+        ordered = view.ordered
+        if q and view.search_index is not None:
+            ordered = [ordered[row] for row in search(view.search_index, ordered, q)]
+        result = []
+        for job in ordered:
+            if region and region not in str(job.get('work_region') or ''):
+                continue
+            if grade and grade not in str(job.get('grade') or ''):
+                continue
+            if dept and dept not in str(job.get('dept_name') or ''):
+                continue
+            if category and (job.get('category') or DEFAULT_CATEGORY) != category:
+                continue
+            if status == 'urgent' and not is_urgent(job, today):
+                continue
+            if status == 'recent' and not is_recent(job, today):
+                continue
+            result.append(job)
+        return result
+
+    def stats(self, today=None) -> Dict[str, Any]:
+        """헤더 통계 (증분 집계에서 바로 계산, 데이터나 날짜가 바뀔 때만 다시 만든다)"""
+        today = today or today_kst()
+        if self._stats is None or self._stats['date'] != today.strftime('%Y%m%d'):
+            self._stats = self.job_stats.summary(today)
+        return self._stats
+
+    def get(self, idx: str) -> Optional[Dict[str, Any]]:
+        return self.jobs.get(str(idx))
+
+    def detail(self, idx: str) -> Optional[Dict[str, Any]]:
+        """contents/files를 포함한 상세 (스냅샷 소스는 detail/{idx}.json을 처음 요청 시 읽는다)"""
+        job = self.get(idx)
+        if job is None:
+            return None
+        if self.source != "snapshot":
+            return job
+        if str(idx) not in self._details:
+            path = os.path.join(self.snapshot_dir, 'detail', f"{idx}.json")
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._details[str(idx)] = json.load(f)
+            except (FileNotFoundError, ValueError):
+                self._details[str(idx)] = {}
+        detail = self._details[str(idx)]
+        return {**job, 'contents': detail.get('contents') or '', 'files': detail.get('files') or []}
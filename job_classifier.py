@@ -0,0 +1,204 @@
+"""
+채용공고 직급/지역 분류기
+- 키워드 목록을 import 시점에 정규식 하나로 컴파일해 텍스트당 한 번만 훑고 우선순위로 결과를 고른다
+- 페이지 단위 일괄 분류 API 제공 (제목 목록을 한 번에 분류)
+"""
+import re
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 공무원 직급 키워드 (우선순위대로: 앞에 있을수록 우선)
+GRADE_PATTERNS: Tuple[Tuple[str, str], ...] = (
+    ("9급", "9급"),
+    ("8급", "8급"),
+    ("7급", "7급"),
+    ("6급", "6급"),
+    ("5급", "5급"),
+    ("인턴", "인턴"),
+    ("청년인턴", "인턴"),
+    ("전문연구원", "전문연구원"),
+    ("선임연구원", "선임연구원"),
+    ("책임연구원", "책임연구원"),
+    ("연구원", "연구원"),
+    ("공무직", "공무직"),
+    ("전문임기제", "전문직"),
+    ("전문직", "전문직"),
+    ("기능직", "기능직"),
+    ("임기제", "임기제"),
+    ("무기계약직", "무기계약직"),
+    ("계약직", "계약직"),
+    ("경력채용", "경력직"),
+    ("경력경쟁", "경력직"),
+    ("운전", "운전직"),
+    ("서기보", "서기보"),
+    ("안전관리", "안전관리"),
+    ("사무관", "사무관"),
+    ("주무관", "주무관"),
+    ("연구사", "연구사"),
+    ("기술직", "기술직"),
+    ("사회복무요원", "사회복무요원"),
+)
+
+# 제목 지역 키워드 (우선순위대로) -> 표준 지역명
+TITLE_REGION_PATTERNS: Tuple[Tuple[str, str], ...] = (
+    ("서울", "서울특별시"),
+    ("부산", "부산광역시"),
+    ("대구", "대구광역시"),
+    ("인천", "인천광역시"),
+    ("광주", "광주광역시"),
+    ("대전", "대전광역시"),
+    ("울산", "울산광역시"),
+    ("세종", "세종"),
+    ("경기", "경기도"),
+    ("강원", "강원도"),
+    ("충북", "충북도"),
+    ("충남", "충남도"),
+    ("전북", "전북도"),
+    ("전남", "전남도"),
+    ("경북", "경북도"),
+    ("경남", "경남도"),
+    ("제주", "제주"),
+    ("경기도", "경기도"),
+    ("강원도", "강원도"),
+    ("충청북도", "충청북도"),
+    ("충청남도", "충청남도"),
+    ("전라북도", "전라북도"),
+    ("전라남도", "전라남도"),
+    ("경상북도", "경상북도"),
+    ("경상남도", "경상남도"),
+    ("제주도", "제주도"),
+)
+
+# 본문 상세 지역 패턴 (우선순위 순, import 시 한 번만 컴파일)
+CONTENTS_REGION_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    # "전라북도 임실군", "경상남도 마산시" 등 (공백 포함)
+    r"([가-힣]+도)\s+([가-힣]+[시군구])",
+    # "경기도 화성시", "충청남도 천안시" 등
+    r"([가-힣]+도)\s+([가-힣]+시)",
+    # "서울특별시 강남구", "부산광역시 해운대구" 등
+    r"([가-힣]+[특별광역]시)\s+([가-힣]+구)",
+    # "임실우체국", "마산병원" 등에서 지역명 추출
+    r"([가-힣]+)[우체국|병원|교도소|법원|경찰서]",
+    # "임실군", "마산시" 등 단독
+    r"([가-힣]+[시군구])",
+    # "전라북도", "경상남도" 등
+    r"([가-힣]+도)",
+    # "서울특별시", "부산광역시" 등
+    r"([가-힣]+[특별광역]시)",
+))
+
+# 일괄 분류 시 텍스트 사이에 넣는 구분자 (키워드에 포함되지 않는 문자)
+_BATCH_SEPARATOR = "\n"
+
+
+def _partially_overlaps(a: str, b: str) -> bool:
+    """a의 접미사와 b의 접두사가 겹치는지 (한쪽이 다른 쪽을 포함하는 경우는 제외)"""
+    if a in b or b in a:
+        return False
+    return any(a.endswith(b[:size]) for size in range(1, min(len(a), len(b))))
+
+
+class PriorityMatcher:
+    """키워드 목록 중 텍스트에 포함된 가장 우선순위가 높은 항목을 찾는 분류기
+
+    모든 키워드를 긴 것 우선의 정규식 alternation 하나로 묶어 텍스트를 한 번만 훑는다.
+    - 긴 키워드가 짧은 키워드를 포함하는 경우("청년인턴"/"인턴")는 포함된 키워드 중 가장 높은
+      우선순위를 긴 키워드에 미리 부여해 둔다.
+    - 접미사/접두사가 겹칠 수 있는 키워드("서울"/"울산")가 매치되면 그 매치 안쪽 위치만 추가로
+      확인해 겹쳐 시작하는 키워드를 놓치지 않는다.
+    따라서 결과는 "목록 순서대로 포함 여부 확인"과 항상 같다.
+    """
+
+    def __init__(self, patterns: Sequence[Tuple[str, str]]):
+        self.labels: Tuple[str, ...] = tuple(label for _, label in patterns)
+        keywords = []
+        for keyword, _ in patterns:
+            if keyword not in keywords:
+                keywords.append(keyword)
+        # 키워드별 유효 우선순위: 자신과 자신에 포함된 키워드 중 가장 높은 우선순위
+        self._priority: Dict[str, int] = {
+            keyword: min(priority for priority, (other, _) in enumerate(patterns) if other in keyword)
+            for keyword in keywords
+        }
+        # 매치 안쪽에서 다른 키워드가 시작될 수 있는 키워드
+        self._overlapping = frozenset(
+            a for a in keywords for b in keywords if a != b and _partially_overlaps(a, b)
+        )
+        alternation = "|".join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+        self._regex = re.compile(f"({alternation})")
+
+    def _priorities(self, text: str):
+        """텍스트에 등장하는 (시작 위치, 유효 우선순위)를 모두 나열"""
+        for match in self._regex.finditer(text):
+            keyword = match.group(1)
+            yield match.start(), self._priority[keyword]
+            if keyword in self._overlapping:
+                for position in range(match.start() + 1, match.end()):
+                    inner = self._regex.match(text, position)
+                    if inner:
+                        yield position, self._priority[inner.group(1)]
+
+    def first(self, text: Optional[str]) -> str:
+        """텍스트에 포함된 가장 우선순위 높은 키워드의 라벨 (없으면 빈 문자열)"""
+        if not text:
+            return ""
+        best = None
+        for _, priority in self._priorities(text):
+            if best is None or priority < best:
+                best = priority
+                if best == 0:
+                    break
+        return self.labels[best] if best is not None else ""
+
+    def first_many(self, texts: Iterable[Optional[str]]) -> List[str]:
+        """여러 텍스트를 이어 붙여 한 번에 스캔하고 텍스트별 결과를 반환"""
+        texts = [text or "" for text in texts]
+        if not texts:
+            return []
+        offsets = []
+        position = 0
+        for text in texts:
+            offsets.append(position)
+            position += len(text) + len(_BATCH_SEPARATOR)
+        best: List[Optional[int]] = [None] * len(texts)
+        for start, priority in self._priorities(_BATCH_SEPARATOR.join(texts)):
+            index = bisect_right(offsets, start) - 1
+            if best[index] is None or priority < best[index]:
+                best[index] = priority
+        return [self.labels[priority] if priority is not None else "" for priority in best]
+
+
+GRADE_MATCHER = PriorityMatcher(GRADE_PATTERNS)
+TITLE_REGION_MATCHER = PriorityMatcher(TITLE_REGION_PATTERNS)
+
+
+def extract_grade(text: Optional[str]) -> str:
+    """텍스트에서 채용직급 추출 (제목 또는 타입정보)"""
+    return GRADE_MATCHER.first(text)
+
+
+def extract_region_from_title(title: Optional[str]) -> str:
+    """제목에서 지역 정보 추출"""
+    return TITLE_REGION_MATCHER.first(title)
+
+
+def extract_region_from_contents(contents: Optional[str]) -> str:
+    """게시글 내용에서 상세 지역 정보 추출 (우선순위가 가장 높은 패턴의 첫 매치)"""
+    if not contents:
+        return ""
+    for pattern in CONTENTS_REGION_PATTERNS:
+        match = pattern.search(contents)
+        if match:
+            return " ".join(match.groups()) if pattern.groups > 1 else match.group(1)
+    return ""
+
+
+def classify_grades(texts: Iterable[Optional[str]]) -> List[str]:
+    """여러 텍스트의 채용직급을 한 번에 분류"""
+    return GRADE_MATCHER.first_many(texts)
+
+
+def classify_titles(titles: Iterable[Optional[str]]) -> List[Tuple[str, str]]:
+    """페이지 단위 제목 목록을 (직급, 지역) 목록으로 일괄 분류"""
+    titles = list(titles)
+    return list(zip(GRADE_MATCHER.first_many(titles), TITLE_REGION_MATCHER.first_many(titles)))
@@ -0,0 +1,123 @@
+"""
+게시글 ID 색인
+- 중복 확인용으로 jobs 컬렉션 전체 문서를 내려받지 않도록 idx -> moddate 목록을 별도로 유지
+- Firestore sync_state/job_index 문서(manifest)와 작은 메타 문서(job_index_meta)에 저장
+- manifest는 바뀐 idx만 병합 저장하므로 동시에 실행된 동기화/정리가 서로의 추가·삭제를 덮어쓰지 않는다
+- 로컬 .sync_state/job_index.json 스냅샷의 revision이 메타 문서와 같으면 manifest도 읽지 않는다
+- manifest가 없으면 mod_date 필드만 가져오는 projection 쿼리로 한 번 재구성
+"""
+import uuid
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from sync_state import load_state, merge_state, save_state
+
+JOB_INDEX_DOC = "job_index"
+JOB_INDEX_META_DOC = "job_index_meta"
+
+
+class JobIndex:
+    """idx -> moddate 색인 (Firestore 문서 1MiB 한도 기준 약 2만 건까지 수용)"""
+
+    def __init__(self, ids: Optional[Dict[str, str]] = None, revision: str = "", loaded: bool = True):
+        self.ids = dict(ids or {})
+        self.revision = revision
+        self.loaded = loaded  # 조회 실패로 빈 색인이면 저장하지 않아 기존 manifest를 보호
+        self.changes: Dict[str, Optional[str]] = {}  # 저장 전 변경분: idx -> moddate (삭제는 None)
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.changes)
+
+    def __contains__(self, idx) -> bool:
+        return str(idx) in self.ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def id_set(self) -> set:
+        return set(self.ids)
+
+    def add(self, idx, mod_date: Optional[str] = None):
+        idx = str(idx)
+        mod_date = mod_date or ""
+        if self.ids.get(idx) != mod_date:
+            self.ids[idx] = mod_date
+            self.changes[idx] = mod_date
+
+    def remove(self, ids: Iterable):
+        for idx in ids:
+            if self.ids.pop(str(idx), None) is not None:
+                self.changes[str(idx)] = None
+
+    def to_dict(self) -> Dict:
+        return {"ids": self.ids, "revision": self.revision}
+
+
+def rebuild_job_index(db) -> JobIndex:
+    """jobs 컬렉션에서 mod_date 필드만 projection으로 읽어 색인 재구성"""
+    ids = {}
+    for doc in db.collection('jobs').select(['mod_date']).stream():
+        ids[doc.id] = (doc.to_dict() or {}).get('mod_date') or ""
+    index = JobIndex(ids)
+    index.changes = dict(ids)
+    return index
+
+
+def load_job_index(db) -> JobIndex:
+    """색인 로드: 로컬 스냅샷 -> Firestore manifest -> projection 재구성 순으로 시도"""
+    if db is None:
+        try:
+            local = load_state(None, JOB_INDEX_DOC)
+            return JobIndex(local.get("ids"), local.get("revision", ""))
+        except Exception as e:
+            print(f"[ERROR] 게시글 ID 색인 조회 오류: {e}")
+            return JobIndex(loaded=False)
+
+    try:
+        local = load_state(None, JOB_INDEX_DOC)
+    except Exception as e:
+        # 로컬 스냅샷은 manifest의 캐시일 뿐이므로 읽지 못하면 manifest부터 다시 읽는다
+        print(f"[INDEX] 로컬 스냅샷 조회 오류: {e}")
+        local = {}
+    try:
+        meta = load_state(db, JOB_INDEX_META_DOC)
+        revision = meta.get("revision")
+        if revision and local.get("revision") == revision:
+            print(f"[INDEX] 로컬 스냅샷 사용 ({len(local.get('ids', {}))}건)")
+            return JobIndex(local.get("ids"), revision)
+
+        manifest = load_state(db, JOB_INDEX_DOC)
+        if "ids" in manifest:
+            index = JobIndex(manifest["ids"], manifest.get("revision", ""))
+            print(f"[INDEX] manifest 로드 ({len(index)}건)")
+        else:
+            print("[INDEX] manifest 없음 - projection 쿼리로 색인 재구성")
+            index = rebuild_job_index(db)
+        save_state(None, JOB_INDEX_DOC, index.to_dict())
+        return index
+    except Exception as e:
+        print(f"[ERROR] 게시글 ID 색인 조회 오류: {e}")
+        return JobIndex(loaded=False)
+
+
+def save_job_index(db, index: JobIndex):
+    """변경된 idx를 manifest에 병합하고, 병합 결과로 메타 문서와 로컬 스냅샷을 갱신"""
+    if not index.loaded or not index.dirty:
+        return
+    # 저장할 때마다 새 revision을 발급해 동시에 저장한 다른 실행과 스냅샷이 섞이지 않게 한다
+    merge_state(db, JOB_INDEX_DOC, {"ids": index.changes, "revision": uuid.uuid4().hex})
+    index.changes = {}
+    # 다른 실행이 병합한 idx까지 포함된 manifest를 다시 읽어 스냅샷으로 삼는다
+    # (ids와 revision은 같은 문서에 있으므로 읽은 두 값은 항상 짝이 맞는다)
+    manifest = load_state(db, JOB_INDEX_DOC)
+    index.ids = dict(manifest.get("ids") or {})
+    index.revision = manifest.get("revision", "")
+    if db is not None:
+        save_state(db, JOB_INDEX_META_DOC, {
+            "revision": index.revision,
+            "count": len(index),
+            "updated_at": datetime.now(),
+        })
+        save_state(None, JOB_INDEX_DOC, index.to_dict())
+    print(f"[INDEX] 색인 저장 완료 ({len(index)}건)")
@@ -0,0 +1,107 @@
+"""
+채용공고 통계 집계
+- 헤더 통계(전체/임박/최근/기관 수)와 지역·직급별 건수를 공고 추가/삭제 때마다 증분으로 갱신
+- 임박/최근은 오늘 날짜에 따라 달라지므로 마감일·등록일별 건수로 보관하고, 조회 시 며칠치만 더한다
+- generate_static_pages.py(index.json stats)와 job_cache.py(/api/jobs/stats)가 읽은 공고로 만들어 쓴다
+"""
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+STATS_FIELDS = ('reg_date', 'end_date', 'dept_name', 'work_region', 'grade')
+URGENT_DAYS = 3  # 마감 D-0 ~ D-3
+RECENT_DAYS = 7
+UNKNOWN_KEY = "기타"  # Firestore 맵 키는 빈 문자열을 쓸 수 없다
+
+
+def _bump(counter: Dict[str, int], key: str, delta: int):
+    count = counter.get(key, 0) + delta
+    if count > 0:
+        counter[key] = count
+    else:
+        counter.pop(key, None)
+
+
+class JobStats:
+    """공고별 통계 항목(idx -> [등록일, 마감일, 기관, 지역, 직급])과 그 집계
+
+    집계는 항목에서 다시 계산할 수 있으므로 항목으로부터 만든다.
+    """
+
+    def __init__(self, entries: Optional[Dict[str, List[str]]] = None):
+        self.entries: Dict[str, List[str]] = {}
+        self.by_reg_date: Dict[str, int] = {}
+        self.by_end_date: Dict[str, int] = {}
+        self.departments: Dict[str, int] = {}
+        self.by_region: Dict[str, int] = {}
+        self.by_grade: Dict[str, int] = {}
+        for idx, entry in (entries or {}).items():
+            self.entries[str(idx)] = list(entry)
+            self._apply(entry, 1)
+
+    @classmethod
+    def from_jobs(cls, jobs: Iterable[Dict[str, Any]]) -> "JobStats":
+        stats = cls()
+        for job in jobs:
+            stats.add(job)
+        return stats
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _apply(self, entry: List[str], delta: int):
+        reg_date, end_date, dept, region, grade = entry
+        if reg_date:
+            _bump(self.by_reg_date, reg_date, delta)
+        if end_date:
+            _bump(self.by_end_date, end_date, delta)
+        if dept:
+            _bump(self.departments, dept, delta)
+        _bump(self.by_region, region or UNKNOWN_KEY, delta)
+        _bump(self.by_grade, grade or UNKNOWN_KEY, delta)
+
+    def add(self, job: Dict[str, Any]):
+        """공고 추가 또는 수정 (같은 idx가 있으면 이전 값을 빼고 다시 더한다)"""
+        idx = str(job['idx'])
+        entry = [str(job.get(field) or '') for field in STATS_FIELDS]
+        previous = self.entries.get(idx)
+        if previous == entry:
+            return
+        if previous is not None:
+            self._apply(previous, -1)
+        self._apply(entry, 1)
+        self.entries[idx] = entry
+
+    def remove(self, ids: Iterable):
+        for idx in ids:
+            entry = self.entries.pop(str(idx), None)
+            if entry is not None:
+                self._apply(entry, -1)
+
+    def summary(self, today) -> Dict[str, Any]:
+        """오늘 기준 통계 (index.html 헤더와 같은 기준). 임박/최근은 날짜별 건수 며칠치의 합."""
+        urgent = sum(self.by_end_date.get((today + timedelta(days=day)).strftime('%Y%m%d'), 0)
+                     for day in range(URGENT_DAYS + 1))
+        recent_from = (today - timedelta(days=RECENT_DAYS)).strftime('%Y%m%d')
+        recent = sum(count for reg_date, count in self.by_reg_date.items() if reg_date >= recent_from)
+        return {
+            'total_jobs': len(self.entries),
+            'urgent_jobs': urgent,
+            'recent_jobs': recent,
+            'total_departments': len(self.departments),
+            'by_region': dict(self.by_region),
+            'by_grade': dict(self.by_grade),
+            'date': today.strftime('%Y%m%d'),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화 형식 (정적 데이터 index.json은 entries를 빼고 집계만 싣는다)"""
+        return {
+            'entries': self.entries,
+            'total_jobs': len(self.entries),
+            'total_departments': len(self.departments),
+            'by_reg_date': self.by_reg_date,
+            'by_end_date': self.by_end_date,
+            'by_region': self.by_region,
+            'by_grade': self.by_grade,
+        }
+
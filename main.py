@@ -0,0 +1,168 @@
+"""
+채용공고 API 서버 (FastAPI)
+- 메모리 캐시(job_cache.JobCache)에서 목록/상세/통계를 제공해 브라우저가 Firestore를 직접 조회하지 않게 한다
+- 응답마다 데이터 version 기반 ETag와 Cache-Control을 붙여 CDN/브라우저 캐시와 조건부 요청(304)을 지원
+"""
+import hashlib
+import os
+
+import firebase_admin
+from fastapi import FastAPI, Query, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, JSONResponse, Response
+from firebase_admin import firestore
+
+from config import (
+    ALLOWED_ORIGINS,
+    API_CACHE_MAX_AGE,
+    DEFAULT_JOBS_PER_PAGE,
+    JOB_CACHE_REFRESH_SECONDS,
+    JOB_CACHE_SOURCE,
+    MAX_JOBS_PER_REQUEST,
+    SERVER_HOST,
+    SERVER_PORT,
+)
+from job_cache import LIST_FIELDS, REPO_ROOT, JobCache
+
+INDEX_HTML_PATH = os.path.join(REPO_ROOT, "index.html")
+
+
+def init_firestore():
+    """Firestore 클라이언트 (JOB_CACHE_SOURCE=auto에서 인증 정보가 없으면 None -> 스냅샷 사용)"""
+    if JOB_CACHE_SOURCE == "snapshot":
+        return None
+    if firebase_admin._apps:
+        return firestore.client()
+    from firebase_utils import load_firebase_credentials
+    try:
+        cred, source = load_firebase_credentials()
+    except FileNotFoundError as e:
+        if JOB_CACHE_SOURCE == "firestore":
+            raise
+        print(f"[WARNING] Firebase 인증 정보 없음 - 로컬 스냅샷 사용: {e}")
+        return None
+    print(f"[INFO] Firebase 인증 정보 로드: {source}")
+    firebase_admin.initialize_app(cred)
+    return firestore.client()
+
+
+job_cache = JobCache(db_factory=init_firestore, refresh_seconds=JOB_CACHE_REFRESH_SECONDS)
+
+app = FastAPI(title="나라일터 채용정보 API")
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=ALLOWED_ORIGINS,
+    allow_methods=["GET"],
+    allow_headers=["*"],
+    expose_headers=["ETag"],
+)
+
+
+def cached_json(request: Request, payload, *parts) -> Response:
+    """데이터 version과 요청 조건으로 ETag를 만들고, If-None-Match가 같으면 304 응답"""
+    digest = hashlib.sha256("|".join(str(part) for part in (job_cache.version, *parts)).encode("utf-8"))
+    etag = f'"{digest.hexdigest()[:20]}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={API_CACHE_MAX_AGE}, stale-while-revalidate={API_CACHE_MAX_AGE}",
+    }
+    if etag in [tag.strip() for tag in request.headers.get("if-none-match", "").split(",")]:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(payload, headers=headers)
+
+
+def list_item(job):
+    return {field: job.get(field) for field in LIST_FIELDS}
+
+
+@app.get("/")
+async def root():
+    """웹 페이지 (index.html)"""
+    if os.path.exists(INDEX_HTML_PATH):
+        return FileResponse(INDEX_HTML_PATH)
+    return {"message": "나라일터 채용정보 API", "docs": "/docs"}
+
+
+@app.get("/health")
+def health():
+    job_cache.ensure_fresh()
+    return {
+        "status": "healthy" if job_cache.loaded_at is not None else "starting",
+        "source": job_cache.source,
+        "jobs": len(job_cache.jobs),
+        "version": job_cache.version,
+    }
+
+
+@app.get("/api/jobs/list")
+def jobs_list(
+    request: Request,
+    page: int = Query(1, ge=1),
+    limit: int = Query(DEFAULT_JOBS_PER_PAGE, ge=1, le=MAX_JOBS_PER_REQUEST),
+    q: str = Query("", description="제목/기관명/직급/근무지역 검색어 (초성 검색 지원)"),
+    region: str = "",
+    grade: str = "",
+    dept: str = "",
+    status: str = Query("", pattern="^(|urgent|recent)$"),
+    category: str = Query("", description="기관 유형 (government, local, public)"),
+):
+    """채용공고 목록 (등록일 최신순, 필터/검색 후 페이지 단위)"""
+    job_cache.ensure_fresh()
+    jobs = job_cache.query(q=q.strip(), region=region, grade=grade, dept=dept, status=status,
+                           category=category)
+    start = (page - 1) * limit
+    payload = {
+        "success": True,
+        "data": [list_item(job) for job in jobs[start:start + limit]],
+        "pagination": {
+            "page": page,
+            "limit": limit,
+            "total": len(jobs),
+            "total_pages": (len(jobs) + limit - 1) // limit,
+        },
+    }
+    return cached_json(request, payload, "list", page, limit, q, region, grade, dept, status, category)
+
+
+@app.get("/api/jobs/stats")
+def jobs_stats(request: Request):
+    """헤더 통계 (전체/임박/최근/기관 수) 및 지역/직급별 건수"""
+    job_cache.ensure_fresh()
+    stats = job_cache.stats()
+    return cached_json(request, {"success": True, "data": stats}, "stats", stats["date"])
+
+
+def _detail_response(request: Request, job_id: str, kind: str, select, empty):
+    job_cache.ensure_fresh()
+    job = job_cache.detail(job_id)
+    if job is None:
+        return {"success": True, "data": empty, "message": "채용공고를 찾을 수 없습니다"}
+    return cached_json(request, {"success": True, "data": select(job)}, kind, job_id)
+
+
+@app.get("/api/jobs/detail/{job_id}")
+def job_detail(request: Request, job_id: str):
+    return _detail_response(request, job_id, "detail", lambda job: {
+        **list_item(job),
+        "contents": job.get("contents") or "",
+        "files": job.get("files") or [],
+    }, None)
+
+
+@app.get("/api/jobs/content/{job_id}")
+def job_content(request: Request, job_id: str):
+    return _detail_response(request, job_id, "content", lambda job: {
+        "idx": job.get("idx"),
+        "contents": job.get("contents") or "",
+    }, None)
+
+
+@app.get("/api/jobs/files/{job_id}")
+def job_files(request: Request, job_id: str):
+    return _detail_response(request, job_id, "files", lambda job: job.get("files") or [], [])
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run("main:app", host=SERVER_HOST, port=SERVER_PORT)
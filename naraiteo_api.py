@@ -7,18 +7,53 @@
 """
 
 import time
+import random
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
 import xml.etree.ElementTree as ET
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+import area_codes
+import job_classifier
+from response_cache import ResponseCache
 
 # API 설정
 SERVICE_KEY = "1bmDITdGFoaDTSrbT6Uyz8bFdlIL3nydHgRu0xQtXO8SiHlCrOJKv+JNSythF12BiijhVB3qE96/4Jxr70zUNg=="
 BASE_URL = "http://openapi.mpm.go.kr/openapi/service/RetrievePblinsttEmpmnInfoService"
 TIMEOUT = (10, 30)
 MAX_ATTEMPTS = 5
-RETRY_INTERVAL_SECONDS = 10
+RETRY_BASE_DELAY_SECONDS = 1    # 지수 백오프 시작 대기 시간
+RETRY_MAX_DELAY_SECONDS = 16    # 지수 백오프 최대 대기 시간
+RETRY_STATUSES = (502, 503, 504)  # 연결 오류처럼 다시 시도하는 일시적 서버 오류
+
+# 엔드포인트별 차단기 설정
+CIRCUIT_FAILURE_THRESHOLD = 3   # 연속 연결 실패 횟수가 이 값에 도달하면 차단
+CIRCUIT_RESET_SECONDS = 60      # 차단 후 시험 요청을 허용하기까지의 시간
+
+# 병렬 보강 설정
+ENRICH_MAX_WORKERS = 8          # 상세/첨부파일 보강 동시 작업 수
+RATE_LIMIT_PER_SECOND = 5.0     # 호스트당 초당 요청 수
+RATE_LIMIT_BURST = 5            # 순간 허용 요청 수
+RATE_LIMIT_MIN_PER_SECOND = 0.5 # 오류 누적 시 낮출 수 있는 최저 속도
+
+# 목록 조회 카테고리: key -> (기관구분 Instt_se, 공고유형 Pblanc_ty). key는 Firestore category 필드와
+# index.html 기관 유형 탭(정부기관/공공기관/지자체)에서 그대로 쓴다
+JOB_CATEGORIES = {
+    "government": ("g01", "e01"),  # 국가기관 공무원 채용
+    "local": ("g02", "e01"),       # 지방자치단체 공무원 채용
+    "public": ("g03", "e01"),      # 공공기관 채용
+}
+DEFAULT_CATEGORY = "government"  # category 필드가 없는 기존 문서의 카테고리
+
+# 커넥션 풀 설정
+POOL_SIZE = ENRICH_MAX_WORKERS  # 호스트당 유지할 keep-alive 연결 수
 
 class APIConnectionError(RuntimeError):
     def __init__(self, endpoint: str, attempts: int, last_error: Exception):
@@ -27,12 +62,233 @@ class APIConnectionError(RuntimeError):
         self.last_error = last_error
         super().__init__(f"{endpoint} 연결 실패 ({attempts}/{attempts}): {last_error}")
 
+class CircuitOpenError(APIConnectionError):
+    """차단기가 열린 엔드포인트 요청 시 네트워크 호출 없이 즉시 발생"""
+    def __init__(self, endpoint: str, retry_after: float, last_error: Optional[Exception] = None,
+                 attempts: int = 0):
+        self.endpoint = endpoint
+        self.attempts = attempts
+        self.last_error = last_error
+        self.retry_after = retry_after
+        RuntimeError.__init__(self, f"{endpoint} 차단됨 ({retry_after:.0f}초 후 재시도 가능): {last_error}")
+
+def backoff_delay(attempt: int, base: float = RETRY_BASE_DELAY_SECONDS,
+                  cap: float = RETRY_MAX_DELAY_SECONDS) -> float:
+    """지수 백오프 + 전체 지터: 0 ~ min(cap, base * 2^(attempt-1)) 사이 무작위 대기 시간"""
+    return random.uniform(0, min(cap, base * (2 ** (attempt - 1))))
+
+class RateLimiter:
+    """토큰 버킷 방식의 요청 속도 제한기 (스레드 안전)
+    
+    - 요청이 드문 경우에는 버스트 한도까지 대기 없이 통과시킨다.
+    - 업스트림 오류가 나면 penalize()로 속도를 절반씩 낮추고(최소 min_rate),
+      성공 응답마다 reward()로 설정 속도까지 조금씩 회복한다.
+    """
+
+    def __init__(self, requests_per_second: float = RATE_LIMIT_PER_SECOND, burst: int = RATE_LIMIT_BURST,
+                 min_rate: float = RATE_LIMIT_MIN_PER_SECOND):
+        self.max_rate = max(float(requests_per_second), 0.001)
+        self.min_rate = min(max(float(min_rate), 0.001), self.max_rate)
+        self._min_rate_setting = float(min_rate)
+        self.rate = self.max_rate
+        self.capacity = max(int(burst), 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def configure(self, requests_per_second: float, burst: int):
+        """설정 속도와 버스트 한도 변경 (오류로 낮춘 속도는 새 설정 속도를 넘지 않게 유지)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            backed_off = self.rate < self.max_rate
+            self.max_rate = max(float(requests_per_second), 0.001)
+            self.min_rate = min(max(self._min_rate_setting, 0.001), self.max_rate)
+            self.rate = max(min(self.rate, self.max_rate), self.min_rate) if backed_off else self.max_rate
+            self.capacity = max(int(burst), 1)
+            self._tokens = min(self._tokens, float(self.capacity))
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """토큰 1개를 소비한다. 토큰이 없으면 채워질 때까지 대기하고 대기 시간을 반환한다."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def penalize(self):
+        """업스트림 오류 발생 시 요청 속도를 절반으로 낮추고 남은 버스트를 비운다."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.rate / 2, self.min_rate)
+            self._tokens = min(self._tokens, 0.0)
+
+    def reward(self):
+        """성공 응답마다 설정 속도의 10%씩 회복한다."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill(time.monotonic())
+                self.rate = min(self.rate + self.max_rate * 0.1, self.max_rate)
+
+
+class CircuitBreaker:
+    """엔드포인트 단위 차단기 (스레드 안전)
+    
+    - closed: 정상. 연속 연결 실패가 failure_threshold에 도달하면 open으로 전환
+    - open: reset_seconds 동안 요청을 즉시 거부
+    - half_open: 시험 요청 1건만 허용. 성공하면 closed, 실패하면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 reset_seconds: float = CIRCUIT_RESET_SECONDS):
+        self.failure_threshold = max(int(failure_threshold), 1)
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.last_error: Optional[Exception] = None
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._remaining() <= 0:
+                return self.HALF_OPEN
+            return self._state
+
+    def _remaining(self) -> float:
+        return max(self._opened_at + self.reset_seconds - time.monotonic(), 0.0)
+
+    def retry_after(self) -> float:
+        """요청이 다시 허용되기까지 남은 시간(초)"""
+        with self._lock:
+            return self._remaining() if self._state == self.OPEN else 0.0
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if self._remaining() > 0:
+                    return False
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            # half_open: 동시에 하나의 시험 요청만 통과
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self, error: Optional[Exception] = None):
+        with self._lock:
+            self.failures += 1
+            self.last_error = error
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+_host_limiters: Dict[str, RateLimiter] = {}
+_host_limiters_lock = threading.Lock()
+
+
+def get_host_rate_limiter(url: str, requests_per_second: float = RATE_LIMIT_PER_SECOND,
+                          burst: int = RATE_LIMIT_BURST) -> RateLimiter:
+    """호스트별 속도 제한기 반환. 같은 호스트는 프로세스 전체에서 하나의 버킷을 공유한다.
+
+    이미 만든 버킷과 설정이 다르면 마지막으로 요청한 속도/버스트로 바꾼다.
+    """
+    host = urlparse(url).netloc or url
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None:
+            limiter = RateLimiter(requests_per_second, burst)
+            _host_limiters[host] = limiter
+        elif (limiter.max_rate, limiter.capacity) != (max(float(requests_per_second), 0.001), max(int(burst), 1)):
+            limiter.configure(requests_per_second, burst)
+        return limiter
+
+
 class NaraiteoAPI:
     """나라일터 API 클래스"""
     
-    def __init__(self):
+    def __init__(self, max_workers: int = ENRICH_MAX_WORKERS,
+                 requests_per_second: float = RATE_LIMIT_PER_SECOND,
+                 burst: int = RATE_LIMIT_BURST,
+                 pool_size: Optional[int] = None,
+                 cache: Optional[ResponseCache] = None):
         self.service_key = SERVICE_KEY
         self.base_url = BASE_URL
+        self.max_workers = max(int(max_workers), 1)
+        self.rate_limiter = get_host_rate_limiter(self.base_url, requests_per_second, burst)
+        # 병렬 보강 작업 수보다 풀이 작으면 연결이 버려지므로 최소 작업 수만큼 확보
+        self.pool_size = max(pool_size or POOL_SIZE, self.max_workers)
+        self.session = self._create_session(self.pool_size)
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._breakers_lock = threading.Lock()
+        # 상세/첨부파일/채용직급 응답 캐시 (None이면 캐시 없이 항상 요청)
+        self.cache = cache
+    
+    def _create_session(self, pool_size: int) -> requests.Session:
+        """keep-alive 연결을 재사용하는 세션 생성"""
+        # 어댑터는 재시도하지 않는다: 연결 실패/일시적 서버 오류도 _send 재시도 루프에서
+        # 속도 제한과 엔드포인트 차단기를 거쳐 다시 보내야 한다
+        retry = Retry(total=0, connect=0, read=0, status=0, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    def _breaker(self, endpoint: str) -> CircuitBreaker:
+        with self._breakers_lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker()
+                self._breakers[endpoint] = breaker
+            return breaker
+    
+    def circuit_state(self, endpoint: str) -> str:
+        """엔드포인트 차단기 상태 조회: "closed" / "open" / "half_open" """
+        return self._breaker(endpoint).state
+    
+    def is_endpoint_available(self, endpoint: str) -> bool:
+        """차단기가 열려 있지 않아 요청을 보낼 수 있는 엔드포인트인지 확인"""
+        return self.circuit_state(endpoint) != CircuitBreaker.OPEN
+    
+    def close(self):
+        """세션과 커넥션 풀, 응답 캐시 정리"""
+        self.session.close()
+        if self.cache is not None:
+            if self.cache.hits or self.cache.misses:
+                print(f"[CACHE] 응답 캐시 적중 {self.cache.hits}건, 미적중 {self.cache.misses}건")
+            self.cache.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
         
     def _text(self, element, tag: str, default: str = "") -> str:
         """XML 요소에서 텍스트 추출"""
@@ -41,182 +297,27 @@ class NaraiteoAPI:
     
     def _convert_area_code_to_name(self, area_code: str) -> str:
         """지역코드를 지역명으로 변환"""
-        if not area_code:
-            return ""
-        
-        # 상세 지역코드 맵핑 (시군구 포함)
-        detailed_area_map = {
-            # 전라북도
-            "45000": "전라북도",
-            "45130": "전라북도 군산시",
-            "45140": "전라북도 익산시", 
-            "45180": "전라북도 정읍시",
-            "45190": "전라북도 남원시",
-            "45210": "전라북도 김제시",
-            "45710": "전라북도 완주군",
-            "45720": "전라북도 진안군",
-            "45730": "전라북도 무주군",
-            "45740": "전라북도 장수군",
-            "45750": "전라북도 임실군",
-            "45770": "전라북도 순창군",
-            "45790": "전라북도 고창군",
-            "45800": "전라북도 부안군",
-            
-            # 경상남도  
-            "48000": "경상남도",
-            "48120": "경상남도 진주시",
-            "48125": "경상남도 창원시",  # 마산시 포함
-            "48127": "경상남도 통영시",
-            "48129": "경상남도 사천시",
-            "48170": "경상남도 김해시",
-            "48220": "경상남도 밀양시",
-            "48240": "경상남도 거제시",
-            "48250": "경상남도 양산시",
-            "48720": "경상남도 의령군",
-            "48730": "경상남도 함안군",
-            "48740": "경상남도 창녕군",
-            "48820": "경상남도 고성군",
-            "48840": "경상남도 남해군",
-            "48850": "경상남도 하동군",
-            "48860": "경상남도 산청군",
-            "48870": "경상남도 함양군",
-            "48880": "경상남도 거창군",
-            "48890": "경상남도 합천군",
-        }
-        
-        # 상세 코드 먼저 확인
-        if area_code in detailed_area_map:
-            return detailed_area_map[area_code]
-        
-        # 5자리 지역코드인 경우 앞 2자리만 사용
-        if len(area_code) == 5:
-            area_code = area_code[:2]
-            
-        area_map = {
-            "11": "서울특별시",
-            "26": "부산광역시", 
-            "27": "대구광역시",
-            "28": "인천광역시",
-            "29": "광주광역시",
-            "30": "대전광역시",
-            "31": "울산광역시",
-            "36": "세종특별자치시",
-            "41": "경기도",
-            "43": "충청북도",
-            "44": "충청남도",
-            "45": "전라북도",
-            "46": "전라남도",
-            "47": "경상북도",
-            "48": "경상남도",
-            "50": "제주특별자치도",
-            "51": "강원도",
-        }
-        return area_map.get(area_code, "")
+        return area_codes.area_name(area_code)
     
     def _extract_grade_from_text(self, text: str) -> str:
         """텍스트에서 채용직급 추출 (제목 또는 타입정보)"""
-        if not text:
-            return ""
-        
-        # 일반적인 공무원 직급 키워드 검색 (우선순위대로)
-        grade_patterns = [
-            ("9급", "9급"),
-            ("8급", "8급"), 
-            ("7급", "7급"),
-            ("6급", "6급"),
-            ("5급", "5급"),
-            ("인턴", "인턴"),
-            ("청년인턴", "인턴"),
-            ("전문연구원", "전문연구원"),
-            ("선임연구원", "선임연구원"),  
-            ("책임연구원", "책임연구원"),
-            ("연구원", "연구원"),
-            ("공무직", "공무직"),
-            ("전문임기제", "전문직"),
-            ("전문직", "전문직"),
-            ("기능직", "기능직"),
-            ("임기제", "임기제"),
-            ("무기계약직", "무기계약직"),
-            ("계약직", "계약직"),
-            ("경력채용", "경력직"),
-            ("경력경쟁", "경력직"),
-            ("운전", "운전직"),
-            ("서기보", "서기보"),
-            ("안전관리", "안전관리"),
-            ("사무관", "사무관"),
-            ("주무관", "주무관"),
-            ("연구사", "연구사"),
-            ("기술직", "기술직"),
-            ("사회복무요원", "사회복무요원")
-        ]
-        
-        for pattern, grade in grade_patterns:
-            if pattern in text:
-                return grade
-        
-        return ""  # 알 수 없는 경우 빈 값 반환
+        return job_classifier.extract_grade(text)
     
     def _extract_region_from_title(self, title: str) -> str:
         """제목에서 지역 정보 추출"""
-        if not title:
-            return ""
-            
-        # 주요 지역 키워드 검색
-        regions = [
-            "서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종",
-            "경기", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주",
-            "경기도", "강원도", "충청북도", "충청남도", "전라북도", "전라남도", 
-            "경상북도", "경상남도", "제주도"
-        ]
-        
-        for region in regions:
-            if region in title:
-                if region in ["경기", "강원", "충북", "충남", "전북", "전남", "경북", "경남"]:
-                    return region + "도"
-                elif region in ["서울", "부산", "대구", "인천", "광주", "대전", "울산"]:
-                    return region + "광역시" if region != "서울" else "서울특별시"
-                else:
-                    return region
-        
-        return ""
+        return job_classifier.extract_region_from_title(title)
     
     def _extract_region_from_contents(self, contents: str) -> str:
         """게시글 내용에서 상세 지역 정보 추출"""
-        if not contents:
-            return ""
-        
-        import re
-        
-        # 상세 지역 정보 패턴들 (우선순위 순)
-        patterns = [
-            # "전라북도 임실군", "경상남도 마산시" 등 (공백 포함)
-            r"([가-힣]+도)\s+([가-힣]+[시군구])",
-            # "경기도 화성시", "충청남도 천안시" 등  
-            r"([가-힣]+도)\s+([가-힣]+시)",
-            # "서울특별시 강남구", "부산광역시 해운대구" 등
-            r"([가-힣]+[특별광역]시)\s+([가-힣]+구)",
-            # "임실우체국", "마산병원" 등에서 지역명 추출
-            r"([가-힣]+)[우체국|병원|교도소|법원|경찰서]",
-            # "임실군", "마산시" 등 단독
-            r"([가-힣]+[시군구])",
-            # "전라북도", "경상남도" 등
-            r"([가-힣]+도)",
-            # "서울특별시", "부산광역시" 등
-            r"([가-힣]+[특별광역]시)"
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, contents)
-            if matches:
-                if isinstance(matches[0], tuple):
-                    return " ".join(matches[0])
-                else:
-                    return matches[0]
-        
-        return ""
+        return job_classifier.extract_region_from_contents(contents)
     
-    def _make_request(self, endpoint: str, params: Dict) -> Optional[ET.Element]:
-        """API 요청 공통 함수: 연결 오류는 5회 재시도하고 다른 오류와 구분한다."""
+    def _send(self, endpoint: str, params: Dict, stream: bool = False) -> requests.Response:
+        """재시도/차단기/속도 제한을 적용해 응답을 받아온다.
+        
+        연결 오류와 일시적 서버 오류(RETRY_STATUSES)는 지수 백오프로 최대 5회 재시도하고 다른 오류와 구분한다.
+        엔드포인트별 차단기가 열려 있으면 네트워크 호출 없이 CircuitOpenError를 발생시킨다.
+        stream=True면 응답 헤더까지만 받고 본문은 호출자가 읽는다.
+        """
         url = f"{self.base_url}/{endpoint}"
         request_params = {**params, "serviceKey": self.service_key}
         transient_errors = (
@@ -224,103 +325,212 @@ class NaraiteoAPI:
             requests.exceptions.ReadTimeout,
             requests.exceptions.ConnectionError,
         )
+        breaker = self._breaker(endpoint)
         last_error = None
 
         for attempt in range(1, MAX_ATTEMPTS + 1):
+            if not breaker.allow_request():
+                print(f"[CIRCUIT] {endpoint} 차단 상태 - 요청 생략")
+                raise CircuitOpenError(endpoint, breaker.retry_after(), last_error or breaker.last_error,
+                                       attempts=attempt - 1)
             try:
                 print(f"[API 요청] {endpoint} 연결 시도 ({attempt}/{MAX_ATTEMPTS})")
-                response = requests.get(url, params=request_params, timeout=TIMEOUT)
+                self.rate_limiter.acquire()
+                response = self.session.get(url, params=request_params, timeout=TIMEOUT, stream=stream)
+                if response.status_code == 429 or response.status_code >= 500:
+                    self.rate_limiter.penalize()
                 response.raise_for_status()
-                root = ET.fromstring(response.content)
-                result_code = root.findtext(".//resultCode")
-                if result_code and result_code != "00":
-                    result_msg = root.findtext(".//resultMsg")
-                    raise RuntimeError(f"{endpoint} API 오류 {result_code}: {result_msg}")
+                breaker.record_success()
                 print(f"[CONNECTION] {endpoint} 연결 성공 ({attempt}/{MAX_ATTEMPTS})")
-                return root
-            except transient_errors as exc:
-                last_error = exc
-                print(f"[CONNECTION] {endpoint} 연결 실패 ({attempt}/{MAX_ATTEMPTS}): {type(exc).__name__}")
-                if attempt < MAX_ATTEMPTS:
-                    print(f"[RETRY] {RETRY_INTERVAL_SECONDS}초 후 다시 시도합니다.")
-                    time.sleep(RETRY_INTERVAL_SECONDS)
+                self.rate_limiter.reward()
+                return response
             except requests.exceptions.RequestException as exc:
-                raise RuntimeError(f"{endpoint} HTTP 요청 오류: {exc}") from exc
-            except ET.ParseError as exc:
-                raise RuntimeError(f"{endpoint} XML 파싱 오류: {exc}") from exc
+                response = getattr(exc, "response", None)
+                status = response.status_code if response is not None else None
+                if not isinstance(exc, transient_errors) and status not in RETRY_STATUSES:
+                    if status is not None and status >= 500:
+                        breaker.record_failure(exc)
+                    else:
+                        breaker.record_success()
+                    raise RuntimeError(f"{endpoint} HTTP 요청 오류: {exc}") from exc
+                last_error = exc
+                if response is None:
+                    self.rate_limiter.penalize()  # 상태 코드 오류는 응답을 받을 때 이미 반영
+                else:
+                    response.close()  # stream 응답이면 연결을 풀에 돌려준다
+                breaker.record_failure(exc)
+                reason = f"HTTP {status}" if status is not None else type(exc).__name__
+                print(f"[CONNECTION] {endpoint} 연결 실패 ({attempt}/{MAX_ATTEMPTS}): {reason}")
+                if attempt < MAX_ATTEMPTS and breaker.state == CircuitBreaker.CLOSED:
+                    delay = backoff_delay(attempt)
+                    print(f"[RETRY] {delay:.1f}초 후 다시 시도합니다.")
+                    time.sleep(delay)
 
         raise APIConnectionError(endpoint, MAX_ATTEMPTS, last_error)
 
-    def get_job_list(self, page_no: int = 1, num_of_rows: int = 20) -> List[Dict]:
-        """채용공고 목록 조회"""
-        params = {
+    def _check_result(self, endpoint: str, header) -> None:
+        """응답 헤더의 resultCode가 정상(00)이 아니면 오류 발생"""
+        result_code = header.findtext(".//resultCode")
+        if result_code and result_code != "00":
+            result_msg = header.findtext(".//resultMsg")
+            raise RuntimeError(f"{endpoint} API 오류 {result_code}: {result_msg}")
+
+    def _make_request(self, endpoint: str, params: Dict, cache_key: Optional[str] = None,
+                      mod_date: Optional[str] = None) -> Optional[ET.Element]:
+        """API 요청 공통 함수: 응답 전체를 받아 XML로 파싱한다.
+        
+        cache_key를 주면 응답 캐시를 먼저 확인하고, 성공한 원본 XML을 캐시에 저장한다.
+        """
+        if self.cache is not None and cache_key:
+            body = self.cache.get(endpoint, cache_key, mod_date)
+            if body is not None:
+                try:
+                    return ET.fromstring(body)
+                except ET.ParseError:
+                    self.cache.invalidate(endpoint, cache_key)
+
+        response = self._send(endpoint, params)
+        try:
+            root = ET.fromstring(response.content)
+        except ET.ParseError as exc:
+            raise RuntimeError(f"{endpoint} XML 파싱 오류: {exc}") from exc
+        self._check_result(endpoint, root)
+        if self.cache is not None and cache_key:
+            self.cache.put(endpoint, cache_key, response.content, mod_date)
+        return root
+
+    def _list_params(self, page_no: int, num_of_rows: int, category: str = DEFAULT_CATEGORY) -> Dict:
+        instt_se, pblanc_ty = JOB_CATEGORIES[category]
+        return {
             "pageNo": page_no,
             "numOfRows": num_of_rows,
-            "Instt_se": "g01",    # 국가기관
-            "Pblanc_ty": "e01"    # 공무원 채용
+            "Instt_se": instt_se,    # 기관구분 (g01: 국가기관)
+            "Pblanc_ty": pblanc_ty   # 공고유형 (e01: 공무원 채용)
         }
+
+    def _parse_list_item(self, item, debug: bool = False,
+                         title_class: Optional[Tuple[str, str]] = None,
+                         category: str = DEFAULT_CATEGORY) -> Dict:
+        """목록 <item> 요소를 공고 dict로 변환 (title_class: 미리 일괄 분류한 제목의 (직급, 지역))"""
+        # 디버깅: 실제 데이터 값 확인
+        area_code = self._text(item, "areaCode")
+        type_info = self._text(item, "typeinfo02")
+        
+        if debug:  # 첫 번째 항목만 로깅
+            print(f"[디버그] areaCode: '{area_code}', typeinfo02: '{type_info}'")
+            print(f"[디버그] title: '{self._text(item, 'title')}'")
+        
+        # 지역코드를 지역명으로 변환
+        area_name = self._convert_area_code_to_name(area_code)
+        
+        # 제목에서 직급 추출
+        title = self._text(item, "title")
+        title_grade, title_region = title_class or (self._extract_grade_from_text(title), None)
+        grade_info = title_grade
         
-        root = self._make_request("getList", params)
+        # 타입 정보에서도 직급 추출 시도 (제목에서 찾지 못한 경우)
+        if not grade_info:
+            grade_info = self._extract_grade_from_text(type_info)
+        
+        # 지역 정보가 없으면 제목에서 추출 시도
+        if not area_name:
+            region_from_title = title_region if title_class else self._extract_region_from_title(title)
+            if region_from_title:
+                area_name = region_from_title
+        
+        return {
+            "idx": self._text(item, "idx"),
+            "title": title,
+            "dept_name": self._text(item, "deptName"),
+            "reg_date": self._text(item, "regdate"),
+            "end_date": self._text(item, "enddate"),
+            "start_date": "",
+            "read_count": int(self._text(item, "readnum", "0")),
+            "grade": grade_info or "미확인",
+            "work_region": area_name or "미확인",
+            "etc_info": type_info or "일반채용",
+            "file_url": "",
+            "contents": "",
+            "area_code": area_code,
+            "username": self._text(item, "username"),
+            "mod_date": self._text(item, "moddate"),
+            "category": category,
+            "created_at": datetime.now().isoformat()
+        }
+
+    def get_job_list(self, page_no: int = 1, num_of_rows: int = 20,
+                     category: str = DEFAULT_CATEGORY) -> List[Dict]:
+        """채용공고 목록 조회"""
+        root = self._make_request("getList", self._list_params(page_no, num_of_rows, category))
         if not root:
             return []
         
-        jobs = []
         items = root.findall(".//item")
-        
-        for item in items:
-            # 디버깅: 실제 데이터 값 확인
-            area_code = self._text(item, "areaCode")
-            type_info = self._text(item, "typeinfo02")
-            
-            if len(jobs) == 0:  # 첫 번째 항목만 로깅
-                print(f"[디버그] areaCode: '{area_code}', typeinfo02: '{type_info}'")
-                print(f"[디버그] title: '{self._text(item, 'title')}'")
-            
-            # 지역코드를 지역명으로 변환
-            area_name = self._convert_area_code_to_name(area_code)
-            
-            # 제목에서 직급 추출
-            title = self._text(item, "title")
-            grade_info = self._extract_grade_from_text(title)
-            
-            # 타입 정보에서도 직급 추출 시도 (제목에서 찾지 못한 경우)
-            if not grade_info:
-                grade_info = self._extract_grade_from_text(type_info)
-            
-            # 지역 정보가 없으면 제목에서 추출 시도
-            if not area_name:
-                region_from_title = self._extract_region_from_title(title)
-                if region_from_title:
-                    area_name = region_from_title
-            
-            job_data = {
-                "idx": self._text(item, "idx"),
-                "title": title,
-                "dept_name": self._text(item, "deptName"),
-                "reg_date": self._text(item, "regdate"),
-                "end_date": self._text(item, "enddate"),
-                "start_date": "",
-                "read_count": int(self._text(item, "readnum", "0")),
-                "grade": grade_info or "미확인",
-                "work_region": area_name or "미확인",
-                "etc_info": type_info or "일반채용",
-                "file_url": "",
-                "contents": "",
-                "area_code": area_code,
-                "username": self._text(item, "username"),
-                "mod_date": self._text(item, "moddate"),
-                "created_at": datetime.now().isoformat()
-            }
-            jobs.append(job_data)
+        # 페이지의 제목 전체를 한 번에 분류
+        title_classes = job_classifier.classify_titles(self._text(item, "title") for item in items)
+        jobs = [
+            self._parse_list_item(item, debug=(i == 0), title_class=title_class, category=category)
+            for i, (item, title_class) in enumerate(zip(items, title_classes))
+        ]
         
         print(f"[수집 완료] {len(jobs)}건의 채용공고")
         return jobs
     
-    def get_job_detail(self, idx: str) -> Optional[Dict]:
+    def iter_job_list(self, page_no: int = 1, num_of_rows: int = 20,
+                      category: str = DEFAULT_CATEGORY) -> Iterator[Dict]:
+        """채용공고 목록 스트리밍 조회
+        
+        응답 본문을 내려받는 동안 <item> 요소가 완성될 때마다 공고 dict를 바로 넘겨준다.
+        처리한 요소는 트리에서 제거하므로 numOfRows가 커도 메모리 사용량이 일정하다.
+        호출자가 중간에 반복을 멈추면 나머지 본문은 내려받지 않고 연결을 닫는다.
+        본문 수신 중 연결이 끊기면 이미 넘겨준 항목과 중복되지 않도록 재시도 없이 APIConnectionError를 발생시킨다.
+        """
+        endpoint = "getList"
+        response = self._send(endpoint, self._list_params(page_no, num_of_rows, category), stream=True)
+        response.raw.decode_content = True
+        count = 0
+        parent = None
+        try:
+            for event, elem in ET.iterparse(response.raw, events=("start", "end")):
+                if event == "start":
+                    if elem.tag == "items":
+                        parent = elem
+                    continue
+                if elem.tag == "header":
+                    self._check_result(endpoint, elem)
+                elif elem.tag == "item":
+                    job = self._parse_list_item(elem, debug=(count == 0), category=category)
+                    if parent is not None:
+                        parent.remove(elem)
+                    else:
+                        elem.clear()
+                    count += 1
+                    yield job
+        except ET.ParseError as exc:
+            raise RuntimeError(f"{endpoint} XML 파싱 오류: {exc}") from exc
+        except (requests.exceptions.RequestException, Urllib3HTTPError) as exc:
+            self._breaker(endpoint).record_failure(exc)
+            raise APIConnectionError(endpoint, 1, exc) from exc
+        finally:
+            response.close()
+        
+        print(f"[수집 완료] {count}건의 채용공고 (스트리밍)")
+    
+    def get_list_total_count(self, category: str = DEFAULT_CATEGORY) -> int:
+        """목록 전체 건수(totalCount) 조회 - 전체 페이지 수를 미리 알아 페이지를 병렬로 받을 때 사용"""
+        root = self._make_request("getList", self._list_params(1, 1, category))
+        if not root:
+            return 0
+        try:
+            return int(self._text(root, ".//totalCount", "0") or 0)
+        except ValueError:
+            return 0
+    
+    def get_job_detail(self, idx: str, mod_date: Optional[str] = None) -> Optional[Dict]:
         """채용공고 상세 정보 조회"""
         params = {"idx": idx}
         
-        root = self._make_request("getItem", params)
+        root = self._make_request("getItem", params, cache_key=idx, mod_date=mod_date)
         if not root:
             return None
         
@@ -364,7 +574,7 @@ class NaraiteoAPI:
         print(f"[상세 조회] 공고 ID {idx} 상세정보 획득 - 근무지역: {work_region}")
         return detail_data
     
-    def get_job_files(self, idx: str) -> List[Dict]:
+    def get_job_files(self, idx: str, mod_date: Optional[str] = None) -> List[Dict]:
         """채용공고 첨부파일 목록 조회"""
         params = {
             "idx": idx,
@@ -372,7 +582,7 @@ class NaraiteoAPI:
             "numOfRows": 50
         }
         
-        root = self._make_request("getItemFile", params)
+        root = self._make_request("getItemFile", params, cache_key=idx, mod_date=mod_date)
         if not root:
             return []
         
@@ -408,11 +618,11 @@ class NaraiteoAPI:
         print(f"[첨부파일] 공고 ID {idx}: {len(files)}개 파일")
         return files
     
-    def get_job_position(self, idx: str) -> Optional[Dict]:
+    def get_job_position(self, idx: str, mod_date: Optional[str] = None) -> Optional[Dict]:
         """채용직급 정보 조회 - 정확한 채용직급과 인원수 정보"""
         params = {"idx": idx}
         
-        root = self._make_request("getItemPosition", params)
+        root = self._make_request("getItemPosition", params, cache_key=idx, mod_date=mod_date)
         if not root:
             return None
         
@@ -442,36 +652,65 @@ class NaraiteoAPI:
         print(f"[채용직급] 공고 ID {idx}: {full_grade}")
         return position_data
     
-    def get_enriched_jobs(self, limit: int = 10) -> List[Dict]:
+    def _enrich_job(self, job: Dict) -> Dict:
+        """공고 1건에 상세정보와 첨부파일 정보를 보강"""
+        idx = job["idx"]
+        
+        mod_date = job.get("mod_date")
+        
+        # 상세정보로 기본정보 업데이트
+        detail = self.get_job_detail(idx, mod_date=mod_date)
+        if detail:
+            job.update({k: v for k, v in detail.items() if v})
+        
+        # 첨부파일 정보 추가 (선택 보강: 차단기가 열려 있으면 생략)
+        job["files"] = self.get_optional("getItemFile", self.get_job_files, idx, default=[],
+                                         mod_date=mod_date)
+        return job
+    
+    def get_optional(self, endpoint: str, fetch, idx: str, default=None, **kwargs):
+        """선택 보강 API 호출. 엔드포인트가 차단되었거나 연결에 실패하면 기본값을 반환한다."""
+        if not self.is_endpoint_available(endpoint):
+            return default
+        try:
+            return fetch(idx, **kwargs)
+        except APIConnectionError as exc:
+            print(f"[SKIP] 공고 ID {idx} {endpoint} 보강 생략: {exc}")
+            return default
+    
+    def enrich_jobs(self, jobs: List[Dict], max_workers: Optional[int] = None) -> List[Dict]:
+        """공고 목록을 병렬로 보강하고 원래 목록 순서대로 반환
+        
+        요청 속도는 호스트별 속도 제한기가 조절하므로 작업 수를 늘려도
+        나라일터 서버에 보내는 초당 요청 수는 늘어나지 않는다.
+        """
+        workers = min(max_workers or self.max_workers, len(jobs))
+        if workers <= 1:
+            return [self._enrich_job(job) for job in jobs]
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="naraiteo-enrich") as executor:
+            # map은 제출 순서대로 결과를 돌려주므로 목록 순서가 유지된다
+            return list(executor.map(self._enrich_job, jobs))
+    
+    def get_enriched_jobs(self, limit: int = 10, max_workers: Optional[int] = None) -> List[Dict]:
         """상세정보가 보강된 채용공고 목록"""
         # 1. 기본 목록 가져오기
         jobs = self.get_job_list(num_of_rows=min(limit, 100))
         
-        enriched_jobs = []
-        
-        for job in jobs[:limit]:
-            idx = job["idx"]
-            
-            # 2. 상세정보 보강
-            detail = self.get_job_detail(idx)
-            if detail:
-                # 상세정보로 기본정보 업데이트
-                job.update({k: v for k, v in detail.items() if v})
-            
-            # 3. 첨부파일 정보 추가
-            files = self.get_job_files(idx)
-            job["files"] = files
-            
-            enriched_jobs.append(job)
+        # 2. 상세정보/첨부파일 병렬 보강
+        enriched_jobs = self.enrich_jobs(jobs[:limit], max_workers=max_workers)
         
         print(f"[보강 완료] {len(enriched_jobs)}건의 완전한 채용공고 정보")
         return enriched_jobs
 
-
 def main():
     """테스트 실행"""
-    api = NaraiteoAPI()
-    
+    with NaraiteoAPI() as api:
+        run_smoke_test(api)
+
+
+def run_smoke_test(api: NaraiteoAPI):
+    """API 호출 흐름 점검"""
     print("=== 나라일터 API 테스트 ===")
     
     # 1. 기본 목록 조회 테스트
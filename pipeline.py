@@ -0,0 +1,253 @@
+"""
+단계별 생산자/소비자 파이프라인
+- 원천(source) -> 단계(stage)들 -> 최종 소비자(sink)를 크기 제한 큐로 연결
+- 단계마다 작업 스레드 수를 따로 두고, 다음 단계 큐가 가득 차면 앞 단계가 기다린다 (backpressure)
+- 단계가 겹쳐 동작하므로 한 항목의 상세 조회를 기다리는 동안에도 다음 항목의 목록 수신/보강이 계속된다
+- 어느 단계에서든 예외가 나면 새 항목 생성을 멈추고 큐를 비운 뒤 run()에서 그 예외를 다시 발생시킨다
+- drain()을 호출하면 새 항목 생성을 멈추고, 아직 시작하지 않은 항목은 leftover로 모아 다음 실행에 넘긴다
+- priority를 준 단계는 입력 큐를 우선순위 큐로 사용해 중요한 항목부터 처리한다
+- on_idle을 주면 sink 큐가 비어 있는 동안 sink 스레드에서 주기적으로 호출한다 (시간 기준 flush 등)
+- merge_sources()로 여러 원천을 동시에 읽어 하나의 원천으로 합칠 수 있다
+"""
+import itertools
+import queue
+import threading
+from typing import Callable, Iterable, List, Optional
+
+DEFAULT_QUEUE_SIZE = 100
+_DONE = object()
+_POLL_SECONDS = 0.1
+
+
+class _PriorityQueue(queue.PriorityQueue):
+    """key(item)이 작은 항목부터 꺼내는 입력 큐 (같은 순위는 들어온 순서, _DONE은 항상 마지막)"""
+
+    def __init__(self, maxsize: int, key: Callable):
+        super().__init__(maxsize)
+        self._key = key
+        self._seq = itertools.count()
+
+    def _put(self, item):
+        rank = (1,) if item is _DONE else (0, self._key(item))
+        super()._put((rank, next(self._seq), item))
+
+    def _get(self):
+        return super()._get()[2]
+
+
+class Stage:
+    """파이프라인 단계. func(item)이 None을 반환하면 그 항목은 다음 단계로 넘기지 않는다.
+
+    priority: 입력 큐 정렬 키 (작을수록 먼저 처리)
+    finish_on_drain: drain() 뒤에도 입력 큐의 항목을 계속 처리 (앞 단계 결과를 버리지 않을 때)
+    """
+
+    def __init__(self, name: str, func: Callable, workers: int = 1, queue_size: Optional[int] = None,
+                 priority: Optional[Callable] = None, finish_on_drain: bool = False):
+        self.name = name
+        self.func = func
+        self.workers = max(int(workers), 1)
+        self.queue_size = queue_size or max(self.workers * 2, 1)  # 이 단계 입력 큐 크기
+        self.priority = priority
+        self.finish_on_drain = finish_on_drain
+        self.processed = 0
+        self.passed = 0
+        self._lock = threading.Lock()
+        self._finished = 0
+
+    def _count(self, passed: bool):
+        with self._lock:
+            self.processed += 1
+            self.passed += passed
+
+    def _finish(self) -> bool:
+        """작업 스레드 종료 기록. 마지막 스레드이면 True"""
+        with self._lock:
+            self._finished += 1
+            return self._finished == self.workers
+
+    def _make_queue(self) -> queue.Queue:
+        if self.priority:
+            return _PriorityQueue(self.queue_size, self.priority)
+        return queue.Queue(maxsize=self.queue_size)
+
+
+class Pipeline:
+    """source의 항목을 stages 순서로 처리해 sink(호출 스레드)에서 소비
+
+    sink는 run()을 호출한 스레드에서만 실행되므로 Firestore 일괄 쓰기처럼 스레드 안전하지 않은
+    작업을 그대로 맡길 수 있다. on_idle도 같은 스레드에서 호출된다.
+    """
+
+    def __init__(self, source: Iterable, stages: List[Stage], sink: Callable,
+                 sink_queue_size: int = DEFAULT_QUEUE_SIZE, on_idle: Optional[Callable[[], None]] = None):
+        self.source = source
+        self.stages = stages
+        self.sink = sink
+        self.on_idle = on_idle
+        self.sink_queue_size = sink_queue_size
+        self.produced = 0
+        self.consumed = 0
+        self.leftover: List = []  # drain() 뒤 처리하지 않은 항목 (단계 입력 형태 그대로)
+        self._stop = threading.Event()
+        self._draining = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._error_lock = threading.Lock()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    @property
+    def draining(self) -> bool:
+        return self._draining.is_set()
+
+    def stop(self):
+        """새 항목 생성을 멈추고 처리 중인 항목은 버린다"""
+        self._stop.set()
+
+    def drain(self):
+        """새 항목 생성을 멈추고 이미 시작한 항목만 끝까지 처리한다 (시작 전 항목은 leftover로)"""
+        self._draining.set()
+
+    def _fail(self, error: BaseException):
+        with self._error_lock:
+            if self._error is None:
+                self._error = error
+        self._stop.set()
+
+    def _put(self, q: queue.Queue, item):
+        """큐가 가득 차면 기다리되, 중단되면 일반 항목은 버린다 (_DONE은 항상 전달)"""
+        while True:
+            if item is not _DONE and self._stop.is_set():
+                return
+            try:
+                q.put(item, timeout=_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+    def _run_source(self, out: queue.Queue):
+        try:
+            for item in self.source:
+                if self._stop.is_set():
+                    break
+                if self._draining.is_set():
+                    self.leftover.append(item)
+                    break
+                self.produced += 1
+                self._put(out, item)
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            close = getattr(self.source, "close", None)
+            if close:
+                close()
+            self._put(out, _DONE)
+
+    def _run_worker(self, stage: Stage, inbox: queue.Queue, out: queue.Queue):
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                inbox.put(_DONE)  # 같은 단계의 다른 작업 스레드도 종료하도록 되돌려 놓는다
+                break
+            if self._stop.is_set():
+                continue  # 중단되면 앞 단계가 끝날 때까지 큐만 비운다
+            if self._draining.is_set() and not stage.finish_on_drain:
+                self.leftover.append(item)
+                continue
+            try:
+                result = stage.func(item)
+            except BaseException as e:
+                self._fail(e)
+                continue
+            stage._count(result is not None)
+            if result is not None:
+                self._put(out, result)
+        if stage._finish():
+            self._put(out, _DONE)
+
+    def run(self):
+        queues = [stage._make_queue() for stage in self.stages]
+        queues.append(queue.Queue(maxsize=self.sink_queue_size))
+        threads = [threading.Thread(target=self._run_source, args=(queues[0],), name="pipeline-source", daemon=True)]
+        for i, stage in enumerate(self.stages):
+            for n in range(stage.workers):
+                threads.append(threading.Thread(target=self._run_worker, args=(stage, queues[i], queues[i + 1]),
+                                                name=f"pipeline-{stage.name}-{n}", daemon=True))
+        for thread in threads:
+            thread.start()
+
+        sink_queue = queues[-1]
+        while True:
+            try:
+                item = sink_queue.get(timeout=_POLL_SECONDS if self.on_idle else None)
+            except queue.Empty:
+                try:
+                    self.on_idle()
+                except BaseException as e:
+                    self._fail(e)
+                continue
+            if item is _DONE:
+                break
+            if self._stop.is_set():
+                continue
+            try:
+                self.sink(item)
+                self.consumed += 1
+            except BaseException as e:
+                self._fail(e)
+        for thread in threads:
+            thread.join()
+        if self._error is not None:
+            raise self._error
+        return self
+
+
+def merge_sources(sources: List[Iterable], queue_size: int = DEFAULT_QUEUE_SIZE):
+    """여러 원천을 각각의 스레드에서 동시에 읽어 들어오는 순서대로 넘기는 원천
+
+    소비자가 반복을 멈추면(close) 원천 스레드도 다음 항목에서 멈추고 각 원천을 닫는다.
+    원천에서 난 예외는 소비자 쪽에서 다시 발생시킨다.
+    """
+    merged: queue.Queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                merged.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read(source):
+        try:
+            for item in source:
+                if not put((False, item)):
+                    break
+        except BaseException as e:
+            put((True, e))
+        finally:
+            close = getattr(source, "close", None)
+            if close:
+                close()
+            put((True, _DONE))
+
+    threads = [threading.Thread(target=read, args=(source,), name=f"pipeline-merge-{n}", daemon=True)
+               for n, source in enumerate(sources)]
+    for thread in threads:
+        thread.start()
+    try:
+        remaining = len(threads)
+        while remaining:
+            is_control, item = merged.get()
+            if not is_control:
+                yield item
+            elif item is _DONE:
+                remaining -= 1
+            else:
+                raise item
+    finally:
+        stop.set()
@@ -0,0 +1,170 @@
+"""
+수집 제외 공고 기록 (tombstone)
+- 상세 조회 후 수집 기준에서 제외됐거나 data_cleanup.py가 삭제한 공고를 기록해
+  getList에 계속 나오더라도 매 실행마다 getItem을 다시 호출하지 않게 한다
+- 최근 기록은 idx -> [moddate, 제외일, 사유]로 정확히 보관하고, 오래된 기록은 Bloom filter로 옮겨 크기를 고정
+- 키에 moddate가 들어가므로 공고가 수정되면(마감일 연장 등) 다시 확인한다
+- Firestore sync_state/rejected_jobs 문서(로컬 .sync_state/rejected_jobs.json)에 저장.
+  바뀐 기록만 병합 저장하므로 동시에 실행된 동기화와 데이터 정리가 서로의 기록을 지우지 않는다
+"""
+import base64
+import hashlib
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from sync_state import date_key, load_state, merge_state
+
+REJECTED_JOBS_DOC = "rejected_jobs"
+REJECTED_RECENT_DAYS = 30  # 이 기간이 지난 정확한 기록은 Bloom filter로 옮긴다
+BLOOM_BITS = 1 << 20  # 128KiB, 약 10만 건에서 오탐률 1% 미만
+BLOOM_HASHES = 7
+BLOOM_CAPACITY = 100000  # 넘으면 오탐률이 커지므로 새 filter로 교체
+
+
+class BloomFilter:
+    """고정 크기 Bloom filter (압축해서 문서 한 개에 저장)"""
+
+    def __init__(self, bits: int = BLOOM_BITS, hashes: int = BLOOM_HASHES,
+                 data: Optional[bytes] = None, count: int = 0):
+        self.bits = bits
+        self.hashes = hashes
+        self.count = count
+        self.data = bytearray(data) if data else bytearray(bits // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.data[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.data[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def union(self, other: "BloomFilter"):
+        """같은 크기의 다른 filter에 들어 있는 키를 합친다 (다른 실행이 저장한 기록 보존)"""
+        if (other.bits, other.hashes) != (self.bits, self.hashes):
+            return
+        for i, byte in enumerate(other.data):
+            self.data[i] |= byte
+        self.count = max(self.count, other.count)
+
+    def to_dict(self) -> Dict:
+        return {
+            "bits": self.bits,
+            "hashes": self.hashes,
+            "count": self.count,
+            "data": base64.b64encode(zlib.compress(bytes(self.data))).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "BloomFilter":
+        if not data.get("data"):
+            return cls()
+        return cls(data.get("bits", BLOOM_BITS), data.get("hashes", BLOOM_HASHES),
+                   zlib.decompress(base64.b64decode(data["data"])), data.get("count", 0))
+
+
+def _bloom_key(idx: str, mod_date: str) -> str:
+    return f"{idx}:{mod_date}"
+
+
+class RejectedJobs:
+    """수집 제외 공고 집합
+
+    Bloom filter는 오탐이 있으므로 등록일이 수집 기준일(cutoff)보다 오래된 공고에만 적용한다.
+    새로 등록된 공고는 정확한 기록에 있을 때만 건너뛰므로 오탐으로 신규 공고를 놓치지 않는다.
+    """
+
+    def __init__(self, recent: Optional[Dict[str, list]] = None, bloom: Optional[BloomFilter] = None,
+                 loaded: bool = True):
+        self.recent = dict(recent or {})
+        self.bloom = bloom or BloomFilter()
+        self.loaded = loaded  # 조회 실패로 빈 기록이면 저장하지 않아 기존 문서를 보호
+        self.changes: Dict[str, Optional[list]] = {}  # 저장 전 변경분: idx -> 기록 (삭제는 None)
+        self.bloom_changed = False
+        self.bloom_reset = False  # 용량 초과로 새 filter를 시작함 (저장된 filter와 합치지 않는다)
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.changes) or self.bloom_changed
+
+    def __len__(self) -> int:
+        return len(self.recent)
+
+    def contains(self, job: Dict, cutoff: str = "") -> bool:
+        """이미 제외한 공고인지 (moddate가 바뀌었으면 False)"""
+        idx = str(job.get("idx"))
+        mod_date = job.get("mod_date") or ""
+        entry = self.recent.get(idx)
+        if entry is not None:
+            return not entry[0] or entry[0] == mod_date
+        reg_date = date_key(job.get("reg_date"))
+        return bool(cutoff and reg_date and reg_date < cutoff) and _bloom_key(idx, mod_date) in self.bloom
+
+    def add(self, job: Dict, today: str, reason: str = ""):
+        """제외 기록 (today: 'YYYYMMDD')"""
+        entry = [job.get("mod_date") or "", today, reason]
+        self.recent[str(job.get("idx"))] = entry
+        self.changes[str(job.get("idx"))] = entry
+
+    def discard(self, idx):
+        """다시 수집된 공고는 정확한 기록에서 제거 (Bloom filter에서는 지울 수 없다)"""
+        if self.recent.pop(str(idx), None) is not None:
+            self.changes[str(idx)] = None
+
+    def prune(self, today: str):
+        """REJECTED_RECENT_DAYS가 지난 기록을 Bloom filter로 옮긴다"""
+        try:
+            limit = (datetime.strptime(today, "%Y%m%d") - timedelta(days=REJECTED_RECENT_DAYS)).strftime("%Y%m%d")
+        except ValueError:
+            return
+        expired = [idx for idx, entry in self.recent.items() if entry[1] < limit]
+        if not expired:
+            return
+        if self.bloom.count + len(expired) > BLOOM_CAPACITY:
+            print(f"[REJECTED] Bloom filter 용량 초과 ({self.bloom.count}건) - 새로 시작")
+            self.bloom = BloomFilter()
+            self.bloom_reset = True
+        for idx in expired:
+            self.bloom.add(_bloom_key(idx, self.recent.pop(idx)[0]))
+            self.changes[idx] = None
+        self.bloom_changed = True
+
+    def to_dict(self) -> Dict:
+        return {"recent": self.recent, "bloom": self.bloom.to_dict()}
+
+
+def load_rejected_jobs(db) -> RejectedJobs:
+    try:
+        data = load_state(db, REJECTED_JOBS_DOC)
+        return RejectedJobs(data.get("recent"), BloomFilter.from_dict(data.get("bloom") or {}))
+    except Exception as e:
+        print(f"[ERROR] 수집 제외 기록 조회 오류: {e}")
+        return RejectedJobs(loaded=False)
+
+
+def save_rejected_jobs(db, rejected: RejectedJobs, today: Optional[str] = None):
+    """오래된 기록을 정리한 뒤 변경이 있을 때만 저장"""
+    if today:
+        rejected.prune(today)
+    if not rejected.loaded or not rejected.dirty:
+        return
+    try:
+        changes = {"recent": rejected.changes}
+        if rejected.bloom_changed:
+            if not rejected.bloom_reset:
+                # Bloom filter는 키 단위로 병합할 수 없으므로 저장된 filter와 비트를 합쳐 쓴다
+                rejected.bloom.union(BloomFilter.from_dict(load_state(db, REJECTED_JOBS_DOC).get("bloom") or {}))
+            changes["bloom"] = rejected.bloom.to_dict()
+        merge_state(db, REJECTED_JOBS_DOC, changes)
+        rejected.changes = {}
+        rejected.bloom_changed = rejected.bloom_reset = False
+        print(f"[REJECTED] 수집 제외 기록 저장 (최근 {len(rejected)}건, Bloom {rejected.bloom.count}건)")
+    except Exception as e:
+        print(f"[WARNING] 수집 제외 기록 저장 오류: {e}")
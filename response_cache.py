@@ -0,0 +1,93 @@
+"""
+나라일터 API 응답 로컬 캐시
+- getItem / getItemFile / getItemPosition 원본 XML을 (endpoint, idx) 단위로 SQLite에 저장
+- TTL이 지났거나 목록의 moddate가 저장 당시와 다르면 무효화
+- 원본 XML을 보관하므로 파싱 로직이 바뀌어도 네트워크 없이 다시 파싱할 수 있다
+"""
+import os
+import time
+import sqlite3
+import threading
+from typing import Optional
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+RESPONSE_CACHE_PATH = os.path.join(REPO_ROOT, ".cache", "naraiteo_responses.sqlite3")
+RESPONSE_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # 7일
+
+
+class ResponseCache:
+    """(endpoint, idx) -> 원본 XML 응답 캐시 (스레드 안전)"""
+
+    def __init__(self, path: str = RESPONSE_CACHE_PATH, ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                endpoint TEXT NOT NULL,
+                idx TEXT NOT NULL,
+                mod_date TEXT NOT NULL DEFAULT '',
+                fetched_at REAL NOT NULL,
+                body BLOB NOT NULL,
+                PRIMARY KEY (endpoint, idx)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, endpoint: str, idx: str, mod_date: Optional[str] = None) -> Optional[bytes]:
+        """유효한 캐시 응답 반환. 만료되었거나 moddate가 바뀌었으면 None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mod_date, fetched_at, body FROM responses WHERE endpoint = ? AND idx = ?",
+                (endpoint, str(idx)),
+            ).fetchone()
+            # 여러 보강 스레드가 동시에 조회하므로 적중/실패 횟수도 잠금 안에서 센다
+            if row is None:
+                self.misses += 1
+                return None
+            cached_mod_date, fetched_at, body = row
+            expired = self.ttl_seconds is not None and time.time() - fetched_at > self.ttl_seconds
+            modified = bool(mod_date) and bool(cached_mod_date) and mod_date != cached_mod_date
+            if expired or modified:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return bytes(body)
+
+    def put(self, endpoint: str, idx: str, body: bytes, mod_date: Optional[str] = None):
+        """응답 저장 (같은 키는 덮어쓰기)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (endpoint, idx, mod_date, fetched_at, body) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (endpoint, str(idx), mod_date or "", time.time(), sqlite3.Binary(body)),
+            )
+            self._conn.commit()
+
+    def invalidate(self, endpoint: str, idx: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE endpoint = ? AND idx = ?", (endpoint, str(idx)))
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """TTL이 지난 응답 삭제 후 삭제 건수 반환"""
+        if self.ttl_seconds is None:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE fetched_at < ?", (time.time() - self.ttl_seconds,)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
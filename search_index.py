@@ -0,0 +1,148 @@
+"""
+채용공고 검색 색인
+- 제목/기관명/직급/근무지역을 음절 bigram과 초성(unigram, bigram) 키로 색인한 역색인 생성
+- generate_static_pages.py가 정적 JSON으로 내보내고 index.html이 같은 규칙으로 조회한다
+- 입력 중인 글자("행저" -> "행정")나 초성 검색("ㅎㅈ")은 색인으로 후보를 좁힌 뒤 자모 단위로 확인
+"""
+from typing import Dict, Iterable, List, Optional, Sequence
+
+SEARCH_FIELDS = ('title', 'dept_name', 'grade', 'work_region')
+SEARCH_INDEX_VERSION = 1
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+              "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+# 겹모음/겹받침은 입력 순서대로 풀어 써서 "고" -> "과", "목" -> "몫" 같은 입력 중간 상태도 일치시킨다
+_COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+
+def normalize(text: Optional[str]) -> str:
+    """소문자로 바꾸고 공백을 모두 제거 (띄어쓰기와 무관하게 검색)"""
+    return "".join(str(text or "").lower().split())
+
+
+def _is_syllable(char: str) -> bool:
+    return _HANGUL_BASE <= ord(char) <= _HANGUL_LAST
+
+
+def is_hangul(char: str) -> bool:
+    """완성형 음절 또는 호환용 자모(ㄱ-ㅣ)인지"""
+    return _is_syllable(char) or 0x3131 <= ord(char) <= 0x3163
+
+
+def choseong(text: str) -> str:
+    """음절을 초성으로 바꾼 문자열 (한글이 아닌 문자는 그대로)"""
+    return "".join(
+        _CHOSEONG[(ord(char) - _HANGUL_BASE) // 588] if _is_syllable(char) else char
+        for char in text
+    )
+
+
+def jamo(text: str) -> str:
+    """음절을 자모로 풀어 쓴 문자열 (겹모음/겹받침도 분해)"""
+    result = []
+    for char in text:
+        if _is_syllable(char):
+            code = ord(char) - _HANGUL_BASE
+            parts = _CHOSEONG[code // 588] + _JUNGSEONG[(code % 588) // 28] + _JONGSEONG[code % 28]
+        else:
+            parts = char
+        result.append("".join(_COMPOUND_JAMO.get(part, part) for part in parts))
+    return "".join(result)
+
+
+def bigrams(text: str) -> List[str]:
+    return [text[i:i + 2] for i in range(len(text) - 1)]
+
+
+def _add(postings: Dict[str, List[int]], key: str, doc: int):
+    docs = postings.setdefault(key, [])
+    if not docs or docs[-1] != doc:
+        docs.append(doc)
+
+
+def build_search_index(jobs: Sequence[Dict], fields: Sequence[str] = SEARCH_FIELDS) -> Dict:
+    """jobs 순서(목록 행 번호)를 문서 번호로 하는 역색인 생성
+
+    - g: 음절 bigram -> 문서 번호 목록
+    - c: 초성 unigram/bigram -> 문서 번호 목록
+    문서 번호 목록은 오름차순이며 크기를 줄이기 위해 차분(delta)으로 저장한다.
+    """
+    grams: Dict[str, List[int]] = {}
+    initials: Dict[str, List[int]] = {}
+    for doc, job in enumerate(jobs):
+        for field in fields:
+            text = normalize(job.get(field))
+            for gram in bigrams(text):
+                _add(grams, gram, doc)
+            initial = choseong(text)
+            for key in set(initial) | set(bigrams(initial)):
+                _add(initials, key, doc)
+
+    def encode(postings):
+        encoded = {}
+        for key in sorted(postings):
+            docs = sorted(set(postings[key]))
+            encoded[key] = [docs[0]] + [b - a for a, b in zip(docs, docs[1:])]
+        return encoded
+
+    return {
+        "version": SEARCH_INDEX_VERSION,
+        "fields": list(fields),
+        "count": len(jobs),
+        "g": encode(grams),
+        "c": encode(initials),
+    }
+
+
+def _decode(deltas: Iterable[int]) -> List[int]:
+    docs, total = [], 0
+    for delta in deltas:
+        total += delta
+        docs.append(total)
+    return docs
+
+
+def lookup_keys(query: str):
+    """질의 -> (색인 종류, 키 목록, 확인 방식). index.html의 searchWithIndex와 같은 규칙."""
+    if not query:
+        return None, [], None
+    if all(0x3131 <= ord(char) <= 0x314E for char in query):
+        # 초성만으로 된 질의 ("ㅎㅈ")
+        return "c", (bigrams(query) or [query]), "choseong"
+    # 마지막 글자는 입력 중일 수 있으므로 색인 조회에서 빼고 자모 단위로 확인한다
+    stable = query[:-1] if is_hangul(query[-1]) else query
+    if len(stable) >= 2:
+        return "g", bigrams(stable), "jamo"
+    return "c", [choseong(stable or query)[0]], "jamo"
+
+
+def search(index: Dict, jobs: Sequence[Dict], query: str) -> List[int]:
+    """질의와 일치하는 문서 번호 목록 (목록 순서). 참조 구현 및 서버 측 검색용."""
+    query = normalize(query)
+    kind, keys, mode = lookup_keys(query)
+    if kind is None:
+        return list(range(len(jobs)))
+    candidates = None
+    for key in keys:
+        docs = set(_decode(index[kind].get(key, ())))
+        candidates = docs if candidates is None else candidates & docs
+        if not candidates:
+            return []
+
+    target = query if mode == "choseong" else jamo(query)
+    fields = index.get("fields", SEARCH_FIELDS)
+    matches = []
+    for doc in sorted(candidates):
+        texts = [normalize(jobs[doc].get(field)) for field in fields]
+        converted = [choseong(text) if mode == "choseong" else jamo(text) for text in texts]
+        if any(target in text for text in converted):
+            matches.append(doc)
+    return matches
@@ -0,0 +1,566 @@
+"""
+나라일터 -> Firestore 동기화 엔진
+- 목록 조회 -> 중복/날짜 필터 -> 상세 조회 -> 첨부파일·채용직급 병렬 조회 -> 일괄 저장을 파이프라인 단계로 연결
+- auto_sync_scheduler.py(증분, 4개 API 보강)와 auto_sync_scheduler_v2.py(신규만, 첨부파일까지)는
+  SyncConfig만 다르게 주는 얇은 실행 스크립트다
+- ID 색인, 수집 제외 기록, 워터마크는 저장이 확정된 문서만 반영한다
+- 시간 예산(time_budget)을 주면 마감 전에 새 작업을 멈추고 남은 공고는 다음 실행으로 넘긴다.
+  상세 조회는 최신 등록일·임박 마감 공고부터 한다
+- 진행 상태(끝낸 페이지, 아직 저장하지 못한 공고)는 sync_state 체크포인트 문서에 남겨 연결 오류나
+  시간 예산으로 멈춰도 다음 실행이 이어서 처리한다. 백필 모드는 totalCount로 전체 페이지를 병렬 조회한다
+- 카테고리(기관구분, 공고유형)마다 목록을 동시에 읽고 워터마크와 체크포인트를 따로 둔다.
+  상세 조회 이후 단계와 ID 색인·제외 기록은 모든 카테고리가 함께 쓴다
+"""
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+
+from firestore_writer import BatchWriter
+from job_index import load_job_index, save_job_index
+from job_stats import URGENT_DAYS
+from naraiteo_api import DEFAULT_CATEGORY, ENRICH_MAX_WORKERS
+from pipeline import Pipeline, Stage, merge_sources
+from rejected_jobs import load_rejected_jobs, save_rejected_jobs
+from sync_state import (CHECKPOINT_DOC, WATERMARK_DOC, SyncCheckpoint, category_state_name, date_key,
+                        load_checkpoint, load_watermark, save_checkpoint, save_watermark)
+
+# 단계별 동시 작업 수: 목록 스트리밍 1 + 상세 3 + 보강 2x2(첨부파일/채용직급 동시) = 커넥션 풀(8)
+DETAIL_WORKERS = max(ENRICH_MAX_WORKERS // 2 - 1, 1)
+ENRICH_WORKERS = max(ENRICH_MAX_WORKERS // 4, 1)
+STAGE_QUEUE_SIZE = 100  # 단계 사이 큐 크기 (목록 한 페이지)
+ROWS_PER_PAGE = 100  # getList 최대치
+RETENTION_DAYS = 30
+STOP_MARGIN_SECONDS = 30  # 시간 예산 중 처리 중인 공고 마무리와 저장에 남겨둘 시간
+LIST_WORKERS = 2  # 백필 모드 목록 페이지 동시 조회 수
+CHECKPOINT_INTERVAL_SECONDS = 30  # 실행 중 체크포인트 저장 간격 (강제 종료 대비)
+
+
+class SyncConfig:
+    """동기화 실행 설정
+
+    criteria(job, today, cutoff_date) -> (수집 여부, 사유)
+    build_document(item, now) -> (저장할 문서, merge 여부)
+    item은 basic_info, detail_info, files, position, reason, is_update를 가진 dict다.
+    """
+
+    def __init__(self, name: str, criteria: Callable, build_document: Callable,
+                 max_pages: int = 2, rows_per_page: int = ROWS_PER_PAGE,
+                 incremental: bool = True, fetch_files: bool = True, fetch_position: bool = True,
+                 files_default=None, detail_workers: int = DETAIL_WORKERS,
+                 enrich_workers: int = ENRICH_WORKERS, queue_size: int = STAGE_QUEUE_SIZE,
+                 time_budget: Optional[float] = None, stop_margin: float = STOP_MARGIN_SECONDS,
+                 backfill: bool = False, list_workers: int = LIST_WORKERS, checkpoint: str = CHECKPOINT_DOC,
+                 categories=(DEFAULT_CATEGORY,)):
+        self.name = name
+        self.criteria = criteria
+        self.build_document = build_document
+        self.max_pages = max_pages
+        self.rows_per_page = rows_per_page
+        self.incremental = incremental  # 워터마크 기반 증분 모드 (수정된 기존 공고도 다시 보강)
+        self.fetch_files = fetch_files
+        self.fetch_position = fetch_position
+        self.files_default = files_default  # 첨부파일 조회를 생략했을 때 값 (None이면 부분 데이터로 표시)
+        self.detail_workers = detail_workers
+        self.enrich_workers = enrich_workers
+        self.queue_size = queue_size
+        self.time_budget = time_budget  # 실행 시간 예산(초), None이면 제한 없음
+        self.stop_margin = stop_margin
+        self.backfill = backfill  # 전체 페이지 조회 (max_pages 무시, 끝낸 페이지는 다음 실행에서 건너뜀)
+        self.list_workers = list_workers
+        self.checkpoint = checkpoint  # 체크포인트 문서 이름 (실행 방식마다 따로 둔다)
+        self.categories = tuple(categories)  # naraiteo_api.JOB_CATEGORIES 키
+
+
+class SyncResult:
+    def __init__(self):
+        self.pages = 0
+        self.listed = 0
+        self.skipped = 0  # 이미 저장된 공고
+        self.prefiltered = 0  # 목록 날짜로 제외
+        self.rejected = 0  # 제외 기록으로 건너뜀
+        self.filtered = 0  # 상세 조회 후 제외
+        self.collected = 0
+        self.written = 0
+        self.failed = 0
+        self.aborted = False  # 예외로 중단됨 (워터마크를 전진시키지 않음)
+        self.timed_out = False  # 시간 예산에 도달해 새 작업을 멈춤
+        self.carried = 0  # 이전 실행에서 넘어온 공고
+        self.leftover = 0  # 다음 실행으로 넘긴 공고
+        self.reached_watermark = False
+        self.listed_all = False  # 모든 카테고리의 목록을 끝까지 읽음
+        self.errors: Dict[str, Exception] = {}  # 목록 조회에 실패한 카테고리
+
+
+class CategoryState:
+    """카테고리별 목록 진행 상태: 증분 커서(워터마크), 체크포인트, 페이지별 남은 공고 수"""
+
+    def __init__(self, key: str, watermark_doc: str, checkpoint_doc: str):
+        self.key = key
+        self.watermark_doc = watermark_doc
+        self.checkpoint_doc = checkpoint_doc
+        self.watermark = None
+        self.checkpoint: Optional[SyncCheckpoint] = None
+        self.page_open: Dict[Optional[int], int] = {}
+        self.listed_pages = set()
+        self.pages = 0
+        self.listed = 0
+        self.carried = 0
+        self.reached_watermark = False
+        self.listed_all = False
+        self.error: Optional[Exception] = None
+        self.checkpoint_saved_at = time.monotonic()
+
+
+class SyncEngine:
+    """SyncConfig에 따라 한 번의 동기화를 실행"""
+
+    def __init__(self, db, api, config: SyncConfig, today: Optional[datetime] = None):
+        self.db = db
+        self.api = api
+        self.config = config
+        self.today = today or datetime.now()
+        self.cutoff_date = self.today - timedelta(days=RETENTION_DAYS)
+        self.today_key = self.today.strftime('%Y%m%d')
+        self.cutoff_key = self.cutoff_date.strftime('%Y%m%d')
+        self.urgent_key = (self.today + timedelta(days=URGENT_DAYS)).strftime('%Y%m%d')
+        self.started = time.monotonic()
+        self.result = SyncResult()
+        self.job_index = None
+        self.rejected = None
+        self.existing_ids = set()
+        self.categories: Dict[str, CategoryState] = {
+            key: CategoryState(key,
+                               category_state_name(WATERMARK_DOC, key, DEFAULT_CATEGORY),
+                               category_state_name(config.checkpoint, key, DEFAULT_CATEGORY))
+            for key in config.categories
+        }
+        # 목록에서 읽었지만 아직 끝나지 않은 공고: idx -> (카테고리, 페이지, 공고). 이월 공고의 페이지는 None
+        self._open: Dict[str, tuple] = {}
+        # 필터 단계(작업 스레드)와 저장 콜백(호출 스레드)이 함께 갱신하는 상태 보호
+        self._lock = threading.Lock()
+        self._side_pool: Optional[ThreadPoolExecutor] = None
+
+    # ---- 상태 로드/저장 ----
+
+    def load_state(self):
+        self.job_index = load_job_index(self.db)
+        self.existing_ids = self.job_index.id_set()
+        self.rejected = load_rejected_jobs(self.db)
+        for state in self.categories.values():
+            state.watermark = load_watermark(self.db, state.watermark_doc) if self.config.incremental else None
+            state.checkpoint = load_checkpoint(self.db, state.checkpoint_doc)
+            if not self.config.backfill:
+                state.checkpoint.pages_done = set()  # 증분 실행은 매번 최신 페이지부터 다시 읽는다
+        print(f"[CACHE] 기존 게시글 {len(self.existing_ids)}개 캐시 완료")
+
+    def save_state(self):
+        save_job_index(self.db, self.job_index)
+        save_rejected_jobs(self.db, self.rejected, self.today_key)
+        with self._lock:
+            self.result.leftover = len(self._open)
+        for state in self.categories.values():
+            self.save_checkpoint(state, final=True)
+            self.finish_watermark(state)
+
+    def save_checkpoint(self, state: CategoryState, final: bool = False):
+        """끝낸 페이지와 아직 저장하지 못한 공고를 카테고리 체크포인트로 저장
+
+        백필은 끝나지 않은 페이지를 다음 실행에서 다시 읽으므로 이월 공고만 pending에 남기고,
+        증분 실행은 워터마크 아래로 밀려날 수 있으므로 남은 공고를 모두 pending에 남긴다.
+        """
+        checkpoint = state.checkpoint
+        if not checkpoint.loaded:
+            if final:
+                print(f"[WARNING] {state.key} 체크포인트를 읽지 못해 저장하지 않음 (기존 문서 유지)")
+            return
+        with self._lock:
+            open_jobs = [(page, job) for key, page, job in self._open.values() if key == state.key]
+            pending = [job for page, job in open_jobs if page is None or not self.config.backfill]
+            checkpoint.pending = pending
+            if final and self.config.backfill and state.listed_all and not open_jobs:
+                print(f"[CHECKPOINT] {state.key} 백필 완료 ({len(checkpoint.pages_done)}페이지) - 체크포인트 초기화")
+                checkpoint.restart(0, 0, "")
+            # 다른 스레드가 진행 상태를 계속 갱신하므로 잠금 안에서 복사본을 만들어 저장
+            snapshot = SyncCheckpoint.from_dict(checkpoint.to_dict())
+        state.checkpoint_saved_at = time.monotonic()
+        if not snapshot.stored and not checkpoint.stored:
+            return  # 저장할 진행 상태도, 지울 진행 상태도 없음
+        try:
+            save_checkpoint(self.db, snapshot, state.checkpoint_doc)
+            checkpoint.stored = snapshot.stored
+            if final:
+                if pending:
+                    print(f"[CHECKPOINT] {state.key}: 처리하지 못한 게시글 {len(pending)}개를 다음 실행으로 넘김")
+                if self.config.backfill and checkpoint.pages_done:
+                    print(f"[CHECKPOINT] {state.key} 백필 진행: {len(checkpoint.pages_done)}페이지 완료 (커서 {checkpoint.cursor})")
+        except Exception as e:
+            print(f"[WARNING] 체크포인트 저장 오류 ({state.key}): {e}")
+
+    def _state(self, job: Dict) -> CategoryState:
+        """공고의 카테고리 상태 (category가 없는 이전 공고는 기본 카테고리)"""
+        state = self.categories.get(job.get('category') or DEFAULT_CATEGORY)
+        return state or next(iter(self.categories.values()))
+
+    def _track(self, state: CategoryState, page: Optional[int], job: Dict) -> bool:
+        """목록에서 읽은 공고를 진행 중으로 기록. 이미 진행 중인 공고(이월/중복)면 False"""
+        with self._lock:
+            if job['idx'] in self._open:
+                return False
+            self._open[job['idx']] = (state.key, page, job)
+            state.page_open[page] = state.page_open.get(page, 0) + 1
+        return True
+
+    def _close(self, idx: str):
+        """공고 처리 완료 (저장, 제외, 건너뜀). 페이지의 공고가 모두 끝나면 그 페이지를 완료로 기록"""
+        with self._lock:
+            entry = self._open.pop(idx, None)
+            if entry is None:
+                return
+            state, page = self.categories[entry[0]], entry[1]
+            state.page_open[page] -= 1
+            if page is not None and not state.page_open[page] and page in state.listed_pages:
+                state.checkpoint.pages_done.add(page)
+
+    def _page_listed(self, state: CategoryState, page: int):
+        with self._lock:
+            state.listed_pages.add(page)
+            if not state.page_open.get(page):
+                state.checkpoint.pages_done.add(page)
+        if time.monotonic() - state.checkpoint_saved_at >= CHECKPOINT_INTERVAL_SECONDS:
+            self.save_checkpoint(state)
+
+    def finish_watermark(self, state: CategoryState):
+        """증분 동기화 워터마크 저장: 저장 실패 없이 목록을 끝까지 처리했을 때만 최고 수위를 전진시킨다.
+
+        시간 예산으로 멈췄거나 목록 조회에 실패한 카테고리는 아직 읽지 않은 (더 오래된) 목록이 남아
+        있으므로 워터마크를 그대로 둔다.
+        """
+        watermark = state.watermark
+        if watermark is None:
+            return
+        if not watermark.loaded:
+            print(f"[WARNING] {state.key} 워터마크를 읽지 못해 저장하지 않음 (기존 문서 유지)")
+            return
+        if (self.result.failed == 0 and not self.result.aborted and not self.result.timed_out
+                and state.error is None):
+            watermark.commit()
+        watermark.prune(self.today_key, self.cutoff_key)
+        try:
+            save_watermark(self.db, watermark, state.watermark_doc)
+            print(f"[WATERMARK] {state.key} 저장 완료 (등록일 {watermark.reg_date or '-'}, idx {watermark.idx or '-'}, 추적 {len(watermark.known)}건)")
+        except Exception as e:
+            print(f"[WARNING] 워터마크 저장 오류: {e}")
+
+    def _observe(self, job: Dict):
+        """처리가 끝난 공고를 카테고리 워터마크에 기록 (잠금 안에서 호출)"""
+        watermark = self._state(job).watermark
+        if watermark:
+            watermark.observe(job)
+
+    def _finish(self, job: Dict):
+        """API 호출 없이 끝난 공고: 워터마크에 기록하고 진행 중 목록에서 제거"""
+        with self._lock:
+            self._observe(job)
+        self._close(job['idx'])
+
+    # ---- 파이프라인 단계 ----
+
+    def priority(self, item: Dict):
+        """상세 조회 순서: 마감 임박(D-0~D-3) 공고, 최신 등록일, 빠른 마감일 순"""
+        job = item['basic_info']
+        reg_date = date_key(job.get('reg_date'))
+        end_date = date_key(job.get('end_date')) or "99999999"
+        urgent = self.today_key <= end_date <= self.urgent_key
+        return (not urgent, -int(reg_date or 0), end_date)
+
+    def list_jobs(self):
+        """원천: 카테고리마다 이월된 공고를 먼저 넘기고 목록 페이지를 읽는다 (여러 카테고리는 동시에)"""
+        sources = [self._list_category(state) for state in self.categories.values()]
+        if len(sources) == 1:
+            yield from sources[0]
+        else:
+            yield from merge_sources(sources, self.config.queue_size)
+
+    def _list_category(self, state: CategoryState):
+        """한 카테고리의 목록. 조회에 실패해도 다른 카테고리는 계속 진행한다."""
+        carried = state.checkpoint.pending
+        if carried:
+            print(f"\n[CHECKPOINT] {state.key}: 이전 실행에서 넘어온 게시글 {len(carried)}개 먼저 처리")
+        for job in carried:
+            if self._track(state, None, job):
+                state.carried += 1
+                yield job
+        try:
+            if self.config.backfill:
+                yield from self._list_all_pages(state)
+            else:
+                yield from self._list_recent_pages(state)
+        except Exception as e:
+            state.error = e
+            print(f"[ERROR] {state.key} 목록 조회 실패: {e}")
+
+    def _list_recent_pages(self, state: CategoryState):
+        """최신 max_pages 페이지를 스트리밍으로 읽는다 (워터마크 이전 게시글에서 중단)"""
+        watermark = state.watermark
+        for page_no in range(1, self.config.max_pages + 1):
+            print(f"\n[API] {state.key} 페이지 {page_no}/{self.config.max_pages} 조회 중...")
+            page_seen = 0
+            for job in self.api.iter_job_list(page_no=page_no, num_of_rows=self.config.rows_per_page,
+                                              category=state.key):
+                # 증분 모드: 워터마크 이전 게시글부터는 이미 처리한 범위
+                if watermark and watermark.reached(job):
+                    state.reached_watermark = True
+                    break
+                page_seen += 1
+                state.listed += 1
+                if self._track(state, page_no, job):
+                    yield job
+            state.pages = page_no
+            self._page_listed(state, page_no)
+            if page_seen == 0 and not state.reached_watermark:
+                print(f"   {state.key} 페이지 {page_no}: 게시글 없음, 수집 종료")
+                break
+            print(f"   {state.key} 페이지 {page_no}: {page_seen}개 게시글 확인")
+            if state.reached_watermark:
+                print(f"   [WATERMARK] {state.key}: 등록일 {watermark.cutoff()} 이전 게시글 도달 - 추가 페이지 스킵")
+                break
+        state.listed_all = True
+
+    def _list_all_pages(self, state: CategoryState):
+        """백필: totalCount로 전체 페이지 수를 구해 끝내지 않은 페이지만 병렬로 읽는다"""
+        rows = self.config.rows_per_page
+        total = self.api.get_list_total_count(category=state.key)
+        if not total:
+            print(f"[BACKFILL] {state.key}: 전체 건수를 알 수 없어 백필 중단")
+            return
+        checkpoint = state.checkpoint
+        with self._lock:
+            if not checkpoint.matches(total, rows):
+                if checkpoint.pages_done:
+                    print(f"[CHECKPOINT] {state.key}: 전체 건수 변경 ({checkpoint.total_count} -> {total}) - 페이지를 처음부터 다시 확인")
+                checkpoint.restart(total, rows, self.today_key)
+            pages = [page for page in range(1, math.ceil(total / rows) + 1) if page not in checkpoint.pages_done]
+        print(f"\n[BACKFILL] {state.key}: 전체 {total}개, {math.ceil(total / rows)}페이지 중 {len(pages)}페이지 남음 "
+              f"(커서 {checkpoint.cursor}, 동시 조회 {self.config.list_workers})")
+
+        for page_no, jobs in self._fetch_pages(state, pages):
+            state.pages += 1
+            state.listed += len(jobs)
+            for job in jobs:
+                if self._track(state, page_no, job):
+                    yield job
+            self._page_listed(state, page_no)
+        state.listed_all = True
+
+    def _fetch_pages(self, state: CategoryState, pages):
+        """목록 페이지를 list_workers개씩 동시에 받아 끝나는 순서대로 (페이지, 공고 목록)을 넘긴다"""
+        remaining = deque(pages)
+        running = {}
+        window = self.config.list_workers * 2  # 뒤 단계가 밀리면 그 이상 미리 받지 않는다
+        with ThreadPoolExecutor(max_workers=self.config.list_workers,
+                                thread_name_prefix=f"sync-list-{state.key}") as pool:
+            try:
+                while remaining or running:
+                    while remaining and len(running) < window:
+                        page_no = remaining.popleft()
+                        future = pool.submit(self.api.get_job_list, page_no, self.config.rows_per_page,
+                                             category=state.key)
+                        running[future] = page_no
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield running.pop(future), future.result()
+            finally:
+                for future in running:
+                    future.cancel()
+
+    def filter_job(self, job: Dict) -> Optional[Dict]:
+        """API 호출 없이 판단할 수 있는 공고를 걸러낸다 (중복, 목록 날짜, 제외 기록)"""
+        is_update = False
+        if job['idx'] in self.existing_ids:
+            watermark = self._state(job).watermark
+            if watermark and watermark.changed(job):
+                is_update = True  # 수정된 기존 게시글은 다시 보강
+            else:
+                self.result.skipped += 1
+                self._finish(job)
+                return None
+
+        # 목록에 이미 있는 등록일/마감일로 먼저 판정 (날짜가 없을 때만 상세 조회로 판단)
+        if len(date_key(job.get('reg_date'))) == 8 and not self.config.criteria(job, self.today, self.cutoff_date)[0]:
+            self.result.prefiltered += 1
+            self._finish(job)
+            return None
+
+        # 이전 실행에서 제외했거나 데이터 정리로 삭제한 공고 (moddate가 같으면 다시 확인하지 않음)
+        with self._lock:
+            rejected = self.rejected.contains(job, self.cutoff_key)
+        if rejected:
+            self.result.rejected += 1
+            self._finish(job)
+            return None
+        return {'basic_info': job, 'is_update': is_update}
+
+    def fetch_detail(self, item: Dict) -> Optional[Dict]:
+        """상세 조회 후 수집 기준 확인"""
+        job = item['basic_info']
+        detail = self.api.get_job_detail(job['idx'], mod_date=job.get('mod_date'))
+        if not detail:
+            with self._lock:
+                self.result.filtered += 1
+            self._close(job['idx'])
+            return None
+
+        is_valid, reason = self.config.criteria(detail, self.today, self.cutoff_date)
+        with self._lock:
+            if not is_valid:
+                self.result.filtered += 1
+                self.rejected.add(job, self.today_key, reason)
+                self._observe(job)
+            else:
+                self.rejected.discard(job['idx'])
+                self.result.collected += 1
+        if not is_valid:
+            self._close(job['idx'])
+            return None
+        print(f"     [{'UPDATE' if item['is_update'] else 'NEW'}] {job['title'][:30]}... ({reason})")
+        return {**item, 'detail_info': detail, 'reason': reason}
+
+    def enrich(self, item: Dict) -> Dict:
+        """첨부파일과 채용직급을 동시에 조회 (선택 보강: 차단된 엔드포인트는 건너뜀)"""
+        job = item['basic_info']
+        mod_date = job.get('mod_date')
+        position_future = None
+        if self.config.fetch_position:
+            position_future = self._side_pool.submit(
+                self.api.get_optional, 'getItemPosition', self.api.get_job_position, job['idx'],
+                default=False, mod_date=mod_date)
+        files = self.config.files_default
+        if self.config.fetch_files:
+            files = self.api.get_optional('getItemFile', self.api.get_job_files, job['idx'],
+                                          default=self.config.files_default, mod_date=mod_date)
+        position = position_future.result() if position_future else False
+        return {**item, 'files': files, 'position': position}
+
+    def persist(self, writer: BatchWriter, item: Dict):
+        """저장 예약 (호출 스레드). ID 색인과 워터마크는 배치 커밋이 성공한 문서만 반영."""
+        try:
+            document, merge = self.config.build_document(item, datetime.now())
+        except Exception as e:
+            self.result.failed += 1
+            print(f"   [ERROR] 게시글 {item['basic_info']['idx']} 처리 오류: {e}")
+            return
+        # 기관 유형 탭에서 조회할 수 있도록 카테고리를 함께 저장
+        document = {**document, 'category': item['basic_info'].get('category') or DEFAULT_CATEGORY}
+        record = {**item['basic_info'], **document}
+
+        def on_success(record=record):
+            with self._lock:
+                self.job_index.add(record['idx'], record.get('mod_date'))
+                self._observe(record)
+            self._close(record['idx'])
+        writer.set(item['basic_info']['idx'], document, merge=merge, on_success=on_success)
+
+    # ---- 실행 ----
+
+    def run(self) -> SyncResult:
+        config = self.config
+        print("[FILTER] 수집 기준:")
+        print(f"   - 기준일: {self.today.strftime('%Y-%m-%d')}")
+        print(f"   - 30일 전: {self.cutoff_date.strftime('%Y-%m-%d')}")
+        print("   - 등록일 30일 이내 OR 마감일 미도과 게시글 수집")
+        if config.backfill:
+            print(f"   - 백필: 전체 페이지 확인 (페이지당 {config.rows_per_page}개)")
+        else:
+            print(f"   - 최대 {config.max_pages}페이지 확인 (약 {config.max_pages * config.rows_per_page}개)")
+        if config.time_budget:
+            print(f"   - 시간 예산: {config.time_budget:.0f}초 (마무리 {config.stop_margin:.0f}초)")
+        print(f"   - 카테고리: {', '.join(config.categories)}")
+        self.load_state()
+        for state in self.categories.values():
+            if state.watermark and state.watermark.cutoff():
+                print(f"   - 증분 모드 ({state.key}): 등록일 {state.watermark.cutoff()} 이전 게시글에서 조회 중단")
+
+        writer = BatchWriter(self.db)
+        # 상세 조회 단계는 목록 전체(백필은 미리 받는 페이지만큼)를 담는 우선순위 큐로 받아 중요한 공고부터
+        # 조회하고, 보강 단계는 시간 예산에 도달해도 이미 상세 조회한 공고를 끝까지 처리한다
+        buffered_pages = config.list_workers * 2 if config.backfill else config.max_pages
+        carried = sum(len(state.checkpoint.pending) for state in self.categories.values())
+        detail_queue_size = max(config.queue_size,
+                                buffered_pages * config.rows_per_page * len(self.categories) + carried)
+        stages = [
+            Stage("filter", self.filter_job, workers=1, queue_size=config.queue_size),
+            Stage("detail", self.fetch_detail, workers=config.detail_workers, queue_size=detail_queue_size,
+                  priority=self.priority),
+            Stage("enrich", self.enrich, workers=config.enrich_workers, queue_size=config.queue_size,
+                  finish_on_drain=True),
+        ]
+        # 상세 조회가 밀려 저장할 항목이 한동안 없어도 대기 중인 문서는 flush_seconds 안에 커밋한다
+        pipeline = Pipeline(self.list_jobs(), stages, lambda item: self.persist(writer, item),
+                            sink_queue_size=config.queue_size, on_idle=writer.flush_if_due)
+        timer = self._start_deadline(pipeline)
+        try:
+            with ThreadPoolExecutor(max_workers=config.enrich_workers,
+                                    thread_name_prefix="sync-position") as self._side_pool:
+                pipeline.run()
+        except BaseException:
+            self.result.aborted = True
+            raise
+        finally:
+            if timer:
+                timer.cancel()
+            # 파이프라인이 중단돼도 이미 보강한 문서는 저장하고 상태를 남긴다
+            writer.close()
+            self.result.written = writer.written
+            self.result.failed += len(writer.failed)
+            if writer.failed:
+                print(f"[WARNING] 저장 실패 {len(writer.failed)}개: {', '.join(doc_id for doc_id, _ in writer.failed)}")
+            self._collect_listing()
+            self.save_state()
+
+        result = self.result
+        if result.carried:
+            print(f"\n[RESULT] 이전 실행에서 넘어온 게시글: {result.carried}개")
+        print(f"\n[RESULT] 확인한 게시글: {result.listed}개 ({result.pages}페이지)")
+        print(f"[RESULT] 중복으로 건너뛴 게시글: {result.skipped}개")
+        print(f"[RESULT] 상세 조회 없이 제외한 게시글: 목록 날짜 {result.prefiltered}개, 제외 기록 {result.rejected}개")
+        print(f"[RESULT] 상세 조회 후 제외: {result.filtered}개, 수집: {result.collected}개")
+        print(f"[SUCCESS] 신규/수정 게시글 {result.written}개 저장 완료")
+        if result.timed_out:
+            print(f"[BUDGET] 시간 예산 도달로 {result.leftover}개를 다음 실행으로 넘김 "
+                  f"(소요 {time.monotonic() - self.started:.0f}초)")
+        if result.errors:
+            print(f"[WARNING] 목록 조회 실패 카테고리: {', '.join(result.errors)} (체크포인트에서 이어서 진행)")
+            if len(result.errors) == len(self.categories):
+                raise next(iter(result.errors.values()))
+        return result
+
+    def _collect_listing(self):
+        """카테고리별 목록 진행 상황을 실행 결과에 합산"""
+        states = list(self.categories.values())
+        self.result.pages = sum(state.pages for state in states)
+        self.result.listed = sum(state.listed for state in states)
+        self.result.carried = sum(state.carried for state in states)
+        self.result.reached_watermark = any(state.reached_watermark for state in states)
+        self.result.listed_all = all(state.listed_all for state in states)
+        self.result.errors = {state.key: state.error for state in states if state.error is not None}
+
+    def _start_deadline(self, pipeline: Pipeline) -> Optional[threading.Timer]:
+        """시간 예산에서 마무리 여유를 뺀 시점에 파이프라인을 drain"""
+        budget = self.config.time_budget
+        if not budget:
+            return None
+        remaining = budget - self.config.stop_margin - (time.monotonic() - self.started)
+
+        def on_deadline():
+            self.result.timed_out = True
+            print(f"\n[BUDGET] 시간 예산 {budget:.0f}초 중 마무리 시간만 남음 - 새 상세 조회 중단")
+            pipeline.drain()
+
+        timer = threading.Timer(max(remaining, 0), on_deadline)
+        timer.daemon = True
+        timer.start()
+        return timer
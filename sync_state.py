@@ -0,0 +1,276 @@
+"""
+동기화 상태 저장소
+- Firestore sync_state 컬렉션에 동기화 제어 문서(워터마크 등)를 저장
+- db 없이 호출하면 로컬 .sync_state/ 디렉터리의 JSON 파일을 사용 (로컬 실행/테스트용)
+"""
+import os
+import re
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+SYNC_STATE_COLLECTION = "sync_state"
+LOCAL_STATE_DIR = os.path.join(REPO_ROOT, ".sync_state")
+WATERMARK_DOC = "watermark"
+WATERMARK_LOOKBACK_DAYS = 1  # 등록일이 늦게 반영되는 공고를 놓치지 않도록 겹쳐 확인할 일수
+CHECKPOINT_DOC = "sync_checkpoint"
+
+
+def _local_path(name: str) -> str:
+    return os.path.join(LOCAL_STATE_DIR, f"{name}.json")
+
+
+def load_state(db, name: str, default: Optional[Dict] = None) -> Dict:
+    """상태 문서 조회. 문서가 없으면 default를 반환한다.
+
+    읽기 실패는 "상태 없음"과 구분해야 다음 저장이 기존 문서를 빈 상태로 덮어쓰지 않으므로
+    그대로 예외를 발생시킨다 (호출하는 쪽에서 loaded=False로 표시하고 저장을 건너뛴다).
+    """
+    if db is None:
+        try:
+            with open(_local_path(name), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return dict(default or {})
+    snapshot = db.collection(SYNC_STATE_COLLECTION).document(name).get()
+    if snapshot.exists:
+        return snapshot.to_dict() or {}
+    return dict(default or {})
+
+
+def save_state(db, name: str, data: Dict[str, Any]):
+    """상태 문서 저장 (전체 덮어쓰기)"""
+    if db is None:
+        os.makedirs(LOCAL_STATE_DIR, exist_ok=True)
+        tmp_path = _local_path(name) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, _local_path(name))
+        return
+    db.collection(SYNC_STATE_COLLECTION).document(name).set(data)
+
+
+def _merge_fields(target: Dict, changes: Dict):
+    for key, value in changes.items():
+        if value is None:
+            target.pop(key, None)
+        elif isinstance(value, dict):
+            if not isinstance(target.get(key), dict):
+                target[key] = {}
+            _merge_fields(target[key], value)
+        else:
+            target[key] = value
+
+
+def _firestore_fields(changes: Dict, delete_field) -> Dict:
+    """None은 필드 삭제로 바꾸고, 빈 map은 기존 map을 통째로 비우지 않도록 뺀다"""
+    fields = {}
+    for key, value in changes.items():
+        if value is None:
+            fields[key] = delete_field
+        elif isinstance(value, dict):
+            if value:
+                fields[key] = _firestore_fields(value, delete_field)
+        else:
+            fields[key] = value
+    return fields
+
+
+def merge_state(db, name: str, changes: Dict[str, Any]):
+    """상태 문서의 일부 필드만 병합 저장 (map은 키 단위로 합치고, 값이 None인 키는 삭제)
+
+    여러 실행(5분 동기화, 일일 정리)이 같은 문서를 동시에 고쳐도 바꾼 키만 쓰므로
+    서로의 변경을 덮어쓰지 않는다.
+    """
+    if db is None:
+        data = load_state(None, name)
+        _merge_fields(data, changes)
+        save_state(None, name, data)
+        return
+    from firebase_admin import firestore
+    db.collection(SYNC_STATE_COLLECTION).document(name).set(
+        _firestore_fields(changes, firestore.DELETE_FIELD), merge=True)
+
+
+def date_key(value: Optional[str]) -> str:
+    """'2025-08-27', '2025.08.27', '20250827' 등을 비교 가능한 'YYYYMMDD' 문자열로 정규화"""
+    return re.sub(r"\D", "", value or "")[:8]
+
+
+def _idx_key(idx: str):
+    """숫자 idx는 자릿수가 달라도 크기순으로 비교되도록 변환"""
+    return (len(idx), idx) if idx.isdigit() else (0, idx)
+
+
+class SyncWatermark:
+    """증분 동기화용 최고 수위(high-water mark)
+
+    - (reg_date, mod_date, idx): 마지막으로 끝까지 처리한 가장 최신 공고
+    - known: idx -> [reg_date, end_date, mod_date], 이미 처리한 공고의 수정일 기록
+
+    getList는 등록일 최신순으로 내려오므로, 워터마크 등록일보다 오래된 공고가 나오면
+    그 뒤 페이지는 모두 이미 처리한 범위다. 같은 날 등록된 공고는 idx 순서를 보장할 수
+    없으므로 등록일이 같으면 계속 확인하고, 늦게 게시되는 공고를 위해 lookback_days만큼 겹쳐 확인한다.
+    """
+
+    def __init__(self, reg_date: str = "", mod_date: str = "", idx: str = "",
+                 known: Optional[Dict[str, list]] = None, loaded: bool = True):
+        self.reg_date = reg_date
+        self.mod_date = mod_date
+        self.idx = idx
+        self.known = dict(known or {})
+        self.loaded = loaded  # 조회 실패로 빈 워터마크면 저장하지 않아 기존 문서를 보호
+        self._pending = (reg_date, mod_date, idx)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SyncWatermark":
+        return cls(
+            reg_date=data.get("reg_date", ""),
+            mod_date=data.get("mod_date", ""),
+            idx=data.get("idx", ""),
+            known=data.get("known"),
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "reg_date": self.reg_date,
+            "mod_date": self.mod_date,
+            "idx": self.idx,
+            "known": self.known,
+        }
+
+    def cutoff(self, lookback_days: int = WATERMARK_LOOKBACK_DAYS) -> str:
+        """페이지 조회를 멈출 등록일 기준 ('YYYYMMDD', 워터마크가 없으면 빈 문자열)"""
+        if not self.reg_date:
+            return ""
+        try:
+            watermark_date = datetime.strptime(self.reg_date, "%Y%m%d")
+        except ValueError:
+            return ""
+        return (watermark_date - timedelta(days=lookback_days)).strftime("%Y%m%d")
+
+    def reached(self, job: Dict, lookback_days: int = WATERMARK_LOOKBACK_DAYS) -> bool:
+        """워터마크보다 오래된(이미 처리한 범위의) 공고인지 확인"""
+        cutoff = self.cutoff(lookback_days)
+        reg_date = date_key(job.get("reg_date"))
+        return bool(cutoff and reg_date and reg_date < cutoff)
+
+    def changed(self, job: Dict) -> bool:
+        """이미 처리한 공고의 moddate가 바뀌었는지 확인"""
+        entry = self.known.get(str(job.get("idx")))
+        mod_date = job.get("mod_date") or ""
+        return bool(entry and mod_date and entry[2] != mod_date)
+
+    def observe(self, job: Dict):
+        """처리가 끝난 공고를 기록하고 다음 워터마크 후보를 갱신"""
+        idx = str(job.get("idx"))
+        reg_date = date_key(job.get("reg_date"))
+        mod_date = job.get("mod_date") or ""
+        self.known[idx] = [reg_date, date_key(job.get("end_date")), mod_date]
+        if (reg_date, _idx_key(idx)) > (self._pending[0], _idx_key(self._pending[2])):
+            self._pending = (reg_date, mod_date, idx)
+
+    def commit(self):
+        """이번 실행에서 관찰한 가장 최신 공고로 워터마크를 전진"""
+        self.reg_date, self.mod_date, self.idx = self._pending
+
+    def prune(self, today: str, cutoff: str):
+        """수집 기준(등록 30일 이내 또는 마감일 미도과)을 벗어난 공고 기록 정리"""
+        self.known = {
+            idx: entry for idx, entry in self.known.items()
+            if entry[0] >= cutoff or (entry[1] and entry[1] >= today)
+        }
+
+
+def load_watermark(db, name: str = WATERMARK_DOC) -> SyncWatermark:
+    try:
+        return SyncWatermark.from_dict(load_state(db, name))
+    except Exception as e:
+        print(f"[ERROR] 워터마크 '{name}' 조회 오류: {e}")
+        return SyncWatermark(loaded=False)
+
+
+def save_watermark(db, watermark: SyncWatermark, name: str = WATERMARK_DOC):
+    if not watermark.loaded:
+        return
+    save_state(db, name, watermark.to_dict())
+
+
+def category_state_name(name: str, category: str, default_category: str) -> str:
+    """카테고리별 상태 문서 이름 (기본 카테고리는 기존 문서 이름을 그대로 사용)"""
+    return name if category == default_category else f"{name}_{category}"
+
+
+class SyncCheckpoint:
+    """재개 가능한 동기화 체크포인트
+
+    - pages_done: 목록을 읽고 그 페이지의 공고를 모두 처리(저장 또는 제외)한 페이지
+    - cursor: 1페이지부터 빈틈없이 끝낸 마지막 페이지
+    - pending: 목록에서 읽었지만 아직 저장하지 못한 공고 (다음 실행이 먼저 처리)
+    - total_count: 백필을 시작할 때의 totalCount. 값이 바뀌면 공고가 페이지 사이로 밀렸으므로
+      끝낸 페이지도 다시 확인한다 (목록 조회는 싸고, 저장된 공고는 상세 조회 없이 건너뛴다)
+    """
+
+    def __init__(self, pages_done=None, pending=None, total_count: int = 0, rows_per_page: int = 0,
+                 started_on: str = "", loaded: bool = True):
+        self.pages_done = set(pages_done or [])
+        self.pending = list(pending or [])
+        self.total_count = total_count
+        self.rows_per_page = rows_per_page
+        self.started_on = started_on
+        self.stored = bool(self.pages_done or self.pending or total_count)  # 저장된 진행 상태가 있는지
+        self.loaded = loaded  # 조회 실패로 빈 체크포인트면 저장하지 않아 기존 pending을 보호
+
+    @property
+    def cursor(self) -> int:
+        page = 0
+        while page + 1 in self.pages_done:
+            page += 1
+        return page
+
+    def matches(self, total_count: int, rows_per_page: int) -> bool:
+        """이전 백필과 같은 목록인지 (전체 건수와 페이지 크기가 같으면 끝낸 페이지를 건너뛸 수 있다)"""
+        return self.total_count == total_count and self.rows_per_page == rows_per_page
+
+    def restart(self, total_count: int, rows_per_page: int, today: str):
+        """페이지 진행 상태를 새로 시작 (pending은 유지)"""
+        self.pages_done = set()
+        self.total_count = total_count
+        self.rows_per_page = rows_per_page
+        self.started_on = today
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SyncCheckpoint":
+        return cls(
+            pages_done=data.get("pages_done"),
+            pending=data.get("pending"),
+            total_count=data.get("total_count", 0),
+            rows_per_page=data.get("rows_per_page", 0),
+            started_on=data.get("started_on", ""),
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "pages_done": sorted(self.pages_done),
+            "cursor": self.cursor,
+            "pending": self.pending,
+            "total_count": self.total_count,
+            "rows_per_page": self.rows_per_page,
+            "started_on": self.started_on,
+        }
+
+
+def load_checkpoint(db, name: str = CHECKPOINT_DOC) -> SyncCheckpoint:
+    try:
+        return SyncCheckpoint.from_dict(load_state(db, name))
+    except Exception as e:
+        print(f"[ERROR] 체크포인트 '{name}' 조회 오류: {e}")
+        return SyncCheckpoint(loaded=False)
+
+
+def save_checkpoint(db, checkpoint: SyncCheckpoint, name: str = CHECKPOINT_DOC):
+    if not checkpoint.loaded:
+        return
+    save_state(db, name, checkpoint.to_dict())
+    checkpoint.stored = bool(checkpoint.pages_done or checkpoint.pending or checkpoint.total_count)
@@ -0,0 +1,83 @@
+"""
+테스트용 가짜 Firestore/나라일터 API 도우미 (여러 테스트 모듈이 함께 쓴다)
+"""
+from firebase_admin import firestore
+
+
+def store_document(docs, doc_id, data, merge=False):
+    """DocumentReference.set() 흉내: merge=True면 map을 키 단위로 합치고 DELETE_FIELD는 삭제"""
+    if not merge or doc_id not in docs:
+        docs[doc_id] = _merged({}, data)
+    else:
+        docs[doc_id] = _merged(docs[doc_id], data)
+
+
+def _merged(target, changes):
+    result = dict(target)
+    for key, value in changes.items():
+        if value is firestore.DELETE_FIELD:
+            result.pop(key, None)
+        elif isinstance(value, dict):
+            result[key] = _merged(result.get(key) if isinstance(result.get(key), dict) else {}, value)
+        else:
+            result[key] = value
+    return result
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self.db = db
+        self.ops = []
+
+    def set(self, doc_ref, data, merge=False):
+        self.ops.append((doc_ref, data))
+
+    def commit(self):
+        self.db.docs.update(dict(self.ops))
+
+
+class FakeCollection:
+    def document(self, doc_id):
+        return doc_id
+
+
+class FakeJobsDB:
+    """일괄 쓰기만 받는 jobs 컬렉션"""
+
+    def __init__(self):
+        self.docs = {}
+
+    def collection(self, name):
+        return FakeCollection()
+
+    def batch(self):
+        return FakeBatch(self)
+
+
+class FakeAPI:
+    """목록 페이지와 상세를 미리 정해 둔 나라일터 API (카테고리는 구분하지 않는다)"""
+
+    def __init__(self, pages, details):
+        self.pages = pages
+        self.details = details
+        self.detail_calls = []
+
+    def iter_job_list(self, page_no=1, num_of_rows=20, category="government"):
+        return iter(self.pages[page_no - 1] if page_no <= len(self.pages) else [])
+
+    def get_job_detail(self, idx, mod_date=None):
+        self.detail_calls.append(idx)
+        return self.details.get(idx)
+
+    def get_job_files(self, idx, mod_date=None):
+        return [{"file_name": f"{idx}.hwp"}]
+
+    def get_job_position(self, idx, mod_date=None):
+        return {"full_grade": "9급 1명"}
+
+    def get_optional(self, endpoint, fetch, idx, default=None, **kwargs):
+        return fetch(idx, **kwargs)
+
+
+def make_job(idx, reg_date="2025-09-09", end_date="2025-09-20", mod_date="20250909"):
+    return {"idx": idx, "title": f"공고 {idx}", "reg_date": reg_date, "end_date": end_date, "mod_date": mod_date}
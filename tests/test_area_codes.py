@@ -0,0 +1,36 @@
+"""
+지역코드 색인 테스트
+"""
+import pytest
+
+from area_codes import AREA_NAMES, area_code, area_name, sigungu_codes
+
+
+def test_area_name_lookup():
+    """시군구/시도 코드 조회와 시도 단위 대체 동작 확인"""
+    assert area_name("45130") == "전라북도 군산시"
+    assert area_name("45000") == "전라북도"
+    assert area_name("41135") == "경기도 성남시 분당구"
+    assert area_name("36110") == "세종특별자치시"
+    assert area_name("11") == "서울특별시"
+    assert area_name("26999") == "부산광역시"  # 모르는 시군구는 시도명
+    assert area_name("4511000000") == "전라북도 전주시"  # 10자리 법정동 코드
+    assert area_name("") == ""
+    assert area_name("99") == ""
+
+
+def test_index_is_immutable():
+    """색인은 import 시 한 번 만들어지고 수정할 수 없는지 확인"""
+    with pytest.raises(TypeError):
+        AREA_NAMES["11"] = "변경"
+
+
+def test_prefix_and_reverse_lookup():
+    """시도별 하위 코드 조회와 이름 -> 코드 역조회 확인"""
+    assert "48170" in sigungu_codes("48")
+    assert all(code.startswith("50") for code in sigungu_codes("50"))
+    assert area_code("전라북도 군산시") == "52130"  # 전북특별자치도 전환 후 코드 우선
+    assert area_code("경상남도  진주시") == "48170"
+    assert area_code("성남시 분당구") == "41135"
+    assert area_code("춘천시") == "51110"
+    assert area_code("중구") is None  # 여러 시도에 있는 이름은 전체 이름으로만 조회
@@ -0,0 +1,157 @@
+"""
+게시글 정리 스크립트 테스트
+"""
+from datetime import date, datetime
+
+import data_cleanup
+import sync_state
+from tests.fakes import FakeAPI, FakeJobsDB, make_job, store_document
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+        self.exists = data is not None
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeQuery:
+    def __init__(self, db, filters=(), fields=None):
+        self.db = db
+        self.filters = filters
+        self.fields = fields
+
+    def where(self, field, op, value):
+        assert op == "<="
+        return FakeQuery(self.db, self.filters + ((field, value),), self.fields)
+
+    def select(self, fields):
+        return FakeQuery(self.db, self.filters, fields)
+
+    def stream(self):
+        self.db.queries.append((self.filters, self.fields))
+        for doc_id, data in list(self.db.jobs.items()):
+            if all(field in data and data[field] <= value for field, value in self.filters):
+                yield FakeSnapshot(doc_id, {k: v for k, v in data.items() if k in self.fields})
+
+
+class FakeDocument:
+    def __init__(self, db, collection, doc_id):
+        self.db = db
+        self.collection = collection
+        self.id = doc_id
+
+    def get(self):
+        return FakeSnapshot(self.id, self.db.state.get(self.id))
+
+    def set(self, data, merge=False):
+        store_document(self.db.state, self.id, data, merge)
+
+    def delete(self):
+        self.db.jobs.pop(self.id, None)
+
+
+class FakeCollection(FakeQuery):
+    def __init__(self, db, name):
+        super().__init__(db)
+        self.name = name
+
+    def document(self, doc_id):
+        return FakeDocument(self.db, self.name, doc_id)
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self.db = db
+        self.deletes = []
+
+    def delete(self, doc_ref):
+        self.deletes.append(doc_ref.id)
+
+    def commit(self):
+        self.db.commits.append(list(self.deletes))
+        for doc_id in self.deletes:
+            self.db.jobs.pop(doc_id, None)
+
+
+class FakeDB:
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.state = {}
+        self.queries = []
+        self.commits = []
+
+    def collection(self, name):
+        return FakeCollection(self, name)
+
+    def batch(self):
+        return FakeBatch(self)
+
+
+def _setup(monkeypatch, tmp_path, jobs):
+    db = FakeDB(jobs)
+    monkeypatch.setattr(sync_state, "LOCAL_STATE_DIR", str(tmp_path))
+    monkeypatch.setattr(data_cleanup, "initialize_firebase", lambda: db)
+    monkeypatch.setattr(data_cleanup, "get_seoul_time", lambda: datetime(2025, 9, 30, 0, 0))
+    return db
+
+
+JOBS = {
+    "old": {"reg_date": "20250801", "title": "오래된 공고"},
+    "edge": {"reg_date": "20250831", "title": "기준일 공고"},
+    "new": {"reg_date": "20250910", "title": "최근 공고"},
+    "legacy": {"reg_date": "2025-09-20", "title": "예전 형식 최근 공고"},
+    "nodate": {"title": "등록일 없음"},
+}
+
+
+def test_find_expired_jobs_uses_range_query():
+    """등록일 범위 쿼리로 조회하고 예전 날짜 형식은 다시 확인하는지 확인"""
+    db = FakeDB(dict(JOBS))
+    candidates, scanned = data_cleanup.find_expired_jobs(db, date(2025, 8, 31))
+    assert db.queries[0][0] == (("reg_date", "20250831"),)
+    assert "contents" not in db.queries[0][1]
+    assert sorted(job["id"] for job in candidates) == ["edge", "old"]
+    assert scanned == 3  # 'legacy'는 문자열 비교상 조회되지만 삭제 대상이 아님
+
+
+def test_cleanup_batches_deletes_and_dry_run(monkeypatch, tmp_path, capsys):
+    """dry-run은 삭제하지 않고, 실제 실행은 일괄 삭제하는지 확인"""
+    db = _setup(monkeypatch, tmp_path, dict(JOBS))
+    data_cleanup.cleanup_old_jobs(dry_run=True)
+    assert "old" in db.jobs and not db.commits
+    assert "삭제 예정 2개" in capsys.readouterr().out
+
+    data_cleanup.cleanup_old_jobs()
+    assert db.commits == [["old", "edge"]]
+    assert sorted(db.jobs) == ["legacy", "new", "nodate"]
+
+
+def test_cleanup_tombstones_only_closed_postings(monkeypatch, tmp_path):
+    """마감된 삭제 공고만 제외 기록에 남기고, 마감일이 남은 삭제 공고는 다음 동기화가 다시 수집하는지 확인"""
+    import sync_engine
+    from auto_sync_scheduler import SYNC_CONFIG
+    from firestore_writer import BatchWriter
+    from rejected_jobs import load_rejected_jobs
+    from sync_engine import SyncConfig, SyncEngine
+
+    db = _setup(monkeypatch, tmp_path, {
+        "closed": {"reg_date": "20250801", "end_date": "20250815", "mod_date": "20250801", "title": "마감 공고"},
+        "open": {"reg_date": "20250801", "end_date": "20251010", "mod_date": "20250801", "title": "진행 공고"},
+    })
+    data_cleanup.cleanup_old_jobs()
+    assert db.jobs == {}
+    listing = [make_job("open", reg_date="2025-08-01", end_date="2025-10-10", mod_date="20250801"),
+               make_job("closed", reg_date="2025-08-01", end_date="2025-08-15", mod_date="20250801")]
+    rejected = load_rejected_jobs(db)
+    assert rejected.contains(listing[1]) and not rejected.contains(listing[0])
+
+    written = FakeJobsDB()
+    monkeypatch.setattr(sync_engine, "BatchWriter", lambda _: BatchWriter(written))
+    api = FakeAPI([listing], {"open": listing[0]})
+    config = SyncConfig(**{**vars(SYNC_CONFIG), "categories": ("government",)})
+    SyncEngine(db, api, config, today=datetime(2025, 9, 30)).run()
+    assert api.detail_calls == ["open"] and set(written.docs) == {"open"}
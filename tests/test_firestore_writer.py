@@ -0,0 +1,129 @@
+"""
+Firestore 일괄 쓰기 버퍼 테스트
+"""
+import time
+
+import firestore_writer
+from firestore_writer import BatchWriter
+from pipeline import Pipeline
+
+
+class FakeDocument:
+    def __init__(self, db, doc_id):
+        self.db = db
+        self.id = doc_id
+
+    def set(self, data, merge=False):
+        if self.id in self.db.broken:
+            raise ValueError("invalid document")
+        self.db.single_sets.append(self.id)
+        self.db.docs[self.id] = data
+
+
+class FakeCollection:
+    def __init__(self, db):
+        self.db = db
+
+    def document(self, doc_id):
+        return FakeDocument(self.db, doc_id)
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self.db = db
+        self.ops = []
+
+    def set(self, doc_ref, data, merge=False):
+        self.ops.append((doc_ref.id, data))
+
+    def commit(self):
+        if any(doc_id in self.db.broken for doc_id, _ in self.ops):
+            raise ValueError("batch rejected")
+        self.db.commits.append([doc_id for doc_id, _ in self.ops])
+        self.db.docs.update(dict(self.ops))
+
+
+class FakeDB:
+    def __init__(self, broken=()):
+        self.broken = set(broken)
+        self.docs = {}
+        self.commits = []
+        self.single_sets = []
+
+    def collection(self, name):
+        return FakeCollection(self)
+
+    def batch(self):
+        return FakeBatch(self)
+
+
+def test_flushes_by_size_and_on_close():
+    """최대 건수마다 한 번씩 커밋하고 남은 문서는 close에서 커밋하는지 확인"""
+    db = FakeDB()
+    observed = []
+    with BatchWriter(db, max_operations=3, flush_seconds=None) as writer:
+        for i in range(7):
+            writer.set(str(i), {"idx": str(i)}, on_success=lambda i=i: observed.append(i))
+        assert [len(ids) for ids in db.commits] == [3, 3]
+    assert [len(ids) for ids in db.commits] == [3, 3, 1]
+    assert observed == list(range(7))
+    assert writer.written == 7 and not writer.failed
+
+
+def test_flushes_by_elapsed_time(monkeypatch):
+    """첫 대기 문서 이후 flush_seconds가 지나면 건수와 관계없이 커밋하는지 확인"""
+    clock = [100.0]
+    monkeypatch.setattr(firestore_writer.time, "monotonic", lambda: clock[0])
+    db = FakeDB()
+    writer = BatchWriter(db, flush_seconds=5)
+    writer.set("1", {})
+    clock[0] += 6
+    writer.set("2", {})
+    assert db.commits == [["1", "2"]]
+
+
+def test_flush_if_due_commits_without_new_writes(monkeypatch):
+    """새 쓰기가 없어도 flush_if_due()가 경과 시간 기준으로 커밋하는지 확인"""
+    clock = [100.0]
+    monkeypatch.setattr(firestore_writer.time, "monotonic", lambda: clock[0])
+    db = FakeDB()
+    writer = BatchWriter(db, flush_seconds=5)
+    writer.set("1", {})
+    assert writer.flush_if_due() == 0
+    clock[0] += 6
+    assert writer.flush_if_due() == 1
+    assert db.commits == [["1"]]
+
+
+def test_pipeline_idle_flushes_when_writes_stop_arriving():
+    """다음 항목이 한참 오지 않는 동안에도 파이프라인의 on_idle로 대기 문서가 커밋되는지 확인"""
+    db = FakeDB()
+    writer = BatchWriter(db, flush_seconds=0.05)
+    seen_before_next = []
+
+    def source():
+        yield "1"
+        deadline = time.monotonic() + 5
+        while not db.commits and time.monotonic() < deadline:
+            time.sleep(0.01)
+        seen_before_next.append([list(ids) for ids in db.commits])
+        yield "2"
+
+    Pipeline(source(), [], lambda doc_id: writer.set(doc_id, {}), on_idle=writer.flush_if_due).run()
+    writer.close()
+    assert seen_before_next == [[["1"]]]
+    assert db.commits == [["1"], ["2"]]
+
+
+def test_failed_batch_reports_only_bad_documents():
+    """배치가 거부되면 문서 단위로 재시도해 실패한 문서만 보고하는지 확인"""
+    db = FakeDB(broken={"2"})
+    observed = []
+    writer = BatchWriter(db, flush_seconds=None)
+    for doc_id in ("1", "2", "3"):
+        writer.set(doc_id, {"idx": doc_id}, on_success=lambda d=doc_id: observed.append(d))
+    writer.close()
+    assert sorted(db.docs) == ["1", "3"]
+    assert observed == ["1", "3"]
+    assert [doc_id for doc_id, _ in writer.failed] == ["2"]
+    assert writer.written == 2
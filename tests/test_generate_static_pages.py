@@ -0,0 +1,154 @@
+"""
+정적 페이지 생성 테스트
+"""
+import os
+
+import generate_static_pages as gsp
+
+
+def _use_tmp_jobs_dir(monkeypatch, tmp_path):
+    jobs_dir = tmp_path / "jobs"
+    monkeypatch.setattr(gsp, "JOBS_DIR", str(jobs_dir))
+    monkeypatch.setattr(gsp, "MANIFEST_PATH", str(jobs_dir / ".manifest.json"))
+    return jobs_dir
+
+
+def _job(idx, title="행정 9급 채용", **extra):
+    return {"idx": idx, "title": title, "dept_name": "테스트청", "work_region": "서울",
+            "grade": "9급", "reg_date": "20250901", "end_date": "20250930", **extra}
+
+
+def test_incremental_build_skips_unchanged_pages(monkeypatch, tmp_path):
+    """입력이 같으면 다시 쓰지 않고, 바뀐 페이지만 원자적으로 다시 쓰는지 확인"""
+    jobs_dir = _use_tmp_jobs_dir(monkeypatch, tmp_path)
+    writes = []
+    original_write = gsp.write_atomic
+    monkeypatch.setattr(gsp, "write_atomic", lambda path, content: (writes.append(path), original_write(path, content)))
+
+    gsp.write_job_pages([_job("1"), _job("2")])
+    assert sorted(os.path.basename(os.path.dirname(path)) for path in writes if path.endswith("index.html")) == ["1", "2"]
+
+    writes.clear()
+    gsp.write_job_pages([_job("1", updated_at="later"), _job("2", title="행정 8급 채용")])
+    assert writes == [str(jobs_dir / "2" / "index.html"), str(jobs_dir / ".manifest.json")]
+    assert "행정 8급 채용" in (jobs_dir / "2" / "index.html").read_text(encoding="utf-8")
+    assert not any(name.endswith(".tmp") for name in os.listdir(jobs_dir / "2"))
+
+
+def test_closed_state_is_recorded_in_manifest(monkeypatch, tmp_path):
+    """삭제된 공고는 한 번만 마감 페이지로 전환하고 이후에는 manifest로 건너뛰는지 확인"""
+    jobs_dir = _use_tmp_jobs_dir(monkeypatch, tmp_path)
+    gsp.write_job_pages([_job("1"), _job("2")])
+
+    active = gsp.write_job_pages([_job("2")])
+    assert active == {"2"}
+    assert "마감된 채용공고입니다" in (jobs_dir / "1" / "index.html").read_text(encoding="utf-8")
+    assert gsp.load_manifest()["pages"]["1"]["closed"] is True
+
+    planned, _ = gsp.plan_job_pages([_job("2")], gsp.load_manifest())
+    assert planned == []
+
+
+def test_template_change_forces_rebuild(monkeypatch, tmp_path):
+    """템플릿이 바뀌면 manifest를 비워 모든 페이지를 다시 렌더링하는지 확인"""
+    _use_tmp_jobs_dir(monkeypatch, tmp_path)
+    gsp.write_job_pages([_job("1")])
+    monkeypatch.setattr(gsp, "PAGE_TEMPLATE", gsp.PAGE_TEMPLATE.replace("코리아잡포털</h1>", "코리아잡포털 </h1>"))
+    planned, _ = gsp.plan_job_pages([_job("1")], gsp.load_manifest())
+    assert [idx for idx, *_ in planned] == ["1"]
+
+
+def test_parallel_build_matches_serial_output(monkeypatch, tmp_path):
+    """프로세스/스레드 풀로 만든 결과가 순차 빌드와 바이트 단위로 같은지 확인"""
+    monkeypatch.setattr(gsp, "PARALLEL_MIN_PAGES", 1)
+    jobs = [_job(str(i), title=f"공고 {i}", contents=f"본문 {i}\n둘째 줄") for i in range(1, 31)]
+
+    serial_dir = _use_tmp_jobs_dir(monkeypatch, tmp_path / "serial")
+    gsp.write_job_pages(jobs, workers=1)
+    parallel_dir = _use_tmp_jobs_dir(monkeypatch, tmp_path / "parallel")
+    gsp.write_job_pages(jobs, workers=3)
+
+    for job in jobs:
+        serial = (serial_dir / job["idx"] / "index.html").read_text(encoding="utf-8")
+        parallel = (parallel_dir / job["idx"] / "index.html").read_text(encoding="utf-8")
+        assert serial == parallel
+    assert (serial_dir / ".manifest.json").read_text() == (parallel_dir / ".manifest.json").read_text()
+
+
+def test_sitemap_index_shards_and_lastmod(monkeypatch, tmp_path):
+    """등록월 샤드, 실제 lastmod, 변경분만 다시 쓰기, gzip 출력을 확인"""
+    import gzip
+    from datetime import datetime
+
+    monkeypatch.setattr(gsp, "SITEMAP_PATH", str(tmp_path / "sitemap.xml"))
+    monkeypatch.setattr(gsp, "SITEMAP_DIR", str(tmp_path / "sitemaps"))
+    jobs = [
+        _job("10", reg_date="20250828", mod_date="2025-08-29 10:00:00"),
+        _job("11", reg_date="20250901", updated_at=datetime(2025, 9, 3, 12, 0)),
+        _job("9", reg_date="20250902"),
+    ]
+
+    changed = gsp.write_sitemap(jobs)
+    assert sorted(changed) == ["jobs-202508.xml", "jobs-202509.xml", "static.xml"]
+    index = (tmp_path / "sitemap.xml").read_text(encoding="utf-8")
+    assert "<sitemapindex" in index and "/sitemaps/jobs-202509.xml</loc>\n    <lastmod>2025-09-03</lastmod>" in index
+    august = (tmp_path / "sitemaps" / "jobs-202508.xml").read_text(encoding="utf-8")
+    assert "<lastmod>2025-08-29</lastmod>" in august
+    september = (tmp_path / "sitemaps" / "jobs-202509.xml").read_text(encoding="utf-8")
+    assert september.index("/jobs/9/") < september.index("/jobs/11/")
+
+    # 9월 공고만 바뀌면 9월 샤드와 (홈 lastmod가 바뀌는) static 샤드만 다시 쓴다
+    jobs[1]["mod_date"] = "20250905"
+    assert sorted(gsp.write_sitemap(jobs)) == ["jobs-202509.xml", "static.xml"]
+    assert gsp.write_sitemap(jobs) == []
+
+    # gzip 출력으로 바꾸면 기존 .xml 샤드는 정리된다
+    gsp.write_sitemap(jobs, gzip_output=True)
+    assert sorted(os.listdir(tmp_path / "sitemaps")) == ["jobs-202508.xml.gz", "jobs-202509.xml.gz", "static.xml.gz"]
+    assert b"/jobs/10/" in gzip.decompress((tmp_path / "sitemaps" / "jobs-202508.xml.gz").read_bytes())
+    assert gsp.write_sitemap(jobs, gzip_output=True) == []
+
+
+def test_data_files_split_list_and_detail(monkeypatch, tmp_path):
+    """목록 페이지에는 본문/첨부파일이 없고, 상세는 공고별 파일로 나뉘며 목록은 세대별로 교체되는지 확인"""
+    import json
+
+    data_dir = tmp_path / "jobs-data"
+    monkeypatch.setattr(gsp, "DATA_DIR", str(data_dir))
+    monkeypatch.setattr(gsp, "LIST_PAGE_SIZE", 2)
+    files = [{"filename": "공고문.hwp", "filepath": "downFile.do?x=1"}]
+    jobs = [_job("9", reg_date="20250902", contents="본문 9", files=files),
+            _job("10", reg_date="20250902", contents="본문 10"),
+            _job("8", reg_date="20250830", contents="본문 8", category="local")]
+
+    gsp.write_data_files(jobs)
+    index = json.loads((data_dir / "index.json").read_text(encoding="utf-8"))
+    assert index["count"] == 3 and index["page_size"] == 2 and len(index["pages"]) == 2
+    pages = [json.loads((data_dir / name).read_text(encoding="utf-8")) for name in index["pages"]]
+    assert "contents" not in pages[0]["fields"] and "files" not in pages[0]["fields"]
+    assert [page["offset"] for page in pages] == [0, 2]
+    idx_col = pages[0]["fields"].index("idx")
+    assert [row[idx_col] for page in pages for row in page["rows"]] == ["10", "9", "8"]
+    detail = json.loads((data_dir / "detail" / "9.json").read_text(encoding="utf-8"))
+    assert detail == {"idx": "9", "contents": "본문 9", "files": files}
+    search = json.loads((data_dir / index["search"]).read_text(encoding="utf-8"))
+    assert search["count"] == 3 and "테스" in search["g"]
+    assert index["stats"]["total_jobs"] == 3 and index["stats"]["by_reg_date"] == {"20250902": 2, "20250830": 1}
+    assert "entries" not in index["stats"]
+    assert index["categories"] == {"government": 2, "local": 1}
+
+    # 변경이 없으면 아무 파일도 다시 쓰지 않는다
+    assert gsp.write_data_files(jobs) == []
+
+    # 공고가 바뀌면 새 세대 파일이 생기고 직전 세대는 한 세대만 남는다
+    first_pages = index["pages"]
+    jobs[0]["contents"] = "본문 9 수정"
+    changed = gsp.write_data_files(jobs[:2])
+    assert "detail/9.json" in changed and "detail/8.json" in changed
+    second_pages = json.loads((data_dir / "index.json").read_text(encoding="utf-8"))["pages"]
+    assert second_pages != first_pages
+    jobs[1]["title"] = "제목 수정"
+    gsp.write_data_files(jobs[:2])
+    remaining = set(os.listdir(data_dir))
+    assert not remaining & set(first_pages) and set(second_pages) <= remaining
+    assert sorted(os.listdir(data_dir / "detail")) == ["10.json", "9.json"]
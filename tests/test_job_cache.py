@@ -0,0 +1,154 @@
+"""
+API 서버 메모리 캐시 테스트
+"""
+from datetime import datetime, timedelta
+
+import generate_static_pages as gsp
+import job_cache
+from job_cache import JobCache, today_kst
+
+
+def _date(days_ago):
+    return (today_kst() - timedelta(days=days_ago)).strftime('%Y%m%d')
+
+
+def _job(idx, reg_days_ago=1, end_days_left=10, **extra):
+    job = {"idx": idx, "title": f"행정 공고 {idx}", "dept_name": f"기관{idx}", "work_region": "서울",
+           "grade": "9급", "reg_date": _date(reg_days_ago), "end_date": _date(-end_days_left),
+           "contents": f"본문 {idx}", "files": []}
+    job.update(extra)
+    return job
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+class FakeQuery:
+    def __init__(self, db, since):
+        self.db = db
+        self.since = since
+
+    def stream(self):
+        self.db.queries.append(self.since)
+        for doc_id, data in self.db.jobs.items():
+            if data["updated_at"] > self.since:
+                yield FakeSnapshot(doc_id, data)
+
+
+class FakeCollection:
+    def __init__(self, db):
+        self.db = db
+
+    def stream(self):
+        self.db.queries.append("full")
+        for doc_id, data in self.db.jobs.items():
+            yield FakeSnapshot(doc_id, data)
+
+    def where(self, field, op, value):
+        assert (field, op) == ("updated_at", ">")
+        return FakeQuery(self.db, value)
+
+
+class FakeDB:
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.queries = []
+
+    def collection(self, name):
+        return FakeCollection(self)
+
+
+def test_snapshot_source_lists_filters_and_loads_detail_lazily(monkeypatch, tmp_path):
+    """정적 스냅샷(jobs-data)에서 목록을 읽고 상세는 요청 시 detail 파일에서 읽는지 확인"""
+    monkeypatch.setattr(gsp, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(gsp, "LIST_PAGE_SIZE", 2)
+    files = [{"filename": "공고문.hwp", "filepath": "downFile.do?x=1"}]
+    gsp.write_data_files([
+        _job("1", reg_days_ago=10, end_days_left=2, work_region="부산"),
+        _job("2", reg_days_ago=3, grade="7급", files=files),
+        _job("3", reg_days_ago=1, title="전산 공고", category="public"),
+        _job("4", reg_days_ago=40),  # 보관 기간이 지난 공고는 제외
+    ])
+
+    cache = JobCache(snapshot_dir=str(tmp_path))
+    cache.ensure_fresh()
+    assert cache.source == "snapshot"
+    assert [job["idx"] for job in cache.query()] == ["3", "2", "1"]
+    assert [job["idx"] for job in cache.query(q="행정")] == ["2", "1"]
+    assert [job["idx"] for job in cache.query(q="ㅈㅅ")] == ["3"]
+    assert [job["idx"] for job in cache.query(region="부산")] == ["1"]
+    assert [job["idx"] for job in cache.query(status="urgent")] == ["1"]
+    assert [job["idx"] for job in cache.query(status="recent")] == ["3", "2"]
+    # category가 없는 기존 공고는 정부기관으로 본다
+    assert [job["idx"] for job in cache.query(category="public")] == ["3"]
+    assert [job["idx"] for job in cache.query(category="government")] == ["2", "1"]
+
+    assert "contents" not in cache.get("2")
+    detail = cache.detail("2")
+    assert detail["contents"] == "본문 2" and detail["files"] == files
+    assert cache.detail("404") is None
+
+    stats = cache.stats()
+    assert (stats["total_jobs"], stats["urgent_jobs"], stats["recent_jobs"], stats["total_departments"]) == (3, 1, 2, 3)
+    assert stats["by_grade"] == {"9급": 2, "7급": 1}
+
+    # 스냅샷이 바뀌지 않았으면 version도 그대로
+    version = cache.version
+    cache.refresh()
+    assert cache.version == version
+
+
+def test_firestore_source_refreshes_incrementally():
+    """최초에는 전체를 읽고 이후에는 updated_at이 바뀐 문서만 조회하는지 확인"""
+    base = datetime(2026, 1, 1)
+    db = FakeDB({
+        "1": {**_job("1"), "updated_at": base},
+        "2": {**_job("2", reg_days_ago=2), "updated_at": base + timedelta(minutes=1)},
+    })
+    cache = JobCache(db_factory=lambda: db, refresh_seconds=0)
+    cache.ensure_fresh()
+    assert cache.source == "firestore" and len(cache.jobs) == 2
+    version = cache.version
+
+    db.jobs["3"] = {**_job("3", reg_days_ago=0), "updated_at": base + timedelta(minutes=5)}
+    cache.ensure_fresh()
+    assert db.queries == ["full", base + timedelta(minutes=1)]
+    assert [job["idx"] for job in cache.query()] == ["3", "1", "2"]
+    assert cache.version != version
+
+    # 변경이 없으면 version 유지
+    version = cache.version
+    cache.ensure_fresh()
+    assert cache.version == version
+    assert cache.detail("3")["contents"] == "본문 3"
+
+
+def test_query_during_rebuild_uses_consistent_list_and_index(monkeypatch):
+    """갱신 도중에 들어온 검색은 이전 목록과 이전 검색 색인을 함께 사용하는지 확인"""
+    base = datetime(2026, 1, 1)
+    db = FakeDB({
+        "1": {**_job("1"), "updated_at": base},
+        "2": {**_job("2", reg_days_ago=2), "updated_at": base},
+    })
+    cache = JobCache(db_factory=lambda: db, refresh_seconds=0)
+    cache.ensure_fresh()
+
+    during = []
+    build = job_cache.build_search_index
+
+    def build_while_querying(ordered):
+        during.append([job["idx"] for job in cache.query(q="행정")])
+        return build(ordered)
+
+    monkeypatch.setattr(job_cache, "build_search_index", build_while_querying)
+    db.jobs["3"] = {**_job("3", reg_days_ago=0, title="전산 공고"), "updated_at": base + timedelta(minutes=1)}
+    cache.ensure_fresh()
+    assert during == [["1", "2"]]
+    assert [job["idx"] for job in cache.query(q="행정")] == ["1", "2"]
+    assert [job["idx"] for job in cache.query()] == ["3", "1", "2"]
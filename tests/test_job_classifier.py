@@ -0,0 +1,53 @@
+"""
+직급/지역 분류기 테스트
+"""
+from job_classifier import (
+    GRADE_PATTERNS,
+    TITLE_REGION_PATTERNS,
+    classify_titles,
+    extract_grade,
+    extract_region_from_contents,
+    extract_region_from_title,
+)
+
+
+def _linear_first(patterns, text):
+    """기존 방식: 목록 순서대로 포함 여부 확인"""
+    for keyword, label in patterns:
+        if keyword in (text or ""):
+            return label
+    return ""
+
+
+def test_grade_priority_matches_linear_scan():
+    """겹치거나 포함된 키워드도 목록 우선순위대로 분류하는지 확인"""
+    samples = [
+        "2025년 청년인턴 및 전문연구원 채용",
+        "선임연구원(연구사) 경력경쟁 채용",
+        "운전문직 채용",
+        "연구사무관 공고",
+        "9급 전문임기제 공무원",
+        "",
+        "해당 없음",
+    ]
+    for text in samples:
+        assert extract_grade(text) == _linear_first(GRADE_PATTERNS, text)
+    assert extract_grade("운전문직 채용") == "전문직"
+
+
+def test_title_region_and_batch():
+    """제목 지역 분류와 페이지 단위 일괄 분류 결과가 단건 분류와 같은지 확인"""
+    titles = ["서울산업진흥원 9급", "대전라남도청 공고", "경기도 화성시 계약직", None, "제주 인턴"]
+    assert extract_region_from_title("서울산업진흥원") == "서울특별시"
+    assert extract_region_from_title("대전라남도청") == "대전광역시"
+    assert extract_region_from_title("전북 공고") == "전북도"
+    assert classify_titles(titles) == [
+        (_linear_first(GRADE_PATTERNS, title), _linear_first(TITLE_REGION_PATTERNS, title))
+        for title in titles
+    ]
+
+
+def test_region_from_contents():
+    """본문 상세 지역 패턴 우선순위 확인"""
+    assert extract_region_from_contents("근무예정지 : 전라북도 임실군 소재") == "전라북도 임실군"
+    assert extract_region_from_contents("") == ""
@@ -0,0 +1,116 @@
+"""
+게시글 ID 색인 테스트
+"""
+import sync_state
+from job_index import load_job_index, save_job_index
+from tests.fakes import store_document
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+        self.exists = data is not None
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeDocument:
+    def __init__(self, store, doc_id):
+        self.store = store
+        self.doc_id = doc_id
+
+    def get(self):
+        self.store["reads"].append(self.doc_id)
+        return FakeSnapshot(self.doc_id, self.store["docs"].get(self.doc_id))
+
+    def set(self, data, merge=False):
+        store_document(self.store["docs"], self.doc_id, data, merge)
+
+
+class FakeQuery:
+    def __init__(self, store, fields):
+        self.store = store
+        self.fields = fields
+
+    def stream(self):
+        self.store["projections"].append(self.fields)
+        for doc_id, data in self.store["jobs"].items():
+            yield FakeSnapshot(doc_id, {field: data[field] for field in self.fields if field in data})
+
+
+class FakeCollection:
+    def __init__(self, store, name):
+        self.store = store
+        self.name = name
+
+    def document(self, doc_id):
+        return FakeDocument(self.store, doc_id)
+
+    def select(self, fields):
+        return FakeQuery(self.store, fields)
+
+    def stream(self):
+        raise AssertionError("전체 문서 스트리밍은 사용하지 않아야 함")
+
+
+class FakeDB:
+    def __init__(self, jobs):
+        self.store = {"jobs": jobs, "docs": {}, "reads": [], "projections": []}
+
+    def collection(self, name):
+        return FakeCollection(self.store, name)
+
+
+def test_bootstrap_with_projection_then_reuse_local_snapshot(tmp_path, monkeypatch):
+    """manifest가 없으면 projection으로 재구성하고, 이후에는 메타 문서만 읽는지 확인"""
+    monkeypatch.setattr(sync_state, "LOCAL_STATE_DIR", str(tmp_path))
+    db = FakeDB({"1": {"mod_date": "a", "contents": "x" * 1000}, "2": {"mod_date": "b"}})
+
+    index = load_job_index(db)
+    assert index.ids == {"1": "a", "2": "b"}
+    assert db.store["projections"] == [["mod_date"]]
+    index.add("3", "c")
+    save_job_index(db, index)
+
+    db.store["reads"].clear()
+    again = load_job_index(db)
+    assert again.id_set() == {"1", "2", "3"}
+    assert db.store["reads"] == ["job_index_meta"]  # manifest는 읽지 않음
+    assert db.store["projections"] == [["mod_date"]]
+
+
+def test_stale_snapshot_reloads_manifest_and_remove(tmp_path, monkeypatch):
+    """다른 실행이 색인을 바꾸면 manifest를 다시 읽고, 삭제도 반영되는지 확인"""
+    monkeypatch.setattr(sync_state, "LOCAL_STATE_DIR", str(tmp_path))
+    db = FakeDB({"1": {"mod_date": "a"}, "2": {"mod_date": "b"}})
+    save_job_index(db, load_job_index(db))
+
+    other = load_job_index(db)
+    other.remove(["1"])
+    save_job_index(db, other)
+    sync_state.save_state(None, "job_index", {"ids": {"1": "a", "2": "b"}, "revision": "old"})
+
+    index = load_job_index(db)
+    assert index.id_set() == {"2"}
+    assert "job_index" in db.store["reads"]
+
+
+def test_concurrent_saves_merge_per_id(tmp_path, monkeypatch):
+    """동시에 읽은 두 실행이 저장해도 서로의 추가/삭제를 덮어쓰지 않는지 확인 (동기화와 정리가 겹친 경우)"""
+    monkeypatch.setattr(sync_state, "LOCAL_STATE_DIR", str(tmp_path))
+    db = FakeDB({"1": {"mod_date": "a"}, "2": {"mod_date": "b"}})
+    save_job_index(db, load_job_index(db))
+
+    sync = load_job_index(db)
+    cleanup = load_job_index(db)
+    cleanup.remove(["1"])
+    save_job_index(db, cleanup)
+    sync.add("3", "c")
+    save_job_index(db, sync)
+
+    assert db.store["docs"]["job_index"]["ids"] == {"2": "b", "3": "c"}
+    assert sync.ids == {"2": "b", "3": "c"}
+    # 마지막 저장이 읽은 manifest가 로컬 스냅샷이 되므로 다음 실행도 삭제를 그대로 본다
+    assert load_job_index(db).id_set() == {"2", "3"}
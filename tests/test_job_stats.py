@@ -0,0 +1,42 @@
+"""
+채용공고 통계 집계 테스트
+"""
+from datetime import date
+
+from job_stats import JobStats
+
+TODAY = date(2025, 9, 10)
+
+
+def _job(idx, reg_date="20250909", end_date="20250920", dept="행정안전부", region="서울", grade="9급"):
+    return {"idx": idx, "reg_date": reg_date, "end_date": end_date, "dept_name": dept,
+            "work_region": region, "grade": grade}
+
+
+def test_incremental_updates_match_full_rebuild():
+    """추가/수정/삭제를 증분 반영한 결과가 전체 재계산과 같은지 확인"""
+    jobs = [
+        _job("1", end_date="20250910"),                       # D-0 임박
+        _job("2", end_date="20250913", dept="국세청"),         # D-3 임박
+        _job("3", reg_date="20250901", end_date="20250914"),  # 최근 아님, D-4
+        _job("4", end_date="99991231", region="", grade=""),  # 상시채용
+    ]
+    stats = JobStats()
+    for job in jobs:
+        stats.add(job)
+    stats.add(_job("3", reg_date="20250905", end_date="20250914", dept="국세청"))  # 수정
+    stats.remove(["2", "404"])
+
+    summary = stats.summary(TODAY)
+    assert summary["total_jobs"] == 3
+    assert summary["urgent_jobs"] == 1
+    assert summary["recent_jobs"] == 3
+    assert summary["total_departments"] == 2
+    assert summary["by_region"] == {"서울": 2, "기타": 1}
+    assert summary["by_grade"] == {"9급": 2, "기타": 1}
+
+    expected = JobStats.from_jobs([jobs[0], _job("3", reg_date="20250905", end_date="20250914", dept="국세청"), jobs[3]])
+    assert stats.to_dict() == expected.to_dict()
+    # 항목만으로 집계를 다시 만들 수 있다
+    assert JobStats(stats.to_dict()["entries"]).summary(TODAY) == summary
+
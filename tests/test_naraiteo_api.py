@@ -0,0 +1,274 @@
+"""
+나라일터 API 클라이언트 테스트 (네트워크 호출 없음)
+"""
+import random
+import threading
+import time
+
+import pytest
+import requests
+
+import naraiteo_api
+from naraiteo_api import (
+    DEFAULT_CATEGORY,
+    JOB_CATEGORIES,
+    APIConnectionError,
+    CircuitBreaker,
+    CircuitOpenError,
+    NaraiteoAPI,
+    RateLimiter,
+    backoff_delay,
+)
+
+
+def test_enrich_jobs_keeps_original_order(monkeypatch):
+    """병렬 보강 결과가 원래 목록 순서를 유지하는지 확인"""
+    api = NaraiteoAPI(max_workers=4)
+    seen_threads = set()
+
+    def fake_detail(idx, mod_date=None):
+        seen_threads.add(threading.get_ident())
+        time.sleep(random.uniform(0, 0.02))
+        return {"idx": idx, "contents": f"본문 {idx}"}
+
+    monkeypatch.setattr(api, "get_job_detail", fake_detail)
+    monkeypatch.setattr(api, "get_job_files", lambda idx, mod_date=None: [{"job_idx": idx}])
+
+    jobs = [{"idx": str(i), "title": f"공고 {i}"} for i in range(20)]
+    enriched = api.enrich_jobs(jobs)
+
+    assert [job["idx"] for job in enriched] == [str(i) for i in range(20)]
+    assert enriched[3]["contents"] == "본문 3"
+    assert enriched[3]["files"] == [{"job_idx": "3"}]
+    assert len(seen_threads) > 1
+
+
+def test_rate_limiter_paces_after_burst():
+    """버스트를 모두 소비하면 초당 요청 수에 맞춰 대기하는지 확인"""
+    limiter = RateLimiter(requests_per_second=50, burst=2)
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == pytest.approx(0.02, abs=0.015)
+
+
+def test_host_rate_limiter_applies_configured_rate():
+    """같은 호스트의 버킷을 공유하되, 다른 속도/버스트로 만든 클라이언트의 설정이 실제로 적용되는지 확인"""
+    with NaraiteoAPI(requests_per_second=50, burst=2) as first:
+        with NaraiteoAPI(requests_per_second=20, burst=1) as second:
+            assert second.rate_limiter is first.rate_limiter
+            limiter = second.rate_limiter
+            assert (limiter.rate, limiter.capacity) == (20, 1)
+            limiter._tokens = 1.0
+            assert limiter.acquire() == 0
+            assert limiter.acquire() == pytest.approx(0.05, abs=0.02)
+
+
+def test_client_reuses_pooled_session(monkeypatch):
+    """모든 요청이 하나의 keep-alive 세션을 거치고 종료 시 정리되는지 확인"""
+    calls = []
+
+    class FakeResponse:
+        status_code = 200
+        content = b"<response><header><resultCode>00</resultCode></header><body><items/></body></response>"
+
+        def raise_for_status(self):
+            pass
+
+    with NaraiteoAPI(max_workers=2, pool_size=4) as api:
+        adapter = api.session.get_adapter(api.base_url)
+        assert adapter._pool_maxsize == 4
+        monkeypatch.setattr(api.session, "get", lambda url, **kwargs: calls.append(url) or FakeResponse())
+        api.get_job_list()
+        api.get_job_files("1")
+        closed = []
+        monkeypatch.setattr(api.session, "close", lambda: closed.append(True))
+
+    assert [url.rsplit("/", 1)[-1] for url in calls] == ["getList", "getItemFile"]
+    assert closed == [True]
+
+
+def test_list_total_count_reads_total(monkeypatch):
+    """totalCount를 한 건짜리 목록 요청으로 읽고, 카테고리마다 기관구분/공고유형을 바꿔 조회하는지 확인"""
+    params = []
+
+    class FakeResponse:
+        status_code = 200
+        content = (b"<response><header><resultCode>00</resultCode></header>"
+                   b"<body><items/><numOfRows>1</numOfRows><totalCount>1234</totalCount></body></response>")
+
+        def raise_for_status(self):
+            pass
+
+    with NaraiteoAPI() as api:
+        monkeypatch.setattr(api.session, "get", lambda url, **kwargs: params.append(kwargs["params"]) or FakeResponse())
+        assert api.get_list_total_count() == 1234
+        api.get_list_total_count(category="public")
+    assert params[0]["numOfRows"] == 1
+    assert (params[0]["Instt_se"], params[0]["Pblanc_ty"]) == JOB_CATEGORIES[DEFAULT_CATEGORY]
+    assert (params[1]["Instt_se"], params[1]["Pblanc_ty"]) == JOB_CATEGORIES["public"]
+
+
+def test_rate_limiter_backs_off_and_recovers():
+    """오류 시 속도를 절반으로 낮추고 성공 응답으로 설정 속도까지 회복하는지 확인"""
+    limiter = RateLimiter(requests_per_second=10, burst=5, min_rate=2)
+    limiter.penalize()
+    assert limiter.rate == 5
+    limiter.penalize()
+    limiter.penalize()
+    assert limiter.rate == 2
+    for _ in range(20):
+        limiter.reward()
+    assert limiter.rate == 10
+
+
+def test_backoff_delay_is_bounded():
+    """지수 백오프 대기 시간이 상한 안에서 무작위로 정해지는지 확인"""
+    for attempt in range(1, 10):
+        delay = backoff_delay(attempt, base=1, cap=16)
+        assert 0 <= delay <= min(16, 2 ** (attempt - 1))
+
+
+def test_circuit_breaker_fails_fast_after_threshold(monkeypatch):
+    """연속 실패 후 차단기가 열리면 네트워크 호출 없이 즉시 실패하는지 확인"""
+    api = NaraiteoAPI()
+    monkeypatch.setattr(api, "rate_limiter", RateLimiter(requests_per_second=1000, burst=100))
+    monkeypatch.setattr(naraiteo_api.time, "sleep", lambda seconds: None)
+    calls = []
+
+    def dead_endpoint(url, **kwargs):
+        calls.append(url)
+        raise requests.exceptions.ConnectTimeout("timeout")
+
+    monkeypatch.setattr(api.session, "get", dead_endpoint)
+
+    with pytest.raises(CircuitOpenError) as first:
+        api.get_job_files("1")
+    assert isinstance(first.value, APIConnectionError)
+    assert len(calls) == naraiteo_api.CIRCUIT_FAILURE_THRESHOLD
+    assert api.circuit_state("getItemFile") == CircuitBreaker.OPEN
+    assert not api.is_endpoint_available("getItemFile")
+    assert api.is_endpoint_available("getItem")
+
+    with pytest.raises(CircuitOpenError):
+        api.get_job_files("2")
+    assert len(calls) == naraiteo_api.CIRCUIT_FAILURE_THRESHOLD
+    assert api.get_optional("getItemFile", api.get_job_files, "3", default=[]) == []
+
+
+def test_server_errors_retry_through_rate_limiter(monkeypatch):
+    """어댑터는 재시도하지 않고 502/503/504는 _send가 속도 제한/차단기를 거쳐 다시 보내는지 확인"""
+    api = NaraiteoAPI()
+    retry = api.session.get_adapter(api.base_url).max_retries
+    assert (retry.total, retry.connect, retry.status) == (0, 0, 0)
+    limiter = RateLimiter(requests_per_second=1000, burst=100)
+    acquired = []
+    monkeypatch.setattr(limiter, "acquire", lambda: acquired.append(True) or 0)
+    monkeypatch.setattr(api, "rate_limiter", limiter)
+    monkeypatch.setattr(naraiteo_api.time, "sleep", lambda seconds: None)
+    statuses = [503, 502, 200]
+
+    class FakeResponse:
+        content = b"<response><header><resultCode>00</resultCode></header><body><items/></body></response>"
+
+        def __init__(self, status_code):
+            self.status_code = status_code
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise requests.exceptions.HTTPError(f"{self.status_code} error", response=self)
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(api.session, "get", lambda url, **kwargs: FakeResponse(statuses.pop(0)))
+    assert api.get_job_files("1") == []
+    assert len(acquired) == 3
+    assert api.circuit_state("getItemFile") == CircuitBreaker.CLOSED
+
+
+def test_circuit_breaker_half_open_probe():
+    """재시도 시간이 지나면 시험 요청 1건만 허용하고 성공 시 닫히는지 확인"""
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0)
+    breaker.record_failure(RuntimeError("down"))
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_response_cache_replays_and_invalidates_on_moddate(monkeypatch):
+    """캐시된 응답은 네트워크 없이 재사용하고 moddate가 바뀌면 다시 요청하는지 확인"""
+    from response_cache import ResponseCache
+
+    calls = []
+
+    class FakeResponse:
+        status_code = 200
+        content = (
+            "<response><header><resultCode>00</resultCode></header><body><items><item>"
+            "<name>간호서기</name><cnt>4</cnt></item></items></body></response>"
+        ).encode("utf-8")
+
+        def raise_for_status(self):
+            pass
+
+    with NaraiteoAPI(cache=ResponseCache(":memory:")) as api:
+        monkeypatch.setattr(api.session, "get", lambda url, **kwargs: calls.append(url) or FakeResponse())
+
+        first = api.get_job_position("10", mod_date="20250801")
+        second = api.get_job_position("10", mod_date="20250801")
+        assert first["full_grade"] == second["full_grade"] == "간호서기 4명"
+        assert len(calls) == 1
+
+        api.get_job_position("10", mod_date="20250805")
+        assert len(calls) == 2
+        assert api.cache.hits == 1
+
+
+def test_iter_job_list_streams_items(monkeypatch):
+    """스트리밍 목록 조회가 <item>마다 공고를 넘기고 오류 응답을 구분하는지 확인"""
+    import io
+
+    items = "".join(
+        f"<item><idx>{i}</idx><title>2025년 9급 공채 {i}</title><regdate>20250827</regdate>"
+        f"<moddate>20250828</moddate><readnum>3</readnum></item>"
+        for i in range(3)
+    )
+    body = (
+        "<response><header><resultCode>00</resultCode><resultMsg>OK</resultMsg></header>"
+        f"<body><items>{items}</items></body></response>"
+    ).encode("utf-8")
+
+    class FakeStreamResponse:
+        status_code = 200
+
+        def __init__(self, payload):
+            self.raw = io.BytesIO(payload)
+            self.closed = False
+
+        def raise_for_status(self):
+            pass
+
+        def close(self):
+            self.closed = True
+
+    responses = []
+
+    def fake_get(url, stream=False, **kwargs):
+        assert stream is True
+        responses.append(FakeStreamResponse(body))
+        return responses[-1]
+
+    api = NaraiteoAPI()
+    monkeypatch.setattr(api.session, "get", fake_get)
+
+    stream = api.iter_job_list(num_of_rows=3)
+    first = next(stream)
+    assert first["idx"] == "0" and first["grade"] == "9급"
+    assert [job["idx"] for job in stream] == ["1", "2"]
+    assert responses[-1].closed
+
+    body = b"<response><header><resultCode>99</resultCode><resultMsg>LIMIT</resultMsg></header></response>"
+    with pytest.raises(RuntimeError, match="99"):
+        list(api.iter_job_list())
@@ -0,0 +1,122 @@
+"""
+단계별 생산자/소비자 파이프라인 테스트
+"""
+import threading
+import time
+
+import pytest
+
+from pipeline import Pipeline, Stage, merge_sources
+
+
+def test_items_flow_through_stages_and_none_drops_item():
+    """모든 항목이 단계를 거쳐 sink에 도착하고, None을 반환한 항목은 걸러지는지 확인"""
+    consumed = []
+    stages = [
+        Stage("even", lambda n: n if n % 2 == 0 else None, workers=2),
+        Stage("square", lambda n: n * n, workers=3),
+    ]
+    pipeline = Pipeline(range(20), stages, consumed.append).run()
+    assert sorted(consumed) == [n * n for n in range(0, 20, 2)]
+    assert pipeline.produced == 20 and pipeline.consumed == 10
+    assert stages[0].processed == 20 and stages[0].passed == 10
+
+
+def test_bounded_queues_apply_backpressure():
+    """sink가 느리면 원천이 큐 크기 이상 앞서 나가지 않는지 확인"""
+    produced = []
+    max_ahead = [0]
+
+    def source():
+        for n in range(30):
+            produced.append(n)
+            yield n
+
+    def sink(n):
+        max_ahead[0] = max(max_ahead[0], len(produced) - n)
+        time.sleep(0.002)
+
+    Pipeline(source(), [Stage("pass", lambda n: n, queue_size=2)], sink, sink_queue_size=2).run()
+    # 큐 2개(각 2칸) + 작업 중인 항목만큼만 먼저 읽는다
+    assert max_ahead[0] <= 7
+
+
+def test_stage_error_stops_source_and_is_raised():
+    """단계에서 예외가 나면 새 항목 생성을 멈추고 run()에서 그 예외를 다시 발생시키는지 확인"""
+    closed = threading.Event()
+
+    def source():
+        try:
+            for n in range(10000):
+                yield n
+        finally:
+            closed.set()
+
+    def fail(n):
+        if n == 5:
+            raise ValueError("boom")
+        return n
+
+    pipeline = Pipeline(source(), [Stage("fail", fail, queue_size=2)], lambda n: None, sink_queue_size=2)
+    with pytest.raises(ValueError, match="boom"):
+        pipeline.run()
+    assert closed.is_set()
+    assert pipeline.produced < 100
+
+
+def test_priority_stage_and_drain_leave_unstarted_items():
+    """drain 뒤에는 처리 중인 항목만 끝내고 시작하지 않은 항목은 leftover로 남는지 확인"""
+    gate = threading.Event()
+    processed = []
+    consumed = []
+
+    def work(n):
+        gate.wait()
+        processed.append(n)
+        return n
+
+    stages = [Stage("work", work, priority=lambda n: -n, queue_size=10)]
+    pipeline = Pipeline(range(5), stages, consumed.append)
+    runner = threading.Thread(target=pipeline.run)
+    runner.start()
+    while pipeline.produced < 5:
+        time.sleep(0.001)
+    time.sleep(0.01)
+    pipeline.drain()
+    gate.set()
+    runner.join()
+
+    # 처리 중이던 첫 항목만 끝까지 저장되고 나머지는 다음 실행으로 넘긴다
+    assert consumed == processed and len(processed) == 1
+    assert sorted(pipeline.leftover + processed) == list(range(5))
+
+
+def test_priority_queue_orders_by_key():
+    """우선순위 단계는 입력 큐에 쌓인 항목을 작은 키부터 처리하는지 확인"""
+    consumed = []
+    gate = threading.Event()
+
+    def source():
+        yield from [3, 1, 4, 1, 5, 9, 2, 6]
+        gate.set()
+
+    def work(n):
+        gate.wait()
+        return n
+
+    Pipeline(source(), [Stage("work", work, priority=lambda n: n, queue_size=10)], consumed.append).run()
+    # 첫 항목은 큐가 차기 전에 꺼내지므로 제외하고 나머지는 키 순서
+    assert consumed[1:] == sorted(consumed[1:])
+
+
+def test_merge_sources_reads_all_sources_and_raises_errors():
+    """여러 원천을 동시에 읽어 모든 항목을 넘기고, 원천 예외는 소비자 쪽에서 다시 발생시키는지 확인"""
+    merged = list(merge_sources([range(0, 50), range(100, 130), iter([])], queue_size=4))
+    assert sorted(merged) == list(range(0, 50)) + list(range(100, 130))
+
+    def broken():
+        yield 1
+        raise ValueError("list down")
+
+    with pytest.raises(ValueError, match="list down"):
+        list(merge_sources([broken(), range(10)], queue_size=2))
@@ -0,0 +1,63 @@
+"""
+수집 제외 공고 기록 테스트
+"""
+import sync_state
+from rejected_jobs import BloomFilter, RejectedJobs, load_rejected_jobs, save_rejected_jobs
+
+
+def _job(idx, mod_date="20250901", reg_date="20250801"):
+    return {"idx": idx, "mod_date": mod_date, "reg_date": reg_date}
+
+
+def test_bloom_filter_membership_survives_round_trip():
+    bloom = BloomFilter(bits=1 << 12)
+    for i in range(100):
+        bloom.add(f"{i}:m")
+    restored = BloomFilter.from_dict(bloom.to_dict())
+    assert all(f"{i}:m" in restored for i in range(100))
+    assert restored.count == 100
+    # 오탐률이 충분히 낮은지 (4096비트에 100건)
+    assert sum(f"{i}:x" in restored for i in range(1000)) < 20
+
+
+def test_recent_records_follow_mod_date():
+    """moddate가 같으면 건너뛰고, 공고가 수정되면 다시 확인"""
+    rejected = RejectedJobs()
+    rejected.add(_job("1"), "20250910", "수집 제외")
+    assert rejected.contains(_job("1"))
+    assert not rejected.contains(_job("1", mod_date="20250905"))
+    assert not rejected.contains(_job("2"))
+
+    rejected.discard("1")
+    assert not rejected.contains(_job("1"))
+
+
+def test_old_records_move_to_bloom_filter_for_old_postings_only(tmp_path, monkeypatch):
+    """오래된 기록은 Bloom filter로 옮겨지고, 등록일이 기준일보다 오래된 공고에만 적용"""
+    monkeypatch.setattr(sync_state, "LOCAL_STATE_DIR", str(tmp_path))
+    rejected = load_rejected_jobs(None)
+    rejected.add(_job("1"), "20250801", "데이터 정리")
+    rejected.add(_job("2"), "20250905", "수집 제외")
+    save_rejected_jobs(None, rejected, today="20250910")
+    assert list(rejected.recent) == ["2"] and rejected.bloom.count == 1
+
+    restored = load_rejected_jobs(None)
+    assert restored.contains(_job("1"), cutoff="20250811")
+    assert not restored.contains(_job("1", mod_date="20250909"), cutoff="20250811")
+    # 최근 등록 공고는 Bloom filter 오탐으로 건너뛰지 않도록 정확한 기록만 본다
+    assert not restored.contains(_job("1", reg_date="20250901"), cutoff="20250811")
+    assert restored.contains(_job("2"))
+
+
+def test_concurrent_saves_keep_each_others_records(tmp_path, monkeypatch):
+    """동기화가 먼저 읽은 기록을 나중에 저장해도 그 사이 데이터 정리가 남긴 기록이 지워지지 않는지 확인"""
+    monkeypatch.setattr(sync_state, "LOCAL_STATE_DIR", str(tmp_path))
+    sync = load_rejected_jobs(None)
+    cleanup = load_rejected_jobs(None)
+    cleanup.add(_job("1"), "20250910", "데이터 정리")
+    save_rejected_jobs(None, cleanup, today="20250910")
+    sync.add(_job("2"), "20250910", "수집 제외")
+    save_rejected_jobs(None, sync, today="20250910")
+
+    restored = load_rejected_jobs(None)
+    assert restored.contains(_job("1")) and restored.contains(_job("2"))
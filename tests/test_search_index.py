@@ -0,0 +1,39 @@
+"""
+검색 색인 테스트
+"""
+from search_index import build_search_index, choseong, jamo, normalize, search
+
+JOBS = [
+    {"title": "2025년 행정 9급 공개채용", "dept_name": "서울특별시청", "grade": "9급", "work_region": "서울"},
+    {"title": "시설관리 공무직 채용", "dept_name": "부산광역시 해운대구", "grade": "공무직", "work_region": "부산"},
+    {"title": "연구원 채용 공고", "dept_name": "한국과학기술연구원", "grade": "연구원", "work_region": "서울"},
+]
+
+
+def test_hangul_helpers():
+    """초성/자모 분해와 정규화 확인"""
+    assert choseong("행정 9급") == "ㅎㅈ 9ㄱ"
+    assert jamo("과") == "ㄱㅗㅏ"
+    assert normalize(" 행정  9급 ") == "행정9급"
+
+
+def test_search_matches_linear_scan():
+    """색인 조회 결과가 전체 자모 비교(선형 탐색)와 같은지 확인"""
+    index = build_search_index(JOBS)
+    fields = index["fields"]
+    for query in ("행정", "서울", "공무직", "9급", "연구", "채용", "해운대", "과학기술"):
+        expected = [doc for doc, job in enumerate(JOBS)
+                    if any(jamo(normalize(query)) in jamo(normalize(job[field])) for field in fields)]
+        assert search(index, JOBS, query) == expected, query
+
+
+def test_partial_and_choseong_queries():
+    """입력 중인 글자와 초성만으로도 찾는지 확인"""
+    index = build_search_index(JOBS)
+    assert search(index, JOBS, "행저") == [0]      # "행정" 입력 중
+    assert search(index, JOBS, "공뭊") == [1]      # "공무직" 입력 중 (받침이 다음 글자로 넘어가기 전)
+    assert search(index, JOBS, "과") == [1, 2]      # "광역시", "과학"
+    assert search(index, JOBS, "과하") == [2]       # "과학" 입력 중
+    assert search(index, JOBS, "ㅎㅇㄷ") == [1]    # 해운대
+    assert search(index, JOBS, "ㅅ") == [0, 1, 2]
+    assert search(index, JOBS, "") == [0, 1, 2]
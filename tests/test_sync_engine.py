@@ -0,0 +1,191 @@
+"""
+동기화 엔진 테스트 (가짜 API와 Firestore로 파이프라인 전체 실행)
+"""
+import time
+from datetime import datetime
+
+import sync_engine
+import sync_state
+from auto_sync_scheduler import SYNC_CONFIG, build_job_document
+from firestore_writer import BatchWriter
+from job_index import load_job_index
+from rejected_jobs import load_rejected_jobs
+from sync_engine import SyncConfig, SyncEngine
+from tests.fakes import FakeAPI, FakeJobsDB, make_job
+
+TODAY = datetime(2025, 9, 10)
+# FakeAPI는 카테고리를 구분하지 않으므로 기본 카테고리만 수집 (여러 카테고리는 CategoryAPI로 확인)
+CONFIG = SyncConfig(**{**vars(SYNC_CONFIG), "categories": ("government",)})
+
+
+def _run(monkeypatch, tmp_path, api, config=CONFIG):
+    monkeypatch.setattr(sync_state, "LOCAL_STATE_DIR", str(tmp_path))
+    db = FakeJobsDB()
+    # 상태 문서는 로컬 파일, 게시글 문서는 가짜 Firestore로 저장
+    monkeypatch.setattr(sync_engine, "BatchWriter", lambda _: BatchWriter(db))
+    result = SyncEngine(None, api, config, today=TODAY).run()
+    return db, result
+
+
+def test_pipeline_collects_enriches_and_records_state(monkeypatch, tmp_path):
+    """목록 날짜/상세 기준 필터링, 보강, 저장, 상태 반영까지 한 번에 확인"""
+    pages = [[make_job("1"), make_job("2", reg_date="2025-07-01", end_date="2025-07-15"),
+              make_job("3", reg_date="", end_date="")]]
+    details = {"1": {**make_job("1"), "dept_name": "국세청"},
+               "3": make_job("3", reg_date="2025-07-01", end_date="2025-07-15")}
+    api = FakeAPI(pages, details)
+    db, result = _run(monkeypatch, tmp_path, api)
+
+    # 2는 목록 날짜만으로 제외되어 상세 조회하지 않고, 3은 상세 조회 후 제외
+    assert sorted(api.detail_calls) == ["1", "3"]
+    assert result.prefiltered == 1 and result.filtered == 1 and result.written == 1
+    saved = db.docs["1"]
+    assert saved["grade"] == "9급 1명" and saved["files"] == [{"file_name": "1.hwp"}]
+    assert saved["data_completeness"] == "full_4api" and "created_at" in saved
+
+    assert load_job_index(None).id_set() == {"1"}
+    assert load_rejected_jobs(None).contains(pages[0][2])
+    assert sync_state.load_watermark(None).idx == "1"
+
+    # 다음 실행은 저장된 공고와 제외 기록을 다시 상세 조회하지 않는다
+    api.detail_calls.clear()
+    _, result = _run(monkeypatch, tmp_path, api)
+    assert api.detail_calls == [] and result.written == 0
+
+
+def test_failed_stage_keeps_watermark_and_checkpoints_pending(monkeypatch, tmp_path):
+    """파이프라인이 예외로 중단되면 워터마크를 전진시키지 않고 읽은 공고를 체크포인트에 남기는지 확인"""
+    class BrokenAPI(FakeAPI):
+        def get_job_detail(self, idx, mod_date=None):
+            raise ConnectionError("down")
+
+    config = SyncConfig(name="TEST", criteria=SYNC_CONFIG.criteria, build_document=build_job_document)
+    api = BrokenAPI([[make_job("1"), make_job("2")]], {})
+    try:
+        _run(monkeypatch, tmp_path, api, config)
+    except ConnectionError:
+        pass
+    else:
+        raise AssertionError("예외가 전파되지 않음")
+    assert sync_state.load_watermark(None).idx == ""
+    assert sorted(job["idx"] for job in sync_state.load_checkpoint(None).pending) == ["1", "2"]
+
+    # 연결이 회복되면 이월된 공고부터 처리
+    api = FakeAPI([[]], {"1": make_job("1"), "2": make_job("2")})
+    _, result = _run(monkeypatch, tmp_path, api, config)
+    assert result.carried == 2 and result.written == 2
+
+
+def test_time_budget_carries_leftover_to_next_run(monkeypatch, tmp_path):
+    """시간 예산에 도달하면 처리 중인 공고만 저장하고 남은 공고를 다음 실행으로 넘기는지 확인"""
+    class SlowAPI(FakeAPI):
+        def get_job_detail(self, idx, mod_date=None):
+            time.sleep(0.1)
+            return super().get_job_detail(idx, mod_date)
+
+    pages = [[make_job(str(i)) for i in range(1, 9)]]
+    details = {job["idx"]: job for job in pages[0]}
+    config = SyncConfig(name="TEST", criteria=SYNC_CONFIG.criteria, build_document=build_job_document,
+                        time_budget=1, stop_margin=0.95)
+    db, result = _run(monkeypatch, tmp_path, SlowAPI(pages, details), config)
+    assert result.timed_out and result.leftover >= 1
+    assert result.written + result.leftover == len(pages[0])
+    backlog = sync_state.load_checkpoint(None).pending
+    assert sorted(job["idx"] for job in backlog) == sorted(set(details) - set(db.docs))
+    # 읽지 못한 목록이 남았을 수 있으므로 워터마크는 그대로 둔다
+    assert sync_state.load_watermark(None).idx == ""
+
+    # 다음 실행은 이월된 공고를 먼저 넘기고, 목록에 다시 나온 공고는 중복으로 넘기지 않는다
+    db, next_result = _run(monkeypatch, tmp_path, FakeAPI(pages, details))
+    assert next_result.carried == len(backlog) and next_result.written == result.leftover
+    assert sync_state.load_checkpoint(None).pending == []
+
+
+def test_detail_priority_prefers_urgent_then_newest():
+    """상세 조회 순서: 마감 임박 공고, 최신 등록일 순"""
+    engine = SyncEngine(None, FakeAPI([], {}), SYNC_CONFIG, today=TODAY)
+    jobs = [make_job("old", reg_date="2025-09-01", end_date="2025-10-01"),
+            make_job("new", reg_date="2025-09-09", end_date="2025-10-01"),
+            make_job("urgent", reg_date="2025-08-20", end_date="2025-09-12")]
+    ranked = sorted(jobs, key=lambda job: engine.priority({"basic_info": job}))
+    assert [job["idx"] for job in ranked] == ["urgent", "new", "old"]
+
+
+class PagedAPI(FakeAPI):
+    """totalCount와 페이지 단위 목록을 주는 가짜 API (fail_pages는 연결 오류)"""
+
+    def __init__(self, pages, details, fail_pages=()):
+        super().__init__(pages, details)
+        self.fail_pages = set(fail_pages)
+        self.listed_pages = []
+
+    def get_list_total_count(self, category="government"):
+        return sum(len(page) for page in self.pages)
+
+    def get_job_list(self, page_no=1, num_of_rows=20, category="government"):
+        self.listed_pages.append(page_no)
+        if page_no in self.fail_pages:
+            raise ConnectionError("getList 연결 실패")
+        return list(self.pages[page_no - 1])
+
+
+def test_backfill_resumes_from_checkpoint(monkeypatch, tmp_path):
+    """백필이 중단되면 끝낸 페이지를 기록하고, 다음 실행은 남은 페이지만 읽어 마무리하는지 확인"""
+    pages = [[make_job(str(p * 2 + i), reg_date="2025-08-01", end_date="2025-09-30") for i in range(2)]
+             for p in range(4)]
+    details = {job["idx"]: job for page in pages for job in page}
+    config = SyncConfig(name="BACKFILL", criteria=SYNC_CONFIG.criteria, build_document=build_job_document,
+                        incremental=False, backfill=True, rows_per_page=2, checkpoint="backfill")
+    api = PagedAPI(pages, details, fail_pages={4})
+    try:
+        _run(monkeypatch, tmp_path, api, config)
+    except ConnectionError:
+        pass
+    checkpoint = sync_state.load_checkpoint(None, "backfill")
+    assert checkpoint.total_count == 8 and checkpoint.pages_done <= {1, 2, 3}
+    written_first = set(load_job_index(None).id_set())
+
+    api = PagedAPI(pages, details)
+    db, result = _run(monkeypatch, tmp_path, api, config)
+    assert sorted(api.listed_pages) == sorted({1, 2, 3, 4} - checkpoint.pages_done)
+    assert set(db.docs) == set(details) - written_first and result.listed_all
+    assert load_job_index(None).id_set() == set(details)
+    # 백필이 끝나면 체크포인트를 비워 다음 백필은 처음부터 시작
+    assert sync_state.load_checkpoint(None, "backfill").pages_done == set()
+
+
+def test_categories_list_concurrently_with_separate_state(monkeypatch, tmp_path):
+    """카테고리마다 목록을 따로 읽어 워터마크를 따로 두고, 한 카테고리의 목록 오류가 다른 카테고리를 막지 않는지 확인"""
+    class CategoryAPI(FakeAPI):
+        def __init__(self, listings, details):
+            super().__init__([], details)
+            self.listings = listings
+
+        def iter_job_list(self, page_no=1, num_of_rows=20, category="government"):
+            listing = self.listings[category]
+            if isinstance(listing, Exception):
+                raise listing
+            pages = [[{**job, "category": category} for job in page] for page in listing]
+            return iter(pages[page_no - 1] if page_no <= len(pages) else [])
+
+    details = {idx: make_job(idx) for idx in ("1", "2", "p1")}
+    config = SyncConfig(**{**vars(SYNC_CONFIG), "categories": ("government", "public", "local")})
+    api = CategoryAPI({"government": [[make_job("1"), make_job("2")]], "public": [[make_job("p1")]],
+                       "local": ConnectionError("local down")}, details)
+    db, result = _run(monkeypatch, tmp_path, api, config)
+
+    assert result.written == 3 and list(result.errors) == ["local"]
+    assert db.docs["1"]["category"] == "government" and db.docs["p1"]["category"] == "public"
+    # 기본 카테고리는 기존 워터마크 문서를 그대로 쓰고, 실패한 카테고리는 전진시키지 않는다
+    assert sync_state.load_watermark(None).idx == "2"
+    assert sync_state.load_watermark(None, "watermark_public").idx == "p1"
+    assert sync_state.load_watermark(None, "watermark_local").idx == ""
+
+    # 모든 카테고리가 실패하면 예외를 그대로 알린다
+    api = CategoryAPI({key: ConnectionError("down") for key in config.categories}, details)
+    try:
+        _run(monkeypatch, tmp_path, api, config)
+    except ConnectionError:
+        pass
+    else:
+        raise AssertionError("예외가 전파되지 않음")
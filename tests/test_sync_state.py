@@ -0,0 +1,79 @@
+"""
+동기화 상태(워터마크) 테스트
+"""
+import sync_state
+from sync_state import SyncWatermark, date_key, load_watermark, save_watermark
+
+
+def test_date_key_normalizes_formats():
+    """여러 날짜 형식을 YYYYMMDD로 정규화하는지 확인"""
+    assert date_key("2025-08-27") == "20250827"
+    assert date_key("2025.08.27") == "20250827"
+    assert date_key("20250827") == "20250827"
+    assert date_key(None) == ""
+
+
+def test_watermark_cutoff_and_changes():
+    """워터마크 이전 공고에서 멈추고 moddate가 바뀐 공고만 감지하는지 확인"""
+    watermark = SyncWatermark()
+    assert not watermark.reached({"reg_date": "20200101"})
+
+    watermark.observe({"idx": "99", "reg_date": "20250827", "end_date": "20250901", "mod_date": "a"})
+    watermark.observe({"idx": "100", "reg_date": "20250827", "end_date": "20250901", "mod_date": "b"})
+    watermark.commit()
+    assert (watermark.reg_date, watermark.idx) == ("20250827", "100")
+
+    # lookback 1일: 전날 공고까지는 계속 확인하고 그 이전에서 멈춘다
+    assert not watermark.reached({"reg_date": "20250826"})
+    assert watermark.reached({"reg_date": "20250825"})
+
+    assert not watermark.changed({"idx": "99", "mod_date": "a"})
+    assert watermark.changed({"idx": "99", "mod_date": "a2"})
+    assert not watermark.changed({"idx": "123", "mod_date": "x"})
+
+
+def test_watermark_prune_and_local_roundtrip(tmp_path, monkeypatch):
+    """수집 기준을 벗어난 기록을 정리하고 로컬 상태 파일로 저장/복원되는지 확인"""
+    monkeypatch.setattr(sync_state, "LOCAL_STATE_DIR", str(tmp_path))
+    watermark = SyncWatermark(known={
+        "1": ["20250101", "20250110", ""],   # 등록 30일 경과 + 마감
+        "2": ["20250101", "20251231", ""],   # 마감일 미도과
+        "3": ["20250820", "20250825", ""],   # 등록 30일 이내
+    })
+    watermark.prune(today="20250901", cutoff="20250802")
+    assert sorted(watermark.known) == ["2", "3"]
+
+    save_watermark(None, watermark)
+    restored = load_watermark(None)
+    assert restored.known == watermark.known
+
+
+def test_failed_read_is_not_saved_over_existing_state(tmp_path, monkeypatch):
+    """상태 문서 조회에 실패하면 빈 상태로 덮어쓰지 않고, 문서가 없을 때만 기본값을 쓰는지 확인"""
+    import rejected_jobs
+    from rejected_jobs import load_rejected_jobs, save_rejected_jobs
+
+    class BrokenDB:
+        def collection(self, name):
+            raise ConnectionError("firestore down")
+
+    assert sync_state.load_state(None, "missing", {"a": 1}) == {"a": 1}
+    try:
+        sync_state.load_state(BrokenDB(), "watermark")
+    except ConnectionError:
+        pass
+    else:
+        raise AssertionError("조회 오류가 '상태 없음'으로 처리됨")
+
+    saved = []
+    monkeypatch.setattr(sync_state, "save_state", lambda db, name, data: saved.append(name))
+    monkeypatch.setattr(rejected_jobs, "merge_state", lambda db, name, data: saved.append(name))
+    watermark = load_watermark(BrokenDB())
+    checkpoint = sync_state.load_checkpoint(BrokenDB())
+    rejected = load_rejected_jobs(BrokenDB())
+    assert not (watermark.loaded or checkpoint.loaded or rejected.loaded)
+    rejected.add({"idx": "1", "mod_date": "a"}, "20250910", "수집 제외")
+    save_watermark(BrokenDB(), watermark)
+    sync_state.save_checkpoint(BrokenDB(), checkpoint)
+    save_rejected_jobs(BrokenDB(), rejected)
+    assert saved == []